@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+from sqlalchemy import select
+
+# Category label for products listed without one
+UNCATEGORIZED = 'Uncategorized'
+
+
+def load_columns(connection, table):
+    """Read category, price, basePrice and available for every product in one query.
+
+    Returns the four columns as NumPy arrays; missing prices become NaN.
+    """
+    rows = connection.execute(select(table.c.category, table.c.price, table.c.basePrice,
+                                     table.c.available)).all()
+    return to_arrays(rows)
+
+
+def to_arrays(rows):
+    """Columns of (category, price, basePrice, available) rows as NumPy arrays"""
+    if not rows:
+        return (np.array([], dtype=object), np.array([], dtype=float),
+                np.array([], dtype=float), np.array([], dtype=bool))
+    categories, prices, base_prices, available = zip(*rows)
+    return (np.array([c or UNCATEGORIZED for c in categories], dtype=object),
+            np.array(prices, dtype=float), np.array(base_prices, dtype=float),
+            np.array([bool(a) for a in available], dtype=bool))
+
+
+def _price_summary(sorted_prices):
+    if not len(sorted_prices):
+        return {'min': None, 'median': None, 'p90': None, 'max': None}
+    median, p90 = np.percentile(sorted_prices, [50, 90])
+    return {'min': float(sorted_prices[0]), 'median': float(median), 'p90': float(p90),
+            'max': float(sorted_prices[-1])}
+
+
+def price_stats(categories, prices, base_prices, available):
+    """Per-category price, discount and availability statistics.
+
+    Products are grouped with one sort on (category, price), so each
+    category's prices come out as an already sorted slice; counts and
+    discount sums per category are single bincount passes.
+    """
+    names, group = np.unique(categories, return_inverse=True)
+    n = len(names)
+    products = np.bincount(group, minlength=n)
+    in_stock = np.bincount(group, weights=available, minlength=n).astype(int)
+
+    priced = ~np.isnan(prices)
+    order = np.lexsort((prices, group))
+    order = order[priced[order]]
+    bounds = np.searchsorted(group[order], np.arange(n + 1))
+    sorted_prices = prices[order]
+
+    # discount of the selling price against the base price, for products that have both
+    has_base = priced & (base_prices > 0)
+    discount = np.zeros_like(prices)
+    discount[has_base] = (base_prices[has_base] - prices[has_base]) / base_prices[has_base] * 100
+    with_base = np.bincount(group, weights=has_base, minlength=n)
+    discount_sum = np.bincount(group, weights=discount, minlength=n)
+    discounted = np.bincount(group, weights=has_base & (discount > 0), minlength=n).astype(int)
+
+    stats = {}
+    for i, name in enumerate(names):
+        stats[name] = {
+            'products': int(products[i]),
+            'available': int(in_stock[i]),
+            'unavailable': int(products[i] - in_stock[i]),
+            'price': _price_summary(sorted_prices[bounds[i]:bounds[i + 1]]),
+            'discount': {
+                'mean_pct': round(float(discount_sum[i] / with_base[i]), 2) if with_base[i] else None,
+                'discounted': int(discounted[i]),
+            },
+        }
+    all_prices = np.sort(prices[priced])
+    overall = {
+        'products': int(len(prices)),
+        'available': int(available.sum()),
+        'unavailable': int(len(prices) - available.sum()),
+        'price': _price_summary(all_prices),
+        'discount': {
+            'mean_pct': round(float(discount[has_base].mean()), 2) if has_base.any() else None,
+            'discounted': int((has_base & (discount > 0)).sum()),
+        },
+    }
+    return {'categories': stats, 'overall': overall}
+
+
+def cached_stats_json(cache, version, load):
+    """price_stats() as a JSON string, computed once per catalog version.
+
+    Stored in the fragment cache next to the rendered product grid, so any
+    product write that bumps the catalog version recomputes it.
+    """
+    body = cache.get('price-stats', version)
+    if body is None:
+        body = json.dumps(dict(price_stats(*load()), version=version), separators=(',', ':'))
+        cache.put('price-stats', version, body, len(body))
+    return body
@@ -9,7 +9,9 @@ app.secret_key = os.environ.get('SECRET_KEY', 'farm-management-secret-2024')
 
 # Simple in-memory storage for demo (resets on each deployment)
 users_db = {}
+users_by_email = {}  # email -> user_id, so login/signup never scan users_db
 products_db = {}
+product_ids_by_seller = {}  # seller email -> pids, for myproducts
 farmers_db = {}
 farming_types = ["Organic Farming", "Vegetable Farming", "Fruit Farming", "Grain Farming", "Dairy Farming"]
 
@@ -52,10 +54,9 @@ def signup():
         password = request.form.get('password')
         
         # Check if email already exists
-        for user in users_db.values():
-            if user['email'] == email:
-                flash('Email already exists', 'warning')
-                return render_template('signup.html')
+        if email in users_by_email:
+            flash('Email already exists', 'warning')
+            return render_template('signup.html')
         
         # Create new user
         user_id = get_next_id(users_db)
@@ -65,6 +66,7 @@ def signup():
             'email': email,
             'password': password
         }
+        users_by_email[email] = user_id
         
         flash('Signup successful! Please login.', 'success')
         return redirect(url_for('login'))
@@ -78,13 +80,14 @@ def login():
         password = request.form.get('password')
         
         # Find user
-        for user_id, user in users_db.items():
-            if user['email'] == email and user['password'] == password:
-                session['user_id'] = user_id
-                session['username'] = user['username']
-                session['email'] = user['email']
-                flash('Login successful!', 'success')
-                return redirect(url_for('index'))
+        user_id = users_by_email.get(email)
+        user = users_db.get(user_id)
+        if user and user['password'] == password:
+            session['user_id'] = user_id
+            session['username'] = user['username']
+            session['email'] = user['email']
+            flash('Login successful!', 'success')
+            return redirect(url_for('index'))
         
         flash('Invalid credentials', 'warning')
     
@@ -119,6 +122,7 @@ def addagroproduct():
             'available': request.form.get('available') == 'on',
             'created_at': datetime.now().isoformat()
         }
+        product_ids_by_seller.setdefault(current_user['email'], []).append(product_id)
         
         flash('Product added successfully!', 'success')
         return redirect(url_for('agroproducts'))
@@ -134,11 +138,10 @@ def myproducts():
     current_user = get_current_user()
     user_products = []
     
-    for pid, product in products_db.items():
-        if product['email'] == current_user['email']:
-            product_copy = product.copy()
-            product_copy['pid'] = pid
-            user_products.append(product_copy)
+    for pid in product_ids_by_seller.get(current_user['email'], []):
+        product_copy = products_db[pid].copy()
+        product_copy['pid'] = pid
+        user_products.append(product_copy)
     
     return render_template('myproducts.html', products=user_products)
 
@@ -273,6 +276,26 @@ def edit(rid):
 def inject_user():
     return dict(current_user=get_current_user())
 
+# triggers.html formats epoch seconds; the mock rows above already hold display strings
+@app.template_filter('epoch')
+def epoch(value):
+    return value
+
+# base.html links assets through static_url(); this app serves the plain static files
+@app.template_global()
+def static_url(path):
+    return url_for('static', filename=path)
+
+# product_grid.html asks for resized copies of local images; this app always serves the original
+@app.template_global()
+def image_srcset(url):
+    return None
+
+# agroproducts.html subscribes to live updates at events_url(); this app publishes none
+@app.template_global()
+def events_url():
+    return None
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
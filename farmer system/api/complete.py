@@ -1,6 +1,32 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session, jsonify
 import os
+import sys
+from bisect import bisect_left, insort
 from datetime import datetime
+from functools import wraps
+from itertools import groupby
+import click
+import threading
+import time
+
+# Shared helpers live next to the templates in the project root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from catalog import decode_cursor, keyset_slice, page_size, product_filters, product_json, product_matches
+from records import Farmer, IdAllocator, Product, Trig, User, to_int
+from storage import open_backend
+from passwords import DEFAULT_METHOD, PasswordHasher
+from fragment_cache import FragmentCache, request_key
+from conditional import TableVersions, conditional_get
+from audit import (LOG_PAGE_SIZE, RETENTION_DAYS, AuditLog, append_archive, archive_path,
+                   format_epoch, log_cursor, month_of, now, parse_log_cursor, parse_time)
+from auction import AuctionEngine, AuctionScheduler, OrderBook, bid_status, init_app as init_auction_scheduler, product_rules
+from analytics import cached_stats_json, to_arrays
+from quantity import parse_quantity
+from events import Broadcaster, init_app as init_events
+from assets import init_app as init_assets
+from images import init_app as init_images
+from jinja_cache import init_app as init_jinja_cache
+from markupsafe import Markup
 
 # Create Flask app with proper paths for Vercel
 app = Flask(__name__, 
@@ -8,11 +34,38 @@ app = Flask(__name__,
            static_folder='../static')
 
 app.secret_key = os.environ.get('SECRET_KEY', 'farm-management-complete-2024')
+app.config['PRODUCTS_PER_PAGE'] = int(os.environ.get('PRODUCTS_PER_PAGE', 24))
+# Password KDF and its cost (see passwords.py), and how many hashes may run at once
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+hasher = PasswordHasher(app.config['PASSWORD_HASH_METHOD'], app.config['PASSWORD_HASH_WORKERS'])
+# Audit events older than this are rolled into monthly files by `flask archive-triggers`
+app.config['TRIG_RETENTION_DAYS'] = int(os.environ.get('TRIG_RETENTION_DAYS', RETENTION_DAYS))
+app.add_template_filter(format_epoch, 'epoch')
+# static_url() links fingerprinted, pre-compressed assets once `python assets.py` has built them
+assets_manifest = init_assets(app)
+# Templates precompiled by jinja_cache.py (modules shipped with the code, bytecode per machine); 'off' disables either
+app.config['JINJA_MODULES_DIR'] = os.environ.get('JINJA_MODULES_DIR')
+app.config['JINJA_CACHE_DIR'] = os.environ.get('JINJA_CACHE_DIR')
+template_cache = init_jinja_cache(app)
 
-# Simple in-memory storage
+# Simple in-memory storage: id -> Record, with one id allocator per table
 users_db = {}
+users_by_email = {}  # email -> user_id, so login/signup never scan users_db
 products_db = {}
+product_ids_by_seller = {}  # seller email -> pids, for myproducts
+product_ids = []  # sorted pids, for keyset pagination of the catalog
+category_ids = {}  # category -> sorted pids, so category pages skip other products
 farmers_db = {}
+trig_db = {}  # audit events, id -> Trig
+trig_keys = []  # (timestamp, id) of every event in order, for time-range pages
+trig_lock = threading.Lock()  # the audit thread, /triggers and archive-triggers all use trig_db / trig_keys
+user_id_allocator = IdAllocator()
+product_id_allocator = IdAllocator()
+farmer_id_allocator = IdAllocator()
+trig_id_allocator = IdAllocator()
+bid_id_allocator = IdAllocator()
+top_bids = {}  # pid -> (amount, bidder, bids) from storage, to rebuild order books after a restart
 farming_types = [
     {"fid": 1, "farmingtype": "Organic Farming"},
     {"fid": 2, "farmingtype": "Vegetable Farming"},
@@ -21,10 +74,137 @@ farming_types = [
     {"fid": 5, "farmingtype": "Dairy Farming"}
 ]
 
-# Helper functions
-def get_next_id(db_dict):
-    return max(db_dict.keys()) + 1 if db_dict else 1
+# Change sequence number per table; list pages answer conditional GETs from these
+table_versions = TableVersions('products', 'farmers', 'trig')
+# Rendered product cards, reused until a product write bumps catalog_version
+catalog_version = table_versions['products']
+grid_cache = FragmentCache(max_bytes=int(os.environ.get('GRID_CACHE_BYTES', 8 * 1024 * 1024)))
+# Product added / availability / bid price events pushed to /events subscribers of this instance,
+# which holds its own copy of the data too (see events.py)
+broadcaster = Broadcaster()
+event_server = init_events(app, broadcaster)
+# Resized WebP/JPEG copies of local images, rendered by worker processes; cards pick them up on the next render.
+# Every page's background has a srcset too, so pages outside the catalog take catalog_version as a counter
+images = init_images(app, on_ready=catalog_version.bump)
+
+# Every write goes through to this backend (see storage.py); memory keeps nothing
+storage = open_backend(os.environ.get('FARM_STORAGE', 'memory'))
+# The log backend is rewritten at startup once more than this share of it is overwritten or deleted records
+COMPACT_RATIO = float(os.environ.get('FARM_STORAGE_COMPACT', '0.5'))
+
+# Store helpers: put a record in its table and keep the lookup indexes current
+def add_user(user):
+    users_db[user.id] = user
+    users_by_email[user.email] = user.id
+
+def add_product(product):
+    products_db[product.pid] = product
+    product_ids.append(product.pid)
+    category_ids.setdefault(product.category, []).append(product.pid)
+    product_ids_by_seller.setdefault(product.email, []).append(product.pid)
+
+def add_farmer(farmer):
+    farmers_db[farmer.rid] = farmer
+
+def write_audit(batch):
+    """Store a batch of audit events from the AuditLog thread"""
+    for fields in batch:
+        trig_id = trig_id_allocator.next_id()
+        trig = Trig(id=trig_id, **fields)
+        with trig_lock:
+            trig_db[trig_id] = trig
+            # events are queued by request threads, so a batch is not always in timestamp order
+            insort(trig_keys, (trig.timestamp, trig_id))
+        storage.save('trig', trig_id, trig.to_dict())
+
+# Audit trail behind /triggers, written behind the request by a background thread
+audit_log = AuditLog(write_audit, on_flush=table_versions['trig'].bump)
+
+def write_bids(batch):
+    """Store accepted bids, before the bidder is told"""
+    for fields in batch:
+        bid_id = bid_id_allocator.next_id()
+        storage.save('bids', bid_id, dict(fields, id=bid_id))
+
+def load_book(pid):
+    product = products_db.get(pid)
+    if product is None:
+        return None
+    amount, bidder, bids = top_bids.get(pid, (None, None, 0))
+    return OrderBook(pid, *product_rules(product), highest=amount, bidder=bidder, bids=bids)
+
+# Live auction order books, one per product; accepted bids are stored before the reply
+auctions = AuctionEngine(load_book, write_bids)
+
+def close_expired(pids):
+    """Settle expired auctions: stop bidding, mark the products closed and unavailable"""
+    closed = {}
+    now = time.time()
+    for pid in pids:
+        product = products_db.get(pid)
+        if product is None or product.auctionClosed:
+            continue
+        ends = parse_time(product.auctionEndTime)
+        if ends is None or ends > now:
+            continue
+        closed[pid] = product.auctionWinner, product.auctionPrice = auctions.close(pid)
+        product.available = False
+        product.auctionClosed = True
+        storage.save('products', pid, product.to_dict())
+        audit_log.record(pid, 'PRODUCT UPDATED')
+        broadcaster.publish('availability', pid=pid, available=False)
+    if closed:
+        catalog_version.bump()
+    return closed
 
+def open_auctions():
+    for product in products_db.values():
+        ends = parse_time(product.auctionEndTime)
+        if ends is not None and not product.auctionClosed:
+            yield ends, product.pid
+
+# Closes auctions as they end; the heap is rebuilt from the warm-loaded products by the first request
+auction_scheduler = AuctionScheduler(close_expired, open_auctions)
+init_auction_scheduler(app, auction_scheduler)
+
+def load_storage():
+    """Warm-load the in-memory tables from the storage backend at startup"""
+    known_farming = {ft['fid'] for ft in farming_types}
+    backfilled = []
+    for kind, fields in storage.load_all():
+        if kind == 'users':
+            add_user(User(**fields))
+            user_id_allocator.advance_to(fields['id'])
+        elif kind == 'products':
+            if 'quantityUnit' not in fields:
+                # stored before quantities were parsed; the typed fields are written back once below
+                fields['quantityAmount'], fields['quantityUnit'] = parse_quantity(fields.get('quantity'))
+                backfilled.append(fields)
+            add_product(Product(**fields))
+            product_id_allocator.advance_to(fields['pid'])
+        elif kind == 'farmers':
+            add_farmer(Farmer(**fields))
+            farmer_id_allocator.advance_to(fields['rid'])
+        elif kind == 'bids':
+            amount, bidder, bids = top_bids.get(fields['pid'], (None, None, 0))
+            if amount is None or fields['amount'] > amount:
+                amount, bidder = fields['amount'], fields['bidder']
+            top_bids[fields['pid']] = (amount, bidder, bids + 1)
+            bid_id_allocator.advance_to(fields['id'])
+        elif kind == 'trig':
+            trig_db[fields['id']] = Trig(**fields)
+            trig_keys.append((fields['timestamp'], fields['id']))
+            trig_id_allocator.advance_to(fields['id'])
+        elif kind == 'farming' and fields['fid'] not in known_farming:
+            farming_types.append(fields)
+    for fields in backfilled:
+        storage.save('products', fields['pid'], fields)
+    trig_keys.sort()
+    storage.maybe_compact(COMPACT_RATIO)
+
+load_storage()
+
+# Helper functions
 def is_logged_in():
     return 'user_id' in session
 
@@ -33,13 +213,23 @@ def get_current_user():
         return users_db.get(session['user_id'])
     return None
 
+def login_required(view):
+    # goes above conditional_get, so an anonymous client is redirected rather than sent a 304
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_logged_in():
+            flash('Please login first', 'warning')
+            return redirect(url_for('login'))
+        return view(*args, **kwargs)
+    return wrapper
+
 # Create a mock current_user object for templates
 class MockUser:
     def __init__(self, user_data=None):
         if user_data:
-            self.id = user_data['id']
-            self.username = user_data['username']
-            self.email = user_data['email']
+            self.id = user_data.id
+            self.username = user_data.username
+            self.email = user_data.email
             self.is_authenticated = True
         else:
             self.is_authenticated = False
@@ -63,14 +253,31 @@ def test():
     return 'Database Connected Successfully! Complete Flask app with templates working.'
 
 @app.route('/agroproducts')
+@conditional_get(table_versions, 'products')
 def agroproducts():
-    # Convert products_db to list format expected by template
-    query = []
-    for pid, product in products_db.items():
-        product_copy = product.copy()
-        product_copy['pid'] = pid
-        query.append(product_copy)
-    return render_template('agroproducts.html', query=query)
+    filters = product_filters(request.args)
+    as_json = request.args.get('format') == 'json'
+    key = request_key(request)
+    version = catalog_version.value
+    cached = None if as_json else grid_cache.get(key, version)
+    if cached:
+        grid_html, product_count, next_cursor = cached
+        return render_template('agroproducts.html', grid_html=grid_html, product_count=product_count, next_cursor=next_cursor, filters=filters)
+    limit = page_size(request.args, app.config)
+    after = decode_cursor(request.args.get('cursor'))
+    ids = category_ids.get(filters['category'], []) if filters['category'] else product_ids
+    keep = None
+    if any(filters[name] is not None for name in ('available', 'min_price', 'max_price', 'unit')):
+        keep = lambda pid: product_matches(products_db[pid], filters)
+    page_ids, next_cursor = keyset_slice(ids, after, limit, keep)
+
+    # Records already carry their pid, so the template reads them in place
+    query = [products_db[pid] for pid in page_ids]
+    if as_json:
+        return jsonify(products=[product_json(p) for p in query], next_cursor=next_cursor)
+    grid_html = Markup(render_template('product_grid.html', query=query))
+    grid_cache.put(key, version, (grid_html, len(query), next_cursor), len(grid_html))
+    return render_template('agroproducts.html', grid_html=grid_html, product_count=len(query), next_cursor=next_cursor, filters=filters)
 
 @app.route('/signup', methods=['GET', 'POST'])
 def signup():
@@ -80,19 +287,20 @@ def signup():
         password = request.form.get('password')
         
         # Check if email already exists
-        for user in users_db.values():
-            if user['email'] == email:
-                flash('Email already exists', 'warning')
-                return render_template('signup.html')
+        if email in users_by_email:
+            flash('Email already exists', 'warning')
+            return render_template('signup.html')
         
         # Create new user
-        user_id = get_next_id(users_db)
-        users_db[user_id] = {
-            'id': user_id,
-            'username': username,
-            'email': email,
-            'password': password
-        }
+        user_id = user_id_allocator.next_id()
+        user = User(
+            id=user_id,
+            username=username,
+            email=email,
+            password=hasher.hash(password)
+        )
+        add_user(user)
+        storage.save('users', user_id, user.to_dict())
         
         flash('Signup successful! Please login.', 'success')
         return redirect(url_for('login'))
@@ -106,13 +314,19 @@ def login():
         password = request.form.get('password')
         
         # Find user
-        for user_id, user in users_db.items():
-            if user['email'] == email and user['password'] == password:
-                session['user_id'] = user_id
-                session['username'] = user['username']
-                session['email'] = user['email']
-                flash('Login successful!', 'success')
-                return redirect(url_for('index'))
+        user_id = users_by_email.get(email)
+        user = users_db.get(user_id)
+        ok, new_hash = hasher.verify(user.password if user else None, password)
+        if ok:
+            if new_hash:
+                # Plaintext or an older cost: store the password under the current method
+                user.password = new_hash
+                storage.save('users', user_id, user.to_dict())
+            session['user_id'] = user_id
+            session['username'] = user.username
+            session['email'] = user.email
+            flash('Login successful!', 'success')
+            return redirect(url_for('index'))
         
         flash('Invalid credentials', 'warning')
     
@@ -132,21 +346,34 @@ def addagroproduct():
     
     if request.method == 'POST':
         current_user = get_current_user()
+        quantity = request.form.get('quantity')
+        quantity_amount, quantity_unit = parse_quantity(quantity)
         
-        product_id = get_next_id(products_db)
-        products_db[product_id] = {
-            'username': current_user['username'],
-            'email': current_user['email'],
-            'productname': request.form.get('productname'),
-            'productdesc': request.form.get('productdesc'),
-            'price': request.form.get('price'),
-            'category': request.form.get('category'),
-            'quantity': request.form.get('quantity'),
-            'basePrice': request.form.get('basePrice'),
-            'image': request.form.get('image'),
-            'available': request.form.get('available') == 'on',
-            'created_at': datetime.now().isoformat()
-        }
+        product_id = product_id_allocator.next_id()
+        product = Product(
+            pid=product_id,
+            username=current_user.username,
+            email=current_user.email,
+            productname=request.form.get('productname'),
+            productdesc=request.form.get('productdesc'),
+            price=to_int(request.form.get('price')),
+            category=request.form.get('category'),
+            quantity=quantity,
+            quantityAmount=quantity_amount,
+            quantityUnit=quantity_unit,
+            basePrice=to_int(request.form.get('basePrice')),
+            auctionStartTime=request.form.get('auctionStartTime') or None,
+            auctionEndTime=request.form.get('auctionEndTime') or None,
+            image=images.save_upload(request.files.get('image_file')) or request.form.get('image'),
+            available=request.form.get('available') == 'on',
+            created_at=datetime.now().isoformat()
+        )
+        add_product(product)
+        storage.save('products', product_id, product.to_dict())
+        audit_log.record(product_id, 'PRODUCT INSERTED')
+        catalog_version.bump()
+        auction_scheduler.schedule(product_id, parse_time(product.auctionEndTime))
+        broadcaster.publish('product', pid=product_id, productname=product.productname, price=product.price, available=product.available)
         
         flash('Product added successfully!', 'success')
         return redirect(url_for('agroproducts'))
@@ -154,19 +381,11 @@ def addagroproduct():
     return render_template('addagroproducts.html')
 
 @app.route('/myproducts')
+@login_required
+@conditional_get(table_versions, 'products')
 def myproducts():
-    if not is_logged_in():
-        flash('Please login first', 'warning')
-        return redirect(url_for('login'))
-    
     current_user = get_current_user()
-    user_products = []
-    
-    for pid, product in products_db.items():
-        if product['email'] == current_user['email']:
-            product_copy = product.copy()
-            product_copy['pid'] = pid
-            user_products.append(product_copy)
+    user_products = [products_db[pid] for pid in product_ids_by_seller.get(current_user.email, [])]
     
     return render_template('myproducts.html', products=user_products)
 
@@ -179,15 +398,54 @@ def toggle_availability(pid):
     current_user = get_current_user()
     product = products_db.get(pid)
     
-    if product and product['email'] == current_user['email']:
-        product['available'] = not product['available']
-        status = "available" if product['available'] else "unavailable"
+    if product and product.email == current_user.email:
+        product.available = not product.available
+        storage.save('products', pid, product.to_dict())
+        audit_log.record(pid, 'PRODUCT UPDATED')
+        catalog_version.bump()
+        auctions.refresh(pid, product)
+        broadcaster.publish('availability', pid=pid, available=product.available)
+        status = "available" if product.available else "unavailable"
         flash(f'Product marked as {status}', 'success')
     else:
         flash('Product not found or access denied', 'error')
     
     return redirect(url_for('myproducts'))
 
+@app.route('/bid/<int:pid>', methods=['POST'])
+def bid(pid):
+    if not is_logged_in():
+        flash('Please login first', 'warning')
+        return redirect(url_for('login'))
+    
+    amount = to_int(request.form.get('amount'))
+    if request.is_json:
+        amount = (request.get_json(silent=True) or {}).get('amount')
+    result = auctions.bid(pid, get_current_user().email, amount if isinstance(amount, int) else None)
+    if result.accepted:
+        broadcaster.publish('price', pid=pid, price=result.highest, bids=result.bids)
+    if request.is_json or request.args.get('format') == 'json':
+        return jsonify(result._asdict()), bid_status(result)
+    if result.accepted:
+        flash(f'Bid of ₹{result.highest} placed', 'success')
+    else:
+        flash(f'Bid not accepted: {result.reason}', 'warning')
+    return redirect(request.referrer or url_for('agroproducts'))
+
+@app.route('/bids/<int:pid>')
+def bids(pid):
+    book = auctions.book(pid)
+    if book is None:
+        return jsonify(error='product not found'), 404
+    return jsonify(book.to_dict())
+
+@app.route('/analytics/prices')
+@conditional_get(table_versions, 'products', per_user=False)
+def price_analytics():
+    def load():
+        return to_arrays([(p.category, p.price, p.basePrice, p.available) for p in products_db.values()])
+    return Response(cached_stats_json(grid_cache, catalog_version.value, load), mimetype='application/json')
+
 @app.route('/register', methods=['GET', 'POST'])
 def register():
     if not is_logged_in():
@@ -195,28 +453,30 @@ def register():
         return redirect(url_for('login'))
     
     if request.method == 'POST':
-        farmer_id = get_next_id(farmers_db)
-        farmers_db[farmer_id] = {
-            'rid': farmer_id,
-            'farmername': request.form.get('farmername'),
-            'adharnumber': request.form.get('adharnumber'),
-            'age': request.form.get('age'),
-            'gender': request.form.get('gender'),
-            'phonenumber': request.form.get('phonenumber'),
-            'address': request.form.get('address'),
-            'farming': request.form.get('farmingtype')
-        }
+        farmer_id = farmer_id_allocator.next_id()
+        farmer = Farmer(
+            rid=farmer_id,
+            farmername=request.form.get('farmername'),
+            adharnumber=request.form.get('adharnumber'),
+            age=to_int(request.form.get('age')),
+            gender=request.form.get('gender'),
+            phonenumber=request.form.get('phonenumber'),
+            address=request.form.get('address'),
+            farming=request.form.get('farmingtype')
+        )
+        add_farmer(farmer)
+        storage.save('farmers', farmer_id, farmer.to_dict())
+        audit_log.record(farmer_id, 'FARMER INSERTED')
+        table_versions['farmers'].bump()
         flash('Farmer registered successfully!', 'success')
         return redirect(url_for('farmerdetails'))
     
     return render_template('farmer.html', farming=farming_types)
 
 @app.route('/farmerdetails')
+@login_required
+@conditional_get(table_versions, 'farmers', counters=(catalog_version,))
 def farmerdetails():
-    if not is_logged_in():
-        flash('Please login first', 'warning')
-        return redirect(url_for('login'))
-    
     query = list(farmers_db.values())
     return render_template('farmerdetails.html', query=query)
 
@@ -233,6 +493,7 @@ def addfarming():
         if not exists:
             new_id = max(ft['fid'] for ft in farming_types) + 1
             farming_types.append({'fid': new_id, 'farmingtype': farmingtype})
+            storage.save('farming', new_id, farming_types[-1])
             flash('Farming type added successfully!', 'success')
         else:
             flash('Farming type already exists', 'warning')
@@ -240,17 +501,49 @@ def addfarming():
     return render_template('farming.html')
 
 @app.route('/triggers')
+@login_required
+@conditional_get(table_versions, 'trig', counters=(catalog_version,))
 def triggers():
-    if not is_logged_in():
-        flash('Please login first', 'warning')
-        return redirect(url_for('login'))
-    
-    # Mock triggers data
-    query = [
-        {'id': 1, 'fid': 'F001', 'action': 'Product Added', 'timestamp': datetime.now().isoformat()},
-        {'id': 2, 'fid': 'F002', 'action': 'Farmer Registered', 'timestamp': datetime.now().isoformat()}
-    ]
-    return render_template('triggers.html', query=query)
+    # Bisect the time range and the cursor in trig_keys, then walk back one page
+    start = parse_time(request.args.get('from'))
+    end = parse_time(request.args.get('to'), end=True)
+    before = parse_log_cursor(request.args.get('cursor'))
+    with trig_lock:
+        lo = bisect_left(trig_keys, (start,)) if start is not None else 0
+        hi = bisect_left(trig_keys, (end,)) if end is not None else len(trig_keys)
+        if before is not None:
+            hi = min(hi, bisect_left(trig_keys, before))
+        first = max(lo, hi - LOG_PAGE_SIZE)
+        query = [trig_db[trig_id] for _, trig_id in reversed(trig_keys[first:hi])]
+    next_cursor = log_cursor(query[-1]) if first > lo else None
+    return render_template('triggers.html', query=query, next_cursor=next_cursor)
+
+def archive_trig(before, directory):
+    """Move audit events older than `before` into monthly NDJSON files; returns {month: events}"""
+    moved = {}
+    with trig_lock:
+        old = trig_keys[:bisect_left(trig_keys, (before,))]
+        for month, keys in groupby(old, key=lambda key: month_of(key[0])):
+            rows = [trig_db.pop(trig_id).to_dict() for _, trig_id in keys]
+            append_archive(archive_path(directory, 'trig', month), rows)
+            for row in rows:
+                storage.delete('trig', row['id'])
+            moved[month] = len(rows)
+        del trig_keys[:len(old)]
+    return moved
+
+@app.cli.command('archive-triggers')
+@click.option('--days', type=int, help='keep this many days of events (default: TRIG_RETENTION_DAYS)')
+@click.option('--to-dir', default='trig-archive', show_default=True, type=click.Path(file_okay=False))
+def archive_triggers_command(days, to_dir):
+    """Roll old audit events into monthly NDJSON files"""
+    days = app.config['TRIG_RETENTION_DAYS'] if days is None else days
+    os.makedirs(to_dir, exist_ok=True)
+    moved = archive_trig(now() - days * 86400, to_dir)
+    for month, rows in sorted(moved.items()):
+        click.echo(f'{month}: archived {rows} events')
+    if moved:
+        table_versions['trig'].bump()
 
 @app.route('/delete/<string:rid>')
 def delete(rid):
@@ -261,6 +554,9 @@ def delete(rid):
     rid = int(rid)
     if rid in farmers_db:
         del farmers_db[rid]
+        storage.delete('farmers', rid)
+        audit_log.record(rid, 'FARMER DELETED')
+        table_versions['farmers'].bump()
         flash('Farmer record deleted successfully', 'success')
     else:
         flash('Farmer record not found', 'error')
@@ -284,12 +580,15 @@ def edit(rid):
         farmer.update({
             'farmername': request.form.get('farmername'),
             'adharnumber': request.form.get('adharnumber'),
-            'age': request.form.get('age'),
+            'age': to_int(request.form.get('age')),
             'gender': request.form.get('gender'),
             'phonenumber': request.form.get('phonenumber'),
             'address': request.form.get('address'),
             'farming': request.form.get('farmingtype')
         })
+        storage.save('farmers', rid, farmer.to_dict())
+        audit_log.record(rid, 'FARMER UPDATED')
+        table_versions['farmers'].bump()
         flash('Farmer record updated successfully', 'success')
         return redirect(url_for('farmerdetails'))
     
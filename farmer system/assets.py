@@ -0,0 +1,190 @@
+"""Fingerprinted, pre-compressed static assets.
+
+`python assets.py` copies every file under static/ into static/build/ with
+a content hash in its name (style.css -> style.3f2a9c1e04b7.css), writes
+.gz and, when the brotli package is installed, .br siblings for text
+formats, and records original -> fingerprinted names in
+static/build/manifest.json.
+
+Templates link assets through static_url('assets/css/style.css'); once a
+build exists the link points at the fingerprinted copy, which is served
+with a far-future immutable Cache-Control and the best pre-compressed
+variant the browser accepts, so nothing is compressed per request.
+Without a build, static_url() falls back to the plain static file.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+
+from flask import abort, request, send_file, url_for
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # optional: without it only .gz siblings are written
+    brotli = None
+
+BUILD_DIR = 'build'
+MANIFEST = 'manifest.json'
+# Not fingerprinted: image derivatives are content-addressed already and uploads are user data
+SKIP_DIRS = {'derived', 'uploads'}
+# Text formats worth compressing; images and woff fonts are compressed already
+COMPRESSIBLE = {'.css', '.js', '.map', '.svg', '.json', '.txt', '.html', '.xml', '.ttf', '.eot', '.otf', '.ico'}
+MIN_COMPRESS_SIZE = 512
+# Fingerprinted names change with their content, so browsers may keep them for a year
+IMMUTABLE = 'public, max-age=31536000, immutable'
+# Tried in order against Accept-Encoding
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+CSS_URL_RE = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+SOURCE_MAP_RE = re.compile(r'(sourceMappingURL=)(\S+?)(\s*\*/|\s*$)', re.MULTILINE)
+
+
+def fingerprint(path, data):
+    """assets/css/style.css -> assets/css/style.<first 12 hex of sha256>.css"""
+    stem, ext = posixpath.splitext(path)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+
+
+def _rewrite(path, ref, manifest):
+    """Point a relative reference inside `path` at its fingerprinted target"""
+    if ref.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+        return ref
+    target, suffix = re.match(r'([^?#]*)(.*)', ref).groups()
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(path), target))
+    hashed = manifest.get(resolved)
+    if hashed is None:
+        return ref
+    return posixpath.relpath(hashed, posixpath.dirname(path)) + suffix
+
+
+def rewrite_references(path, data, manifest):
+    """Rewrite url(...) in CSS and sourceMappingURL comments in CSS/JS to fingerprinted names"""
+    text = data.decode('utf-8', 'surrogateescape')
+    if path.endswith('.css'):
+        text = CSS_URL_RE.sub(lambda m: f'url({m.group(1)}{_rewrite(path, m.group(2), manifest)}{m.group(1)})', text)
+    text = SOURCE_MAP_RE.sub(lambda m: m.group(1) + _rewrite(path, m.group(2), manifest) + m.group(3), text)
+    return text.encode('utf-8', 'surrogateescape')
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def compressed_variants(data):
+    """(suffix, bytes) of every pre-compressed sibling worth keeping for `data`"""
+    variants = []
+    if len(data) < MIN_COMPRESS_SIZE:
+        return variants
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    variants.append(('.gz', gzip.compress(data, 9, mtime=0)))
+    return [(suffix, body) for suffix, body in variants if len(body) < len(data)]
+
+
+def source_files(static_dir, build_dir):
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != build_dir
+                         and not (root == static_dir and d in SKIP_DIRS))
+        for name in sorted(files):
+            yield posixpath.join(*os.path.relpath(os.path.join(root, name), static_dir).split(os.sep))
+
+
+def build(static_dir, build_dir=None):
+    """Fingerprint and pre-compress every file under static_dir; returns the manifest.
+
+    Files referenced by others go first (source maps, then scripts, then
+    stylesheets), so their hashed names are known when the references are
+    rewritten. Outputs are content-addressed: an unchanged file is not
+    written again, and older fingerprints stay in place for pages that
+    still link to them.
+    """
+    build_dir = build_dir or os.path.join(static_dir, BUILD_DIR)
+    order = {'.js': 1, '.css': 2}
+    paths = sorted(source_files(static_dir, build_dir), key=lambda p: order.get(posixpath.splitext(p)[1], 0))
+    manifest = {}
+    for path in paths:
+        with open(os.path.join(static_dir, path), 'rb') as f:
+            data = f.read()
+        if path.endswith(('.css', '.js')):
+            data = rewrite_references(path, data, manifest)
+        hashed = fingerprint(path, data)
+        manifest[path] = hashed
+        target = os.path.join(build_dir, hashed)
+        if os.path.exists(target):
+            continue
+        if posixpath.splitext(path)[1].lower() in COMPRESSIBLE:
+            for suffix, body in compressed_variants(data):
+                _write(target + suffix, body)
+        _write(target, data)
+    _write(os.path.join(build_dir, MANIFEST), json.dumps(manifest, indent=0, sort_keys=True).encode())
+    return manifest
+
+
+def load_manifest(build_dir):
+    try:
+        with open(os.path.join(build_dir, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def init_app(app):
+    """Register static_url() for templates and the route serving the build.
+
+    Which pre-compressed siblings exist is read once here, so a request
+    costs one Accept-Encoding check and one send_file().
+    """
+    build_dir = os.path.join(app.static_folder, BUILD_DIR)
+    manifest = load_manifest(build_dir)
+    encodings = {hashed: [(name, suffix) for name, suffix in ENCODINGS
+                          if os.path.exists(os.path.join(build_dir, hashed + suffix))]
+                 for hashed in manifest.values()}
+
+    def static_url(path):
+        hashed = manifest.get(path)
+        if hashed is None:
+            return url_for('static', filename=path)
+        return url_for('static_build', filename=hashed)
+
+    def static_build(filename):
+        if filename not in encodings:
+            abort(404)
+        path = safe_join(build_dir, filename)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        for name, suffix in encodings[filename]:
+            if request.accept_encodings[name]:
+                response = send_file(path + suffix, mimetype=mimetype, conditional=True)
+                response.headers['Content-Encoding'] = name
+                break
+        else:
+            response = send_file(path, mimetype=mimetype, conditional=True)
+        response.headers['Cache-Control'] = IMMUTABLE
+        response.vary.add('Accept-Encoding')
+        return response
+
+    app.add_template_global(static_url)
+    app.add_url_rule(f'{app.static_url_path}/{BUILD_DIR}/<path:filename>', 'static_build', static_build)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fingerprint and pre-compress static assets')
+    parser.add_argument('static_dir', nargs='?', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
+    args = parser.parse_args()
+    manifest = build(args.static_dir)
+    print(f"built {len(manifest)} assets into {os.path.join(args.static_dir, BUILD_DIR)}"
+          f"{'' if brotli else ' (gzip only: install brotli for .br)'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,388 @@
+import hashlib
+import heapq
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+from sqlalchemy import Boolean, inspect
+
+try:
+    import fcntl
+except ImportError:  # Windows: every process runs its own scheduler
+    fcntl = None
+
+from audit import parse_time
+
+log = logging.getLogger(__name__)
+
+BidResult = namedtuple('BidResult', 'accepted reason highest bids')
+# reason of a bid the order book took but storage did not; the client may retry
+NOT_STORED = 'the bid could not be stored, please try again'
+
+
+class OrderBook:
+    """Live auction state for one product: its rules and the highest bid so far.
+
+    Every check and update happens under the book's own lock, which is held
+    only for a few comparisons, so bids on different products never wait
+    on each other and bids on one product are applied one at a time.
+    """
+    __slots__ = ('pid', 'seller', 'base_price', 'starts', 'ends', 'open',
+                 'highest', 'bidder', 'bids', 'lock')
+
+    def __init__(self, pid, seller=None, base_price=None, starts=None, ends=None, open=True,
+                 highest=None, bidder=None, bids=0):
+        self.pid = pid
+        self.lock = threading.Lock()
+        self.highest = highest
+        self.bidder = bidder
+        self.bids = bids
+        self.set_rules(seller, base_price, starts, ends, open)
+
+    def set_rules(self, seller, base_price, starts, ends, open):
+        self.seller = seller
+        self.base_price = base_price
+        self.starts = starts
+        self.ends = ends
+        self.open = open
+
+    def place(self, bidder, amount, now):
+        with self.lock:
+            if not self.open or self.ends is None:
+                return BidResult(False, 'not open for bidding', self.highest, self.bids)
+            if self.starts is not None and now < self.starts:
+                return BidResult(False, 'auction has not started', self.highest, self.bids)
+            if now >= self.ends:
+                return BidResult(False, 'auction has ended', self.highest, self.bids)
+            if bidder == self.seller:
+                return BidResult(False, 'sellers cannot bid on their own product', self.highest, self.bids)
+            if self.highest is None:
+                if amount < (self.base_price or 1):
+                    return BidResult(False, f'the opening bid must be at least {self.base_price or 1}', None, 0)
+            elif amount <= self.highest:
+                return BidResult(False, f'bid must be higher than {self.highest}', self.highest, self.bids)
+            self.highest = amount
+            self.bidder = bidder
+            self.bids += 1
+            return BidResult(True, None, amount, self.bids)
+
+    def to_dict(self):
+        return {'pid': self.pid, 'highest': self.highest, 'bids': self.bids, 'base_price': self.base_price,
+                'starts': self.starts, 'ends': self.ends, 'open': self.open}
+
+
+def product_rules(product):
+    """OrderBook.set_rules() arguments for an Addagroproducts row or product record"""
+    return (product.email, product.basePrice, parse_time(product.auctionStartTime),
+            parse_time(product.auctionEndTime), bool(product.available) and not product.auctionClosed)
+
+
+class AuctionEngine:
+    """Order books for every product that has been bid on, created on first use.
+
+    `load(pid)` builds a book from storage (product rules plus the highest
+    stored bid) or returns None for an unknown product. `store(rows)` writes
+    accepted bids before the bidder is told, outside the book's lock, so a
+    slow write never holds up the next comparison. When it fails the book
+    is dropped and loaded again from storage, which does not have the bid.
+    """
+
+    def __init__(self, load, store=None, clock=time.time):
+        self.load = load
+        self.store = store
+        self.clock = clock
+        self.stored = 0
+        self.failed = 0
+        self._books = {}
+        self._counts = threading.Lock()
+
+    def book(self, pid):
+        book = self._books.get(pid)
+        if book is None:
+            book = self.load(pid)
+            if book is None:
+                return None
+            # two first bids may both load the book; only one is kept
+            book = self._books.setdefault(pid, book)
+        return book
+
+    def bid(self, pid, bidder, amount):
+        if amount is None or amount <= 0:
+            return BidResult(False, 'enter a bid amount', None, 0)
+        book = self.book(pid)
+        if book is None:
+            return BidResult(False, 'product not found', None, 0)
+        now = self.clock()
+        result = book.place(bidder, amount, now)
+        if result.accepted and self.store is not None:
+            try:
+                self.store([{'pid': pid, 'bidder': bidder, 'amount': amount, 'created_at': int(now)}])
+            except Exception:
+                log.exception('could not store a bid on product %s', pid)
+                with self._counts:
+                    self.failed += 1
+                if self._books.get(pid) is book:
+                    self._books.pop(pid, None)
+                return BidResult(False, NOT_STORED, None, 0)
+            with self._counts:
+                self.stored += 1
+        return result
+
+    def refresh(self, pid, product):
+        """Pick up edited auction rules (availability, times, base price), keeping the bids"""
+        book = self._books.get(pid)
+        if book is not None:
+            with book.lock:
+                book.set_rules(*product_rules(product))
+
+    def close(self, pid):
+        """Stop accepting bids on a product; returns its (winner, amount), both None without bids"""
+        book = self.book(pid)
+        if book is None:
+            return None, None
+        with book.lock:
+            book.open = False
+            return book.bidder, book.highest
+
+    def stats(self):
+        return {'books': len(self._books), 'bids': sum(book.bids for book in list(self._books.values())),
+                'stored': self.stored, 'failed': self.failed}
+
+
+def bid_status(result):
+    """HTTP status for a bid: 503 when it could not be stored, 409 when the book turned it down"""
+    if result.accepted:
+        return 200
+    return 503 if result.reason == NOT_STORED else 409
+
+
+class AuctionScheduler:
+    """Closes auctions as their end times pass, from one background thread.
+
+    Open auctions sit in a min-heap of (end time, pid). The thread sleeps
+    until the earliest end time (or until an earlier auction is scheduled)
+    and hands every auction that is due to `close(pids)`, up to batch_size
+    at a time, so nothing on the request path ever scans products for
+    expired auctions. start() fills the heap from `pending()`, an
+    iterable of (end time, pid) read from storage. Given a lock file,
+    only the process holding it runs the scheduler; auctions created by
+    the other processes reach it by reading `pending()` again every
+    `refresh` seconds, and schedule() is a no-op where it is not running.
+    """
+
+    def __init__(self, close, pending, batch_size=500, clock=time.time, refresh=None):
+        self.close = close
+        self.pending = pending
+        self.batch_size = batch_size
+        self.clock = clock
+        self.refresh = refresh
+        self.closed = 0
+        self._heap = []
+        self._next_refresh = None
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._start_lock = threading.Lock()
+        self._lock_fd = None
+
+    def schedule(self, pid, ends):
+        if ends is None or not self.running:
+            return
+        with self._cond:
+            heapq.heappush(self._heap, (ends, pid))
+            if self._heap[0] == (ends, pid):
+                self._cond.notify()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, lock_path=None):
+        """Start the thread; False while another process holds `lock_path`"""
+        with self._start_lock:
+            if self._thread is not None:
+                return True
+            if lock_path is not None and not self._acquire(lock_path):
+                return False
+            # running from here on, so an auction stored after pending() is read still gets scheduled
+            self._thread = threading.Thread(target=self._run, name='auction-scheduler', daemon=True)
+            self._merge(self.pending())
+            self._thread.start()
+            return True
+
+    def _merge(self, pending):
+        """Add (end time, pid) pairs to the heap, skipping ones already in it"""
+        pending = list(pending)
+        with self._cond:
+            self._heap = list(set(self._heap).union(pending))
+            heapq.heapify(self._heap)
+            if self.refresh is not None:
+                self._next_refresh = self.clock() + self.refresh
+            self._cond.notify()
+
+    def _reload(self):
+        try:
+            self._merge(self.pending())
+        except Exception:
+            log.exception('could not read pending auctions')
+            with self._cond:
+                self._next_refresh = self.clock() + self.refresh
+
+    def _acquire(self, path):
+        """Take an exclusive lock on `path` for the life of the process; it is released when the process exits"""
+        if fcntl is None:
+            return True
+        if self._lock_fd is None:
+            self._lock_fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def _due(self):
+        """Wait for the next batch of expired auctions, empty when it is time to refresh; None once stopped"""
+        with self._cond:
+            while not self._stopping:
+                deadlines = [self._heap[0][0]] if self._heap else []
+                if self._next_refresh is not None:
+                    deadlines.append(self._next_refresh)
+                if not deadlines:
+                    self._cond.wait()
+                    continue
+                wait = min(deadlines) - self.clock()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                now = self.clock()
+                batch = []
+                while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+                    batch.append(heapq.heappop(self._heap)[1])
+                return batch
+            return None
+
+    def _run(self):
+        while True:
+            batch = self._due()
+            if batch is None:
+                return
+            if self._next_refresh is not None and self.clock() >= self._next_refresh:
+                self._reload()
+            if not batch:
+                continue
+            try:
+                self.closed += len(self.close(batch))
+            except Exception:
+                log.exception('could not close %d auctions', len(batch))
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self):
+        return {'running': self.running, 'scheduled': len(self._heap), 'closed': self.closed,
+                'next_close': self._heap[0][0] if self._heap else None}
+
+
+def scheduler_lock(database_uri):
+    """Lock file shared by every process of this machine that works on `database_uri`"""
+    key = hashlib.sha1(database_uri.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f'farm-auctions-{key}.lock')
+
+
+def init_app(app, scheduler, lock_path=None, retry=30):
+    """Start `scheduler` with the app's first request.
+
+    Requests rather than imports start it, so the reloader's parent, CLI
+    commands and image worker processes never close auctions. Apps whose
+    workers share one database pass scheduler_lock(uri) and give the
+    scheduler a `refresh` interval: one worker runs the scheduler, and
+    the others try again every `retry` seconds in case it exited. Apps
+    whose data lives in the process pass no lock.
+    """
+    next_try = [0.0]
+
+    def start():
+        if scheduler.running or time.monotonic() < next_try[0]:
+            return
+        if not scheduler.start(lock_path):
+            next_try[0] = time.monotonic() + retry
+
+    app.before_request(start)
+
+
+def pending_auctions(session, product_model):
+    """(end time, pid) of every open auction, read in end-time order off the auction index"""
+    rows = (session.query(product_model.auctionEndTime, product_model.pid)
+            .filter(product_model.auctionClosed == False, product_model.auctionEndTime.isnot(None))  # noqa: E712
+            .order_by(product_model.auctionEndTime))
+    return [(parse_time(ends), pid) for ends, pid in rows if parse_time(ends) is not None]
+
+
+def close_auctions(session, product_model, bid_model, engine, pids, now):
+    """Settle expired auctions in one transaction: stop bidding, record the winner, mark them unavailable.
+
+    The winner is the highest bid in the bid table or in this process's
+    order book, whichever is higher, so bids taken by other workers count.
+    Returns {pid: (winner, amount)} for the auctions actually closed;
+    products already closed or no longer due are skipped.
+    """
+    closed = {}
+    products = session.query(product_model).filter(product_model.pid.in_(pids),
+                                                   product_model.auctionClosed == False)  # noqa: E712
+    for product in products:
+        ends = parse_time(product.auctionEndTime)
+        if ends is None or ends > now:
+            continue
+        winner, amount = engine.close(product.pid)
+        top = (session.query(bid_model.bidder, bid_model.amount).filter_by(pid=product.pid)
+               .order_by(bid_model.amount.desc()).first())
+        if top is not None and (amount is None or top.amount > amount):
+            winner, amount = top.bidder, top.amount
+        closed[product.pid] = (winner, amount)
+        product.auctionWinner = winner
+        product.auctionPrice = amount
+        product.available = False
+        product.auctionClosed = True
+    session.commit()
+    return closed
+
+
+# columns added to the products table after it was first created
+AUCTION_COLUMNS = ('auctionClosed', 'auctionWinner', 'auctionPrice')
+
+
+def install(engine, table):
+    """Add the auction columns and the auction index to an existing products table"""
+    columns = {c['name'] for c in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        for name in AUCTION_COLUMNS:
+            if name in columns:
+                continue
+            column = table.c[name]
+            default = ' DEFAULT 0' if isinstance(column.type, Boolean) else ''
+            conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{name}" '
+                                 f'{column.type.compile(engine.dialect)}{default}')
+        # only indexes on auctionClosed: SQLite reads a column that does not exist yet
+        # as a string literal, so creating the others here would build them wrong
+        for index in table.indexes:
+            if 'auctionClosed' in index.columns:
+                index.create(conn, checkfirst=True)
+
+
+def load_book(session, product_model, bid_model, pid):
+    """AuctionEngine loader for the SQLAlchemy apps"""
+    product = session.get(product_model, pid)
+    if product is None:
+        return None
+    top = (session.query(bid_model.amount, bid_model.bidder).filter_by(pid=pid)
+           .order_by(bid_model.amount.desc()).first())
+    bids = session.query(bid_model).filter_by(pid=pid).count() if top else 0
+    return OrderBook(pid, *product_rules(product), highest=top[0] if top else None,
+                     bidder=top[1] if top else None, bids=bids)
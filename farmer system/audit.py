@@ -0,0 +1,306 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import String, event, func, inspect, select, text, tuple_
+from sqlalchemy.orm import Session, object_session
+
+log = logging.getLogger(__name__)
+
+# Verb recorded for each mapper event, e.g. 'FARMER UPDATED'
+ACTIONS = {'after_insert': 'INSERTED', 'after_update': 'UPDATED', 'after_delete': 'DELETED'}
+
+_STOP = object()
+
+
+# Events per /triggers page, and how long events stay in the hot table
+LOG_PAGE_SIZE = 50
+RETENTION_DAYS = 90
+
+
+def now():
+    """Event timestamps are integer epoch seconds"""
+    return int(time.time())
+
+
+def format_epoch(value):
+    """Template filter: epoch seconds as local 'YYYY-MM-DD HH:MM:SS'"""
+    if isinstance(value, int):
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(value))
+    return value
+
+
+def parse_time(value, end=False):
+    """Parse a ?from= / ?to= bound: epoch seconds, a date or an ISO datetime.
+
+    A bare date used as the end of a range covers the whole day.
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return int(parsed.timestamp())
+
+
+class WriteBehind:
+    """Queue of rows written by a background thread in batches.
+
+    put() only queues the row; the thread drains the queue and hands
+    batches to `write`, so the request that produced the row never waits on
+    the insert. When the queue is full new rows are dropped and counted
+    rather than blocking the request.
+    """
+
+    def __init__(self, write, batch_size=500, interval=0.5, maxsize=100000, on_flush=None, name='write-behind'):
+        self.write = write
+        self.batch_size = batch_size
+        self.interval = interval
+        self.on_flush = on_flush
+        self.name = name
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.close)
+
+    def put(self, row):
+        self._start()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch):
+        try:
+            self.write(batch)
+        except Exception:
+            self.failed += len(batch)
+            log.exception('%s: could not write %d rows', self.name, len(batch))
+            return
+        self.written += len(batch)
+        if self.on_flush is not None:
+            self.on_flush()
+
+    def flush(self):
+        """Block until every row queued so far has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'batch_size': self.batch_size,
+        }
+
+
+class AuditLog(WriteBehind):
+    """Write-behind buffer for audit events"""
+
+    def __init__(self, write, **kwargs):
+        kwargs.setdefault('name', 'audit-log')
+        super().__init__(write, **kwargs)
+        self._watching = False
+
+    def record(self, fid, action, timestamp=None):
+        self.put({'fid': str(fid), 'action': action, 'timestamp': timestamp or now()})
+
+
+def log_cursor(row):
+    """Next-page token for the log, newest first: the (timestamp, id) of the last row"""
+    return f'{row.timestamp}.{row.id}'
+
+
+def parse_log_cursor(token):
+    try:
+        timestamp, key = token.split('.')
+        return int(timestamp), int(key)
+    except (AttributeError, ValueError):
+        return None
+
+
+def log_page(query, model, start=None, end=None, before=None, limit=LOG_PAGE_SIZE):
+    """One page of audit events in [start, end), newest first.
+
+    Seeks on the (timestamp, id) index past the `before` cursor, so a page
+    costs the same however much history there is.
+    """
+    if start is not None:
+        query = query.filter(model.timestamp >= start)
+    if end is not None:
+        query = query.filter(model.timestamp < end)
+    if before is not None:
+        query = query.filter(tuple_(model.timestamp, model.id) < before)
+    rows = query.order_by(model.timestamp.desc(), model.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        return rows[:limit], log_cursor(rows[limit - 1])
+    return rows, None
+
+
+def month_of(timestamp):
+    return time.strftime('%Y_%m', time.localtime(timestamp))
+
+
+def month_bounds(timestamp):
+    """Epoch seconds of the first instant of the month holding `timestamp` and of the next month"""
+    t = time.localtime(timestamp)
+    year, month = t.tm_year + t.tm_mon // 12, t.tm_mon % 12 + 1
+    start = time.mktime((t.tm_year, t.tm_mon, 1, 0, 0, 0, 0, 0, -1))
+    return int(start), int(time.mktime((year, month, 1, 0, 0, 0, 0, 0, -1)))
+
+
+def archive_path(directory, name, month):
+    return os.path.join(directory, f'{name}-{month}.ndjson')
+
+
+def append_archive(path, rows):
+    """Append events (dicts) to a monthly NDJSON archive file"""
+    with open(path, 'a', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, separators=(',', ':')) + '\n')
+
+
+def archive(engine, table, before, directory=None):
+    """Move events older than `before` out of the hot table, one month at a time.
+
+    Each month goes into its own table (trig_2024_01, ...) or, with
+    `directory`, its own NDJSON file, and is deleted from the hot table in
+    the same transaction. Returns {month: rows moved}.
+    """
+    moved = {}
+    ts = table.c.timestamp
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    while True:
+        with engine.begin() as conn:
+            oldest = conn.execute(select(func.min(ts)).where(ts < before)).scalar()
+            if oldest is None:
+                return moved
+            start, stop = month_bounds(oldest)
+            stop = min(stop, before)
+            window = (ts >= start) & (ts < stop)
+            month = month_of(oldest)
+            if directory is None:
+                name = f'{table.name}_{month}'
+                conn.exec_driver_sql(f'CREATE TABLE IF NOT EXISTS "{name}" AS SELECT * FROM "{table.name}" WHERE 0')
+                conn.execute(text(f'INSERT INTO "{name}" SELECT * FROM "{table.name}" '
+                                  'WHERE timestamp >= :start AND timestamp < :stop'), {'start': start, 'stop': stop})
+            else:
+                rows = conn.execute(select(table).where(window).order_by(ts, table.c.id)).mappings()
+                append_archive(archive_path(directory, table.name, month), (dict(r) for r in rows))
+            count = conn.execute(table.delete().where(window)).rowcount
+            moved[month] = moved.get(month, 0) + count
+
+
+def install(engine, table):
+    """Bring an existing audit table up to date: integer epoch timestamps and their index.
+
+    Older databases stored the timestamp as text ('2021-01-19 23:04:44');
+    those tables are rebuilt with the text converted from local time.
+    """
+    columns = {c['name']: c['type'] for c in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        if isinstance(columns.get('timestamp'), String):
+            legacy = f'{table.name}_legacy'
+            conn.exec_driver_sql(f'ALTER TABLE "{table.name}" RENAME TO "{legacy}"')
+            table.create(conn)
+            conn.exec_driver_sql(f'INSERT INTO "{table.name}" (id, fid, action, timestamp) '
+                                 f"SELECT id, fid, action, CAST(strftime('%s', timestamp, 'utc') AS INTEGER) "
+                                 f'FROM "{legacy}"')
+            conn.exec_driver_sql(f'DROP TABLE "{legacy}"')
+        else:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+def table_writer(engine, table):
+    """write() for WriteBehind that inserts a batch into `table` in one executemany"""
+    def write(batch):
+        with engine.begin() as conn:
+            conn.execute(table.insert(), batch)
+    return write
+
+
+def watch(model, audit_log, label):
+    """Record an audit event for every row of `model` the ORM inserts, updates or deletes.
+
+    Events are held on the session until it commits, so a rolled back
+    transaction leaves no trace in the log.
+    """
+    def hook(action):
+        def listener(mapper, connection, target):
+            session = object_session(target)
+            if session is None:
+                return
+            if action == 'after_update' and not session.is_modified(target, include_collections=False):
+                return
+            key = mapper.primary_key_from_instance(target)[0]
+            session.info.setdefault(audit_log, []).append((key, f'{label} {ACTIONS[action]}', now()))
+        return listener
+
+    for action in ACTIONS:
+        event.listen(model, action, hook(action))
+
+    if not audit_log._watching:
+        audit_log._watching = True
+
+        @event.listens_for(Session, 'after_commit')
+        def publish(session):
+            for key, action, timestamp in session.info.pop(audit_log, ()):
+                audit_log.record(key, action, timestamp)
+
+        @event.listens_for(Session, 'after_rollback')
+        def discard(session):
+            session.info.pop(audit_log, None)
@@ -0,0 +1,93 @@
+"""Concurrent bidding load test for the auction engine.
+
+Seeds auctioned products in main.py on a scratch SQLite file, fires
+random bids from many threads, then checks every product's winner three
+ways: the order book, the highest accepted bid seen by the bidders, and
+the bid table, which has every accepted bid before the bidder is told.
+
+    python benchmarks/bench_auction.py --products 200 --threads 16 --bids 50000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/auction.db'
+from main import Addagroproducts, Bid, app, auctions, db  # noqa: E402
+
+
+def seed(products):
+    ends = (datetime.now() + timedelta(days=1)).isoformat(timespec='minutes')
+    with app.app_context():
+        db.create_all()
+        db.session.add_all(Addagroproducts(username='seller', email='seller@farm.test',
+                                           productname=f'Lot {i}', price=100, basePrice=50,
+                                           auctionEndTime=ends, available=True)
+                           for i in range(products))
+        db.session.commit()
+        return [pid for pid, in db.session.query(Addagroproducts.pid)]
+
+
+def bidder(n, pids, bids, accepted, errors):
+    rng = random.Random(n)
+    mine = []
+    with app.app_context():
+        for _ in range(bids):
+            pid = rng.choice(pids)
+            book = auctions.book(pid)
+            amount = (book.highest or 50) + rng.randint(-2, 5)
+            result = auctions.bid(pid, f'buyer{n}@farm.test', amount)
+            if result.accepted:
+                mine.append((pid, amount, f'buyer{n}@farm.test'))
+            elif result.reason is None:
+                errors.append(result)
+    accepted.extend(mine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--bids', type=int, default=50000, help='total bids across all threads')
+    args = parser.parse_args()
+
+    pids = seed(args.products)
+    accepted, errors = [], []
+    per_thread = args.bids // args.threads
+    threads = [threading.Thread(target=bidder, args=(n, pids, per_thread, accepted, errors))
+               for n in range(args.threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    seconds = time.perf_counter() - start
+    total = per_thread * args.threads
+    print(f'{total} bids from {args.threads} threads on {args.products} products in {seconds:.2f}s: '
+          f'{total / seconds:.0f} bids/s, {len(accepted)} accepted')
+
+    winners = {}
+    for pid, amount, who in accepted:
+        if amount > winners.get(pid, (0, None))[0]:
+            winners[pid] = (amount, who)
+    with app.app_context():
+        stored = dict(db.session.query(Bid.pid, func.max(Bid.amount)).group_by(Bid.pid))
+        rows = db.session.query(Bid).count()
+    mismatched = [pid for pid, (amount, who) in winners.items()
+                  if (auctions.book(pid).highest, auctions.book(pid).bidder) != (amount, who)
+                  or stored.get(pid) != amount]
+    print(f'bid rows stored: {rows} (accepted {len(accepted)}), '
+          f'winners checked: {len(winners)}, mismatched: {len(mismatched)}, errors: {len(errors)}')
+    if mismatched or rows != len(accepted) or errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Bulk import throughput for Register and Addagroproducts on a SQLite file.
+
+Generates CSV and NDJSON files with a sprinkling of invalid rows, then
+streams them through bulk_import with the production SQLite profile.
+
+    python benchmarks/bench_bulk_import.py --rows 1000000
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from bulk_import import import_file  # noqa: E402
+from main import Addagroproducts, Register  # noqa: E402
+from search import install as install_search  # noqa: E402
+from sqlite_profile import apply_profile  # noqa: E402
+
+
+def farmer(i):
+    return {'farmername': f'Farmer {i}', 'adharnumber': f'{i:012d}', 'age': 20 + i % 50,
+            'gender': 'F' if i % 2 else 'M', 'phonenumber': f'98{i:08d}',
+            'address': f'Village {i % 900}', 'farming': 'Organic Farming'}
+
+
+def product(i):
+    return {'username': f'farmer{i % 1000}', 'email': f'farmer{i % 1000}@farm.test',
+            'productname': f'Product {i}', 'productdesc': 'Fresh produce from the farm',
+            'price': 'abc' if i % 10000 == 7 else 10 + i % 500,  # one bad row in 10k
+            'category': ('Vegetables', 'Fruits', 'Grains')[i % 3], 'quantity': '50 kg',
+            'basePrice': 9 + i % 500, 'image': '', 'available': 'true'}
+
+
+def write_file(path, make, rows, fmt):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            writer = csv.DictWriter(f, fieldnames=list(make(0)))
+            writer.writeheader()
+            for i in range(rows):
+                writer.writerow(make(i))
+        else:
+            for i in range(rows):
+                f.write(json.dumps(make(i)) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--formats', nargs='+', default=['csv', 'ndjson'])
+    parser.add_argument('--search-index', action='store_true',
+                        help='keep the FTS5 triggers on addagroproducts during the import')
+    args = parser.parse_args()
+
+    print(f"{'table':>16} {'format':>7} {'rows':>9} {'seconds':>8} {'rows/s':>9} {'failed':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in args.formats:
+            engine = create_engine(f'sqlite:///{tmp}/{fmt}.db')
+            apply_profile(engine, 'production')
+            Register.__table__.create(engine)
+            Addagroproducts.__table__.create(engine)
+            if args.search_index:
+                install_search(engine)
+            for model, make in ((Register, farmer), (Addagroproducts, product)):
+                path = os.path.join(tmp, f'{model.__tablename__}.{fmt}')
+                write_file(path, make, args.rows, fmt)
+                start = time.perf_counter()
+                with open(path, 'rb') as f:
+                    report = import_file(engine, model, f, fmt)
+                seconds = time.perf_counter() - start
+                print(f'{model.__tablename__:>16} {fmt:>7} {report.inserted:>9} {seconds:>8.1f} '
+                      f'{report.inserted / seconds:>9.0f} {report.failed:>7}')
+            engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
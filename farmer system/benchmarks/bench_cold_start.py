@@ -0,0 +1,68 @@
+"""Cold-start time of api/complete.py against stored record count, per storage backend.
+
+Each size is written to a fresh SQLite file and NDJSON log, then the app is
+imported in a new interpreter with FARM_STORAGE pointing at it, which is
+what a new serverless instance does.
+
+    python benchmarks/bench_cold_start.py --sizes 0 1000 10000 100000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from storage import open_backend  # noqa: E402
+
+IMPORT_TIMER = ('import time; start = time.perf_counter(); import complete; '
+                'print(time.perf_counter() - start, len(complete.products_db))')
+
+
+def seed(url, n):
+    backend = open_backend(url)
+    for pid in range(1, n + 1):
+        backend.save('products', pid, {
+            'pid': pid, 'username': 'farmer', 'email': f'farmer{pid % 500}@farm.test',
+            'productname': f'Product {pid}', 'productdesc': 'Fresh produce',
+            'price': 100 + pid % 50, 'category': ('Vegetables', 'Fruits', 'Grains')[pid % 3],
+            'quantity': '50 kg', 'basePrice': 90, 'image': None, 'available': True,
+            'created_at': '2024-01-01T00:00:00',
+        })
+    for user_id in range(1, n // 10 + 1):
+        backend.save('users', user_id, {'id': user_id, 'username': f'user{user_id}',
+                                        'email': f'user{user_id}@farm.test', 'password': 'x'})
+    backend.close()
+
+
+def cold_start(url, repeat):
+    env = dict(os.environ, FARM_STORAGE=url)
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', IMPORT_TIMER], cwd=os.path.join(ROOT, 'api'),
+                             env=env, capture_output=True, text=True, check=True).stdout.split()
+        seconds = float(out[0])
+        best = seconds if best is None else min(best, seconds)
+    return best, int(out[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'products':>9} {'backend':>8} {'import ms':>10} {'loaded':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            for scheme in ('memory', 'sqlite', 'log'):
+                url = 'memory' if scheme == 'memory' else f'{scheme}://{tmp}/{n}.{scheme}'
+                if scheme != 'memory':
+                    seed(url, n)
+                seconds, loaded = cold_start(url, args.repeat)
+                print(f'{n:>9} {scheme:>8} {seconds * 1e3:>10.1f} {loaded:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Logins per second at each password hashing cost.
+
+Signs up one user per cost level in the api/complete.py app, then fires
+POST /login from concurrent clients, at most --workers KDFs at a time
+(PasswordHasher's limit).
+
+    python benchmarks/bench_password_hash.py --concurrency 8 --workers 4
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+import complete  # noqa: E402
+from passwords import PasswordHasher  # noqa: E402
+
+METHODS = ['pbkdf2:sha256:100000', 'pbkdf2:sha256:600000',
+           'scrypt:16384:8:1', 'scrypt:32768:8:1', 'scrypt:65536:8:1']
+
+
+def login_rate(email, logins, concurrency):
+    per_client = max(1, logins // concurrency)
+    failures = []
+
+    def client():
+        c = complete.app.test_client()
+        for _ in range(per_client):
+            r = c.post('/login', data={'email': email, 'password': 'secret'})
+            if r.status_code != 302 or r.location != '/':
+                failures.append(r.status_code)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return per_client * concurrency / (time.perf_counter() - start), len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--methods', nargs='+', default=METHODS)
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print(f"{'method':>22} {'ms/hash':>8} {'logins/s':>9} {'failed':>7}")
+    for n, method in enumerate(args.methods):
+        complete.hasher = PasswordHasher(method, args.workers)
+        email = f'bench{n}@farm.test'
+        complete.app.test_client().post('/signup', data={'username': 'bench', 'email': email,
+                                                         'password': 'secret'})
+        start = time.perf_counter()
+        complete.hasher.hash('secret')
+        single = time.perf_counter() - start
+        rate, failed = login_rate(email, args.logins, args.concurrency)
+        print(f'{method:>22} {single * 1e3:>8.1f} {rate:>9.1f} {failed:>7}')
+
+
+if __name__ == '__main__':
+    main()
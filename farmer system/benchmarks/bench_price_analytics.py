@@ -0,0 +1,87 @@
+"""Per-category price statistics: ORM objects and a Python loop vs. NumPy.
+
+Fills a scratch SQLite file with products, then times the naive version
+(load every Addagroproducts object, group and sort in Python) against
+analytics.load_columns + price_stats, and a cached hit.
+
+    python benchmarks/bench_price_analytics.py --rows 100000 500000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ['DATABASE_URL'] = f'sqlite:///{tempfile.mkdtemp()}/analytics.db'
+from analytics import cached_stats_json, load_columns, price_stats  # noqa: E402
+from fragment_cache import FragmentCache  # noqa: E402
+from main import Addagroproducts, app, db  # noqa: E402
+
+CATEGORIES = ['Vegetables', 'Fruits', 'Grains', 'Dairy', 'Spices', 'Organic']
+
+
+def seed(rows):
+    rng = random.Random(rows)
+    table = Addagroproducts.__table__
+    with db.engine.begin() as conn:
+        conn.execute(table.delete())
+        conn.execute(table.insert(), [
+            {'productname': f'Product {i}', 'category': rng.choice(CATEGORIES),
+             'price': rng.randint(10, 500), 'basePrice': rng.choice([None, rng.randint(10, 500)]),
+             'available': rng.random() < 0.8} for i in range(rows)])
+
+
+def python_stats():
+    groups = {}
+    for p in Addagroproducts.query.all():
+        groups.setdefault(p.category, []).append(p)
+    result = {}
+    for category, products in groups.items():
+        prices = sorted(p.price for p in products if p.price is not None)
+        discounts = [(p.basePrice - p.price) / p.basePrice * 100 for p in products
+                     if p.basePrice and p.price is not None]
+        result[category] = {
+            'min': prices[0], 'median': statistics.median(prices),
+            'p90': statistics.quantiles(prices, n=10, method='inclusive')[-1], 'max': prices[-1],
+            'discount': statistics.fmean(discounts) if discounts else None,
+            'available': sum(1 for p in products if p.available),
+        }
+    return result
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 500000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'orm+python ms':>14} {'numpy ms':>9} {'cached ms':>10}")
+    with app.app_context():
+        db.create_all()
+        for rows in args.rows:
+            seed(rows)
+            db.session.expunge_all()
+            naive = timed(python_stats)
+
+            def vectorized():
+                with db.engine.connect() as conn:
+                    return price_stats(*load_columns(conn, Addagroproducts.__table__))
+            fast = timed(vectorized)
+
+            cache = FragmentCache()
+            load = lambda: load_columns(db.engine.connect(), Addagroproducts.__table__)  # noqa: E731
+            cached_stats_json(cache, rows, load)
+            hit = timed(lambda: cached_stats_json(cache, rows, load))
+            print(f'{rows:>8} {naive * 1e3:>14.0f} {fast * 1e3:>9.0f} {hit * 1e3:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Memory per 100k products: dict-of-dicts rows versus __slots__ Product records.
+
+Also times what an /agroproducts render used to pay for copying every row
+to add its pid, which the record store no longer does.
+
+    python benchmarks/bench_record_memory.py --products 100000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from records import IdAllocator, Product  # noqa: E402
+
+
+def fields(i):
+    # every product shares the seller/category strings, like real listings do
+    return {
+        'username': 'farmer', 'email': 'farmer@farm.test',
+        'productname': f'Product {i}', 'productdesc': f'Fresh produce batch {i}',
+        'price': 100 + i % 50, 'category': 'Vegetables', 'quantity': '50 kg',
+        'basePrice': 90, 'image': None, 'available': True,
+        'created_at': '2024-01-01T00:00:00',
+    }
+
+
+def build_dict_rows(n):
+    return {i: fields(i) for i in range(1, n + 1)}
+
+
+def build_records(n):
+    ids = IdAllocator()
+    store = {}
+    for i in range(1, n + 1):
+        pid = ids.next_id()
+        store[pid] = Product(pid=pid, **fields(i))
+    return store
+
+
+def measure(build, n):
+    tracemalloc.start()
+    store = build(n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, size
+
+
+def time_ids(n):
+    """Cost of handing out n ids: old max(keys)+1 versus IdAllocator"""
+    store = {}
+    start = time.perf_counter()
+    for _ in range(n):
+        store[max(store.keys()) + 1 if store else 1] = None
+    old = time.perf_counter() - start
+    ids = IdAllocator()
+    start = time.perf_counter()
+    for _ in range(n):
+        ids.next_id()
+    return old, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=100000)
+    args = parser.parse_args()
+    n = args.products
+
+    dict_store, dict_bytes = measure(build_dict_rows, n)
+    record_store, record_bytes = measure(build_records, n)
+    print(f'{n} products')
+    print(f'  dict rows      {dict_bytes / 2**20:8.1f} MiB  {dict_bytes / n:6.0f} B/product')
+    print(f'  slot records   {record_bytes / 2**20:8.1f} MiB  {record_bytes / n:6.0f} B/product')
+    print(f'  saved          {(1 - record_bytes / dict_bytes) * 100:7.1f} %')
+
+    start = time.perf_counter()
+    copies = []
+    for pid, product in dict_store.items():
+        product_copy = product.copy()
+        product_copy['pid'] = pid
+        copies.append(product_copy)
+    copy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    views = list(record_store.values())
+    view_time = time.perf_counter() - start
+    print(f'  list all, copy {copy_time * 1e3:8.1f} ms   in place {view_time * 1e3:6.1f} ms')
+
+    # max(keys)+1 is quadratic overall, so keep this part small
+    id_count = min(n, 20000)
+    old, new = time_ids(id_count)
+    print(f'  {id_count} ids, max+1 {old * 1e3:8.1f} ms   allocator {new * 1e3:6.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
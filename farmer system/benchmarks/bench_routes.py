@@ -0,0 +1,486 @@
+"""Route-level load test of every entry point through the WSGI stack.
+
+Each app (main.py, index.py, api/app.py, api/complete.py) is imported in a
+fresh interpreter on a throwaway database, seeded with synthetic users,
+farmers and products, and driven through Flask's test client (the whole
+WSGI stack, no sockets) by concurrent clients, each logged in as its own
+user. Every route the app has is timed in a phase of its own, then all of
+them together as a mix; the report gives requests per second and
+p50/p95/p99 latency per route and per entry point.
+
+--save writes the results as a JSON baseline. --baseline compares the run
+against one and exits 1 when a route's p95 grew, or its throughput fell,
+by more than --tolerance.
+
+    python benchmarks/bench_routes.py --users 200 --farmers 1000 --products 10000 --clients 8
+    python benchmarks/bench_routes.py --apps index.py api/complete.py --save baseline.json
+    python benchmarks/bench_routes.py --baseline baseline.json
+"""
+import argparse
+import io
+import itertools
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, namedtuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+APPS = ('main.py', 'index.py', 'api/app.py', 'api/complete.py')
+
+PASSWORD = 'bench-password'
+CATEGORIES = ('Vegetables', 'Fruits', 'Grains', 'Dairy', 'Spices')
+CROPS = ('Tomato', 'Onion', 'Mango', 'Banana', 'Wheat', 'Rice', 'Potato', 'Turmeric', 'Milk', 'Chilli')
+QUANTITIES = ('50 kg', '1 quintal', '20 litres', '12 dozen', '3 bags', '500 g')
+FARMING = ('Organic Farming', 'Vegetable Farming', 'Fruit Farming', 'Grain Farming')
+# every tenth product is up for auction, owned by a seller none of the clients logs in as
+AUCTION_EVERY = 10
+AUCTION_SELLER = 'auction-seller@farm.test'
+# a page of one export: /export is timed as an incremental pull of the newest rows
+EXPORT_TAIL = 100
+IMPORT_ROWS = 10
+
+# path(w, client) -> url, or None when the workload has nothing left for it (e.g. farmers to delete)
+Route = namedtuple('Route', 'name method path form')
+
+
+class Workload:
+    """Seed sizes plus the counters that keep write routes from colliding"""
+
+    def __init__(self, users, farmers, products, seed=0):
+        self.users = users
+        self.farmers = farmers
+        self.products = products
+        self.random = random.Random(seed)
+        self.serial = itertools.count(1)
+        self.bid_step = itertools.count(1)
+        # /edit works on the lower half of the farmers, /delete eats the upper half
+        self.deletable = iter(range(farmers, farmers // 2, -1))
+        self.auction_pids = [pid for pid in range(1, products + 1) if pid % AUCTION_EVERY == 0]
+        self.start = int(time.time()) - 60
+        self.end = int(time.time()) + 365 * 86400
+
+    def choice(self, values):
+        return self.random.choice(values)
+
+    def auction_path(self, template):
+        return template.format(self.choice(self.auction_pids)) if self.auction_pids else None
+
+    def toggle_path(self, client):
+        """/toggle_availability of a product the client's own user listed"""
+        owned = [pid for pid in range(client.user, min(self.products, client.user + 50 * self.users) + 1, self.users)
+                 if pid % AUCTION_EVERY]
+        return f'/toggle_availability/{self.choice(owned)}' if owned else None
+
+    def edit_path(self):
+        return f'/edit/{self.random.randint(1, self.farmers // 2)}' if self.farmers >= 2 else None
+
+    def delete_path(self):
+        rid = next(self.deletable, None)
+        return None if rid is None else f'/delete/{rid}'
+
+    def farmer_form(self):
+        n = next(self.serial)
+        return {'farmername': f'Bench Farmer {n}', 'adharnumber': f'{n:012d}', 'age': str(20 + n % 50),
+                'gender': ('Male', 'Female')[n % 2], 'phonenumber': f'9{n:09d}', 'address': f'Village {n % 300}',
+                'farmingtype': FARMING[n % len(FARMING)]}
+
+    def product_form(self, client):
+        n = next(self.serial)
+        return {'username': client.username, 'email': client.email, 'productname': f'{CROPS[n % len(CROPS)]} lot {n}',
+                'productdesc': 'Fresh produce, harvested this week', 'price': str(100 + n % 400),
+                'category': CATEGORIES[n % len(CATEGORIES)], 'quantity': QUANTITIES[n % len(QUANTITIES)],
+                'basePrice': str(80 + n % 300), 'available': 'on'}
+
+    def import_form(self):
+        rows = [self.farmer_form() for _ in range(IMPORT_ROWS)]
+        body = ''.join(json.dumps(dict(row, farming=row.pop('farmingtype'))) + '\n' for row in rows)
+        return {'file': (io.BytesIO(body.encode()), 'farmers.ndjson')}
+
+    def signup_form(self):
+        n = next(self.serial)
+        return {'username': f'newuser{n}', 'email': f'newuser{n}@farm.test', 'password': PASSWORD}
+
+
+ROUTES = [
+    Route('GET /', 'GET', lambda w, c: '/', None),
+    Route('GET /test', 'GET', lambda w, c: '/test', None),
+    Route('GET /agroproducts', 'GET', lambda w, c: '/agroproducts', None),
+    Route('GET /agroproducts?category', 'GET', lambda w, c: f'/agroproducts?category={w.choice(CATEGORIES)}', None),
+    Route('GET /agroproducts?qty', 'GET', lambda w, c: '/agroproducts?unit=kg&min_qty=10&max_qty=60', None),
+    Route('GET /agroproducts?format=json', 'GET', lambda w, c: '/agroproducts?format=json', None),
+    Route('GET /search', 'GET', lambda w, c: f'/search?q={w.choice(CROPS).lower()}', None),
+    Route('GET /analytics/prices', 'GET', lambda w, c: '/analytics/prices', None),
+    Route('GET /bids/<pid>', 'GET', lambda w, c: w.auction_path('/bids/{}'), None),
+    Route('POST /bid/<pid>', 'POST', lambda w, c: w.auction_path('/bid/{}?format=json'),
+          lambda w, c: {'amount': str(10000 + 10 * next(w.bid_step))}),
+    Route('GET /myproducts', 'GET', lambda w, c: '/myproducts', None),
+    Route('GET /toggle_availability/<pid>', 'GET', lambda w, c: w.toggle_path(c), None),
+    Route('GET /farmerdetails', 'GET', lambda w, c: '/farmerdetails', None),
+    Route('GET /register', 'GET', lambda w, c: '/register', None),
+    Route('POST /register', 'POST', lambda w, c: '/register', lambda w, c: w.farmer_form()),
+    Route('GET /edit/<rid>', 'GET', lambda w, c: w.edit_path(), None),
+    Route('POST /edit/<rid>', 'POST', lambda w, c: w.edit_path(), lambda w, c: w.farmer_form()),
+    Route('GET /delete/<rid>', 'GET', lambda w, c: w.delete_path(), None),
+    Route('GET /addfarming', 'GET', lambda w, c: '/addfarming', None),
+    Route('POST /addfarming', 'POST', lambda w, c: '/addfarming', lambda w, c: {'farming': f'Bench Farming {next(w.serial)}'}),
+    Route('GET /triggers', 'GET', lambda w, c: '/triggers', None),
+    Route('GET /addagroproduct', 'GET', lambda w, c: '/addagroproduct', None),
+    Route('POST /addagroproduct', 'POST', lambda w, c: '/addagroproduct', lambda w, c: w.product_form(c)),
+    Route('GET /export/products', 'GET',
+          lambda w, c: f'/export/products?format=ndjson&since={max(0, w.products - EXPORT_TAIL)}', None),
+    Route('POST /import/farmers', 'POST', lambda w, c: '/import/farmers', lambda w, c: w.import_form()),
+    Route('GET /stats', 'GET', lambda w, c: '/stats', None),
+    Route('GET /signup', 'GET', lambda w, c: '/signup', None),
+    Route('POST /signup', 'POST', lambda w, c: '/signup', lambda w, c: w.signup_form()),
+    Route('GET /login', 'GET', lambda w, c: '/login', None),
+    Route('POST /login', 'POST', lambda w, c: '/login', lambda w, c: {'email': c.email, 'password': PASSWORD}),
+]
+
+
+# --- synthetic data, shared by every app -------------------------------------------------------
+
+def user_rows(w):
+    for uid in range(1, w.users + 1):
+        yield {'id': uid, 'username': f'user{uid}', 'email': f'user{uid}@farm.test'}
+
+
+def farmer_rows(w):
+    for rid in range(1, w.farmers + 1):
+        yield {'rid': rid, 'farmername': f'Farmer {rid}', 'adharnumber': f'{rid:012d}', 'age': 20 + rid % 50,
+               'gender': ('Male', 'Female')[rid % 2], 'phonenumber': f'9{rid:09d}', 'address': f'Village {rid % 300}',
+               'farming': FARMING[rid % len(FARMING)]}
+
+
+def product_rows(w):
+    from quantity import parse_quantity
+    for pid in range(1, w.products + 1):
+        auction = pid % AUCTION_EVERY == 0
+        owner = (pid - 1) % max(w.users, 1) + 1
+        quantity = QUANTITIES[pid % len(QUANTITIES)]
+        amount, unit = parse_quantity(quantity)
+        yield {'pid': pid, 'username': 'seller' if auction else f'user{owner}',
+               'email': AUCTION_SELLER if auction else f'user{owner}@farm.test',
+               'productname': f'{CROPS[pid % len(CROPS)]} {pid}',
+               'productdesc': f'Fresh {CROPS[pid % len(CROPS)].lower()} from village {pid % 300}',
+               'price': 100 + pid % 400, 'category': CATEGORIES[pid % len(CATEGORIES)], 'quantity': quantity,
+               'quantityAmount': amount, 'quantityUnit': unit, 'basePrice': 80 + pid % 300,
+               'auctionStartTime': str(w.start) if auction else None, 'auctionEndTime': str(w.end) if auction else None,
+               'auctionClosed': False, 'image': None, 'available': True}
+
+
+# --- per-app setup: create the schema the way the app's own entry point does, then seed ---------
+
+def seed_sqlalchemy(module, w):
+    with module.app.app_context():
+        password = module.hasher.hash(PASSWORD)
+        with module.db.engine.begin() as conn:
+            if not conn.execute(module.Farming.__table__.select().limit(1)).first():
+                conn.execute(module.Farming.__table__.insert(), [{'farmingtype': name} for name in FARMING])
+            for table, rows in ((module.User.__table__, [dict(row, password=password) for row in user_rows(w)]),
+                                (module.Register.__table__, list(farmer_rows(w))),
+                                (module.Addagroproducts.__table__, list(product_rows(w)))):
+                if rows:
+                    conn.execute(table.insert(), rows)
+
+
+def seed_app(module, w):
+    """api/app.py keeps plain dicts, plaintext passwords and form values as posted (strings)"""
+    for row in user_rows(w):
+        module.users_db[row['id']] = dict(row, password=PASSWORD)
+        module.users_by_email[row['email']] = row['id']
+    for row in farmer_rows(w):
+        module.farmers_db[row['rid']] = dict(row, age=str(row['age']))
+    for row in product_rows(w):
+        pid = row.pop('pid')
+        module.products_db[pid] = dict(row, price=str(row['price']), basePrice=str(row['basePrice']),
+                                       created_at='2024-01-01T00:00:00')
+        module.product_ids_by_seller.setdefault(row['email'], []).append(pid)
+
+
+def seed_complete(module, w):
+    password = module.hasher.hash(PASSWORD)
+    for row in user_rows(w):
+        module.add_user(module.User(password=password, **row))
+        module.user_id_allocator.advance_to(row['id'])
+    for row in farmer_rows(w):
+        module.add_farmer(module.Farmer(**row))
+        module.farmer_id_allocator.advance_to(row['rid'])
+    for row in product_rows(w):
+        module.add_product(module.Product(created_at='2024-01-01T00:00:00', **row))
+        module.product_id_allocator.advance_to(row['pid'])
+    module.catalog_version.bump()
+
+
+# module name -> (environment for a throwaway database, setup after import)
+SETUP = {
+    'main': (lambda tmp: {'DATABASE_URL': f'sqlite:///{os.path.join(tmp, "farmers.db")}'}, seed_sqlalchemy),
+    'index': (lambda tmp: {'DB_SNAPSHOT': ''}, seed_sqlalchemy),
+    'app': (lambda tmp: {}, seed_app),
+    'complete': (lambda tmp: {'FARM_STORAGE': 'memory'}, seed_complete),
+}
+
+
+# --- load generation -----------------------------------------------------------------------------
+
+class Client:
+    """One simulated browser: its own cookie jar, logged in as its own user"""
+
+    def __init__(self, app, user):
+        self.http = app.test_client()
+        self.user = user
+        self.username = f'user{user}'
+        self.email = f'user{user}@farm.test'
+
+    def login(self):
+        response = self.http.post('/login', data={'email': self.email, 'password': PASSWORD})
+        response.close()
+        return response.status_code
+
+    def request(self, route, w):
+        """(status, seconds), or None when the route has nothing left to work on"""
+        path = route.path(w, self)
+        if path is None:
+            return None
+        data = route.form(w, self) if route.form else None
+        start = time.perf_counter()
+        try:
+            response = self.http.open(path, method=route.method, data=data)
+            response.get_data()  # drain streamed bodies (/export) inside the timing
+            response.close()
+        except Exception:  # an exception escaping the app is an error like a 500, timed up to the raise
+            return 599, time.perf_counter() - start
+        return response.status_code, time.perf_counter() - start
+
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))]
+
+
+def summarize(samples, seconds):
+    latencies = sorted(elapsed for status, elapsed in samples)
+    statuses = Counter(status for status, elapsed in samples)
+    if not latencies:
+        return {'requests': 0, 'errors': 0, 'rps': 0.0, 'mean_ms': None, 'p50_ms': None, 'p95_ms': None,
+                'p99_ms': None, 'statuses': {}}
+    return {'requests': len(latencies), 'errors': sum(n for status, n in statuses.items() if status >= 500),
+            'rps': round(len(latencies) / seconds, 1) if seconds else 0.0,
+            'mean_ms': round(sum(latencies) / len(latencies) * 1e3, 3),
+            'p50_ms': round(percentile(latencies, 50) * 1e3, 3),
+            'p95_ms': round(percentile(latencies, 95) * 1e3, 3),
+            'p99_ms': round(percentile(latencies, 99) * 1e3, 3),
+            'statuses': {str(status): n for status, n in sorted(statuses.items())}}
+
+
+def run_phase(clients, w, schedule):
+    """Run schedule[i] (a list of routes) on clients[i], all at once; returns (samples, wall seconds)"""
+    samples = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(len(clients) + 1)
+
+    def drive(client, routes):
+        mine = []
+        barrier.wait()
+        for route in routes:
+            result = client.request(route, w)
+            if result is not None:
+                mine.append(result)
+        with lock:
+            samples.extend(mine)
+
+    threads = [threading.Thread(target=drive, args=(client, routes)) for client, routes in zip(clients, schedule)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start
+
+
+def split(n, parts):
+    return [n // parts + (i < n % parts) for i in range(parts)]
+
+
+def has_route(app, route, w, client):
+    """Whether the app serves this route (the url map decides, not the response)"""
+    from werkzeug.exceptions import HTTPException
+    path = route.path(w, client)
+    if path is None:
+        return False
+    try:
+        app.url_map.bind('localhost').match(path.split('?')[0], method=route.method)
+    except HTTPException:
+        return False
+    return True
+
+
+def worker(args):
+    """Runs inside the per-app interpreter and prints one JSON result"""
+    path = os.path.join(ROOT, args.worker)
+    name = os.path.splitext(os.path.basename(path))[0]
+    env_for, setup = SETUP[name]
+    tmp = tempfile.mkdtemp(prefix='bench-routes-')
+    os.environ.update(env_for(tmp))
+    # the app's own directory first: api/app.py and the root app.py share a module name
+    sys.path[:0] = [os.path.dirname(path), ROOT]
+    w = Workload(args.users, args.farmers, args.products, args.seed)
+
+    start = time.perf_counter()
+    module = __import__(name)
+    import_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    setup(module, w)
+    seed_ms = (time.perf_counter() - start) * 1e3
+
+    clients = [Client(module.app, user) for user in range(1, min(args.clients, max(args.users, 1)) + 1)]
+    logins = Counter(client.login() for client in clients)
+    routes = [route for route in ROUTES if has_route(module.app, route, w, clients[0])]
+    for route in routes:  # first hits compile templates and fill caches; not timed
+        clients[0].request(route, w)
+
+    result = {'app': args.worker, 'users': w.users, 'farmers': w.farmers, 'products': w.products,
+              'clients': len(clients), 'import_ms': round(import_ms, 1), 'seed_ms': round(seed_ms, 1),
+              'logins': {str(status): n for status, n in logins.items()}, 'routes': {}}
+    for route in routes:
+        samples, seconds = run_phase(clients, w, [[route] * n for n in split(args.requests, len(clients))])
+        result['routes'][route.name] = summarize(samples, seconds)
+
+    # the mix: every client walks all routes in its own shuffled order
+    mix = []
+    for n in split(args.requests * len(routes), len(clients)):
+        order = (routes * (n // len(routes) + 1))[:n]
+        w.random.shuffle(order)
+        mix.append(order)
+    samples, seconds = run_phase(clients, w, mix)
+    result['mix'] = summarize(samples, seconds)
+
+    print(json.dumps(result))
+    sys.stdout.flush()
+    shutil.rmtree(tmp, ignore_errors=True)
+    instance = os.path.join(ROOT, 'instance')
+    if os.path.isdir(instance) and not os.listdir(instance):
+        os.rmdir(instance)
+    # background writers and schedulers are not daemon threads everywhere; nothing is left to flush
+    os._exit(0)
+
+
+# --- driver ------------------------------------------------------------------------------------
+
+def run_app(app, args):
+    """The worker's result for one app, or None (with its stderr shown) when the worker died"""
+    command = [sys.executable, os.path.abspath(__file__), '--worker', app, '--users', str(args.users),
+               '--farmers', str(args.farmers), '--products', str(args.products), '--clients', str(args.clients),
+               '--requests', str(args.requests), '--seed', str(args.seed)]
+    done = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    lines = done.stdout.strip().splitlines()
+    if done.returncode or not lines:
+        print(f'\n{app}: worker exited with {done.returncode}\n{done.stderr[-2000:]}')
+        return None
+    return json.loads(lines[-1])
+
+
+def fmt_ms(value):
+    return f'{value:>8.2f}' if value is not None else f"{'-':>8}"
+
+
+def report(result):
+    print(f"\n{result['app']}: {result['users']} users, {result['farmers']} farmers, {result['products']} products, "
+          f"{result['clients']} clients (import {result['import_ms']} ms, seed {result['seed_ms']} ms)")
+    print(f"  {'route':<34} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}  statuses")
+    rows = list(result['routes'].items()) + [('(mix of all routes)', result['mix'])]
+    for name, stats in rows:
+        statuses = ' '.join(f'{status}x{n}' for status, n in stats['statuses'].items())
+        print(f"  {name:<34} {stats['rps']:>8.1f} {fmt_ms(stats['p50_ms'])} {fmt_ms(stats['p95_ms'])} "
+              f"{fmt_ms(stats['p99_ms'])} {stats['errors']:>6}  {statuses}")
+
+
+def summary(results):
+    print(f"\n{'entry point':<18} {'routes':>6} {'mix req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for app, result in results.items():
+        mix = result['mix']
+        print(f"{app:<18} {len(result['routes']):>6} {mix['rps']:>10.1f} {fmt_ms(mix['p50_ms'])} "
+              f"{fmt_ms(mix['p95_ms'])} {fmt_ms(mix['p99_ms'])} {mix['errors']:>6}")
+
+
+def regressions(results, baseline, tolerance, min_delta_ms):
+    """(app, route, what, before, after) for every route that got slower than the baseline allows.
+
+    A slowdown only counts when the latency (p95, or the mean for
+    throughput) also grew by min_delta_ms, so sub-millisecond routes do not
+    flap on scheduler noise.
+    """
+    found = []
+    for app, result in results.items():
+        before = baseline.get('results', {}).get(app)
+        if before is None:
+            continue
+        pairs = [(name, stats, before['routes'].get(name)) for name, stats in result['routes'].items()]
+        pairs.append(('(mix of all routes)', result['mix'], before.get('mix')))
+        for name, now, then in pairs:
+            if not then or not then['requests'] or not now['requests']:
+                continue
+            if now['p95_ms'] > then['p95_ms'] * (1 + tolerance) and now['p95_ms'] - then['p95_ms'] >= min_delta_ms:
+                found.append((app, name, 'p95 ms', then['p95_ms'], now['p95_ms']))
+            if now['rps'] < then['rps'] / (1 + tolerance) and now['mean_ms'] - then['mean_ms'] >= min_delta_ms:
+                found.append((app, name, 'req/s', then['rps'], now['rps']))
+            if now['errors'] > then['errors']:
+                found.append((app, name, 'errors', then['errors'], now['errors']))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--apps', nargs='+', default=list(APPS), choices=APPS)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--farmers', type=int, default=1000)
+    parser.add_argument('--products', type=int, default=5000)
+    parser.add_argument('--clients', type=int, default=4, help='concurrent clients, each logged in as its own user')
+    parser.add_argument('--requests', type=int, default=100, help='timed requests per route')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='JSON', help='write the results here as a baseline')
+    parser.add_argument('--baseline', metavar='JSON', help='compare against a saved baseline; exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative change (default: 25%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='ignore latency growth smaller than this')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        return worker(args)
+
+    results = {}
+    failed = []
+    for app in args.apps:
+        result = run_app(app, args)
+        if result is None:
+            failed.append(app)
+            continue
+        results[app] = result
+        report(result)
+    summary(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'created': int(time.time()), 'python': sys.version.split()[0], 'results': results}, f, indent=1)
+        print(f'\nbaseline saved to {args.save}')
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        found = regressions(results, baseline, args.tolerance, args.min_delta_ms)
+        print(f'\n{len(found)} regressions against {args.baseline}')
+        for app, name, what, then, now in found:
+            print(f'  {app:<18} {name:<34} {what:<7} {then} -> {now}')
+        if found:
+            sys.exit(1)
+    if failed:
+        sys.exit(f"\nno results for {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Boot time of index.py's in-memory database: DDL and seed inserts vs. snapshot restore.
+
+For each size a snapshot holding that many products is built once, then
+index.py is imported in fresh interpreters (what a new serverless instance
+does) and the database part of the boot is read from its boot report:
+
+  ddl        no snapshot: create_all, FTS tables and triggers, sample rows
+  ddl+rows   the same plus inserting the products, i.e. rebuilding that state
+  snapshot   the finished database copied in with the SQLite backup API
+
+    python benchmarks/bench_snapshot_boot.py --sizes 0 10000 100000 --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+BOOT = 'import index; print(index.boot_report["source"], index.boot_report["ms"])'
+
+SEED = r'''
+import time
+import index
+from index import app, db, Addagroproducts
+from snapshot import save
+rows = [{{'username': 'farmer', 'email': f'farmer{{pid % 500}}@farm.test', 'productname': f'Product {{pid}}',
+          'productdesc': 'Fresh produce from the farm', 'price': 100 + pid % 50,
+          'category': ('Vegetables', 'Fruits', 'Grains')[pid % 3], 'quantity': '50 kg',
+          'quantityAmount': 50.0, 'quantityUnit': 'kg', 'basePrice': 90, 'available': True}}
+        for pid in range(1, {n} + 1)]
+with app.app_context():
+    start = time.perf_counter()
+    if rows:
+        with db.engine.begin() as conn:
+            conn.execute(Addagroproducts.__table__.insert(), rows)
+    seconds = time.perf_counter() - start
+    save(db.engine, {path!r}, index.snapshot_version)
+print(index.boot_report['ms'] + seconds * 1e3)
+'''
+
+
+def run(code, snapshot):
+    env = dict(os.environ, DB_SNAPSHOT=snapshot, PYTHONPATH=ROOT)
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True).stdout.split()
+
+
+def best_boot(snapshot, repeat):
+    times = []
+    for _ in range(repeat):
+        source, ms = run(BOOT, snapshot)[-2:]
+        times.append(float(ms))
+    return source, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    _, ddl_ms = best_boot('', args.repeat)
+    print(f"{'products':>9} {'ddl ms':>8} {'ddl+rows ms':>12} {'snapshot ms':>12} {'snapshot KB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = os.path.join(tmp, f'{n}.db')
+            rebuild_ms = float(run(SEED.format(n=n, path=path), path)[-1])
+            source, snapshot_ms = best_boot(path, args.repeat)
+            assert source == 'snapshot', source
+            print(f'{n:>9} {ddl_ms:>8.1f} {rebuild_ms:>12.1f} {snapshot_ms:>12.1f} {os.path.getsize(path) / 1024:>12.0f}')
+    # the children wrote nothing else, but flask-sqlalchemy may have created instance/
+    instance = os.path.join(ROOT, 'instance')
+    if os.path.isdir(instance) and not os.listdir(instance):
+        os.rmdir(instance)
+
+
+if __name__ == '__main__':
+    main()
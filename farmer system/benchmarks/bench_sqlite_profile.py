@@ -0,0 +1,111 @@
+"""Concurrent read/write throughput of each SQLITE_PROFILE under N threads.
+
+Every thread runs a mix of primary-key reads, small catalog pages and
+single-row insert+commit writes against a file database for a fixed time.
+Lock errors are counted rather than retried, like a request would fail.
+
+    python benchmarks/bench_sqlite_profile.py --threads 1 4 16 --seconds 3
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sqlite_profile import PROFILES, apply_profile, engine_options  # noqa: E402
+
+SCHEMA = """CREATE TABLE addagroproducts (
+    pid INTEGER PRIMARY KEY, productname VARCHAR(100), category VARCHAR(50),
+    price INTEGER, available BOOLEAN)"""
+
+
+def make_engine(path, profile, threads):
+    uri = f'sqlite:///{path}'
+    options = engine_options(uri, profile)
+    if options:
+        options['pool_size'] = max(options['pool_size'], threads)
+    else:
+        # SQLite's default pool is too small for the thread counts here
+        options = {'pool_size': threads, 'max_overflow': 0}
+    engine = create_engine(uri, **options)
+    apply_profile(engine, profile)
+    return engine
+
+
+def seed(engine, rows):
+    with engine.begin() as conn:
+        conn.execute(text(SCHEMA))
+        conn.execute(text('INSERT INTO addagroproducts (productname, category, price, available) '
+                          'VALUES (:n, :c, :p, 1)'),
+                     [{'n': f'p{i}', 'c': 'Fruits', 'p': i % 500} for i in range(rows)])
+
+
+def worker(engine, rows, write_ratio, deadline, counts, lock):
+    reads = writes = errors = 0
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        try:
+            with engine.connect() as conn:
+                if rng.random() < write_ratio:
+                    conn.execute(text('INSERT INTO addagroproducts (productname, category, price, available) '
+                                      "VALUES ('new', 'Grains', 10, 1)"))
+                    conn.commit()
+                    writes += 1
+                elif rng.random() < 0.5:
+                    conn.execute(text('SELECT * FROM addagroproducts WHERE pid = :pid'),
+                                 {'pid': rng.randint(1, rows)}).first()
+                    reads += 1
+                else:
+                    conn.execute(text('SELECT * FROM addagroproducts WHERE pid > :pid ORDER BY pid LIMIT 24'),
+                                 {'pid': rng.randint(1, rows)}).all()
+                    reads += 1
+        except OperationalError:
+            errors += 1
+    with lock:
+        counts['reads'] += reads
+        counts['writes'] += writes
+        counts['errors'] += errors
+
+
+def run(profile, threads, seconds, rows, write_ratio):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(os.path.join(tmp, 'bench.db'), profile, threads)
+        seed(engine, rows)
+        counts = {'reads': 0, 'writes': 0, 'errors': 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+        pool = [threading.Thread(target=worker, args=(engine, rows, write_ratio, deadline, counts, lock))
+                for _ in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+        engine.dispose()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--seconds', type=float, default=3)
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--profiles', nargs='+', default=list(PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':>11} {'threads':>7} {'reads/s':>9} {'writes/s':>9} {'errors':>7}")
+    for profile in args.profiles:
+        for threads in args.threads:
+            counts = run(profile, threads, args.seconds, args.rows, args.write_ratio)
+            print(f"{profile:>11} {threads:>7} {counts['reads'] / args.seconds:>9.0f} "
+                  f"{counts['writes'] / args.seconds:>9.0f} {counts['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Bytes and time to fetch the assets of the home page, plain vs. built.
+
+Fetches every stylesheet and script linked from / through the WSGI stack,
+once from Flask's default static handler and once from the fingerprinted,
+pre-compressed build (run `python assets.py` first).
+
+    python benchmarks/bench_static_assets.py --rounds 50
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from index import app, assets_manifest  # noqa: E402
+
+
+def fetch_all(client, urls, rounds, headers):
+    sent = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            response = client.get(url, headers=headers)
+            sent += len(response.get_data())
+    return sent // rounds, (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+    if not assets_manifest:
+        sys.exit('no asset build found: run `python assets.py` first')
+
+    client = app.test_client()
+    built = re.findall(r'(?:href|src)="(/static/build/[^"]+)"', client.get('/').get_data(as_text=True))
+    originals = {hashed: path for path, hashed in assets_manifest.items()}
+    plain = ['/static/' + originals[url[len('/static/build/'):]] for url in built]
+
+    print(f"{len(built)} assets, averaged over {args.rounds} page loads")
+    print(f"{'variant':<24} {'bytes':>10} {'ms/page':>9}")
+    for label, urls, headers in [('plain static', plain, {}),
+                                 ('built, identity', built, {}),
+                                 ('built, gzip/br', built, {'Accept-Encoding': 'gzip, br'})]:
+        size, seconds = fetch_all(client, urls, args.rounds, headers)
+        print(f'{label:<24} {size:>10} {seconds * 1e3:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
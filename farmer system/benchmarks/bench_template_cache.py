@@ -0,0 +1,77 @@
+"""Cold-start time to first byte, with and without precompiled templates.
+
+Every run is a fresh interpreter, like a new serverless instance: it imports
+the app, then times the first GET / and the first GET /agroproducts
+through the WSGI stack. Four setups are compared:
+
+  off          nothing precompiled, every template is compiled on first use
+  empty        bytecode cache enabled but empty (no build step, e.g. Vercel before)
+  modules      the committed compiled_templates/ and an empty bytecode cache (Vercel now)
+  precompiled  bytecode cache filled by jinja_cache.precompile() at build time
+
+    python benchmarks/bench_template_cache.py --app api/complete.py --runs 15
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from jinja_cache import COMPILED_DIR, precompile  # noqa: E402
+
+CHILD = r'''
+import json, os, sys, time
+start = time.perf_counter()
+sys.path[:0] = [{root!r}, os.path.dirname({path!r})]
+module = __import__({module!r})
+imported = time.perf_counter()
+client = module.app.test_client()
+timings = {{'import': imported - start}}
+for url in ('/', '/agroproducts'):
+    t = time.perf_counter()
+    response = client.get(url)
+    response.get_data()
+    timings[url] = time.perf_counter() - t
+print(json.dumps(timings))
+'''
+
+
+def run_once(app_path, cache_dir, modules_dir):
+    env = dict(os.environ, JINJA_CACHE_DIR=cache_dir, JINJA_MODULES_DIR=modules_dir, DATABASE_URL='sqlite://')
+    module = os.path.splitext(os.path.basename(app_path))[0]
+    code = CHILD.format(root=os.path.abspath(ROOT), path=os.path.abspath(app_path), module=module)
+    out = subprocess.run([sys.executable, '-c', code], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--app', default=os.path.join(ROOT, 'api', 'complete.py'))
+    parser.add_argument('--runs', type=int, default=15)
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    try:
+        precompiled = os.path.join(scratch, 'precompiled')
+        precompile(precompiled)
+        setups = [('off', lambda: 'off', 'off'),
+                  ('empty', lambda: tempfile.mkdtemp(dir=scratch), 'off'),
+                  ('modules', lambda: tempfile.mkdtemp(dir=scratch), COMPILED_DIR),
+                  ('precompiled', lambda: precompiled, 'off')]
+        print(f"{os.path.relpath(args.app, ROOT)}, median of {args.runs} fresh processes (ms)")
+        print(f"{'setup':<12} {'import':>8} {'GET /':>8} {'GET /agroproducts':>18}")
+        for label, directory, modules in setups:
+            runs = [run_once(args.app, directory(), modules) for _ in range(args.runs)]
+            med = {key: statistics.median(r[key] for r in runs) * 1e3 for key in runs[0]}
+            print(f"{label:<12} {med['import']:>8.1f} {med['/']:>8.1f} {med['/agroproducts']:>18.1f}")
+    finally:
+        shutil.rmtree(scratch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""SQL statements per authenticated request with and without the user cache.
+
+Logs in once, then requests /myproducts and /farmerdetails through the
+index.py app, counting every statement the engine executes.
+
+    python benchmarks/bench_user_loader.py --requests 500
+"""
+import argparse
+import os
+import sys
+import time
+
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from index import Addagroproducts, Register, User, app, db, user_cache  # noqa: E402
+
+statements = 0
+
+
+def count(conn, cursor, statement, parameters, context, executemany):
+    global statements
+    statements += 1
+
+
+def seed():
+    with app.app_context():
+        db.session.add(User(username='bench', email='bench@farm.test', password='secret'))
+        db.session.add_all(Register(farmername=f'Farmer {i}', age=30) for i in range(50))
+        db.session.add_all(Addagroproducts(username='bench', email='bench@farm.test',
+                                           productname=f'Product {i}', productdesc='Fresh',
+                                           price=10 + i) for i in range(20))
+        db.session.commit()
+        event.listen(db.engine, 'before_cursor_execute', count)
+
+
+def run(client, path, requests):
+    global statements
+    statements = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(path)
+    return statements / requests, (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    seed()
+    client = app.test_client()
+    client.post('/login', data={'email': 'bench@farm.test', 'password': 'secret'})
+
+    print(f"{'route':>14} {'cache':>6} {'queries/req':>12} {'ms/req':>8}")
+    for path in ('/myproducts', '/farmerdetails'):
+        for maxsize in (0, 1024):
+            user_cache.maxsize = maxsize
+            user_cache.clear()
+            queries, seconds = run(client, path, args.requests)
+            print(f"{path:>14} {'on' if maxsize else 'off':>6} {queries:>12.2f} {seconds * 1e3:>8.2f}")
+    print('cache stats:', user_cache.stats())
+
+
+if __name__ == '__main__':
+    main()
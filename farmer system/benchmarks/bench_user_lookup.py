@@ -0,0 +1,69 @@
+"""Login lookup cost in the in-memory api/complete.py store as users grow.
+
+Compares the old linear scan over users_db with the users_by_email index,
+both as a bare lookup and as a full POST /login through the Flask app.
+
+    python benchmarks/bench_user_lookup.py --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'api'))
+import complete  # noqa: E402
+
+
+def seed(n):
+    complete.users_db.clear()
+    complete.users_by_email.clear()
+    password = complete.hasher.hash('secret')  # one hash shared by every user
+    for user_id in range(1, n + 1):
+        complete.add_user(complete.User(id=user_id, username=f'user{user_id}',
+                                        email=f'user{user_id}@farm.test', password=password))
+
+
+def scan_lookup(email):
+    for user_id, user in complete.users_db.items():
+        if user.email == email:
+            return user_id
+
+
+def index_lookup(email):
+    return complete.users_by_email.get(email)
+
+
+def time_per_call(fn, emails):
+    start = time.perf_counter()
+    for email in emails:
+        fn(email)
+    return (time.perf_counter() - start) / len(emails)
+
+
+def time_login(client, emails):
+    start = time.perf_counter()
+    for email in emails:
+        client.post('/login', data={'email': email, 'password': 'secret'})
+    return (time.perf_counter() - start) / len(emails)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--lookups', type=int, default=200)
+    args = parser.parse_args()
+
+    client = complete.app.test_client()
+    print(f"{'users':>8} {'scan us':>10} {'index us':>10} {'login ms':>10}")
+    for n in args.sizes:
+        seed(n)
+        emails = [f'user{random.randint(1, n)}@farm.test' for _ in range(args.lookups)]
+        scan = time_per_call(scan_lookup, emails)
+        index = time_per_call(index_lookup, emails)
+        login = time_login(client, emails)
+        print(f'{n:>8} {scan * 1e6:>10.1f} {index * 1e6:>10.3f} {login * 1e3:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
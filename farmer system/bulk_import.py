@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+
+from sqlalchemy import Boolean, Float, Integer, String
+
+from quantity import derive_row
+
+# Rows are validated one at a time as the file streams in and inserted with
+# executemany, one transaction per batch, so memory stays flat and a bad
+# row only costs its own line in the report.
+BATCH_SIZE = 10000
+MAX_REPORTED_ERRORS = 1000
+
+# Columns a row must have for each importable table
+REQUIRED = {
+    'register': ('farmername',),
+    'addagroproducts': ('productname', 'price'),
+}
+
+# Columns computed from other fields of a row before it is validated
+DERIVED = {
+    'addagroproducts': derive_row,
+}
+
+TRUE_VALUES = {'1', 'true', 'yes', 'on', 'y'}
+FALSE_VALUES = {'0', 'false', 'no', 'off', 'n', ''}
+
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []
+
+    def error(self, line, message):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'error': message})
+
+    def to_dict(self):
+        return {'inserted': self.inserted, 'failed': self.failed, 'errors': self.errors}
+
+
+def read_rows(stream, fmt):
+    """Yield (line number, dict) from a binary CSV or NDJSON stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt in ('ndjson', 'jsonl'):
+        for line_num, line in enumerate(text, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_num, e
+                continue
+            yield line_num, row if isinstance(row, dict) else ValueError('expected a JSON object')
+    else:
+        raise ValueError(f'Unsupported import format: {fmt}')
+
+
+def detect_format(filename, fmt=None):
+    if fmt:
+        return fmt.lower()
+    return 'csv' if (filename or '').lower().endswith('.csv') else 'ndjson'
+
+
+def _parser(column):
+    """Build a value converter from the model column type"""
+    name = column.key
+    if isinstance(column.type, Boolean):
+        def parse(value):
+            if isinstance(value, bool) or value is None:
+                return value
+            value = str(value).strip().lower()
+            if value in TRUE_VALUES:
+                return True
+            if value in FALSE_VALUES:
+                return False
+            raise ValueError(f'{name}: not a boolean')
+    elif isinstance(column.type, Integer):
+        def parse(value):
+            if value is None or value == '':
+                return None
+            # NDJSON numbers arrive as int or float: int() would silently truncate 2.5 to 2
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError(f'{name}: not an integer')
+            try:
+                return int(value)
+            except (TypeError, ValueError, OverflowError):
+                raise ValueError(f'{name}: not an integer') from None
+    elif isinstance(column.type, Float):
+        def parse(value):
+            if value is None or value == '':
+                return None
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f'{name}: not a number') from None
+    else:
+        length = column.type.length if isinstance(column.type, String) else None
+
+        def parse(value):
+            if value is None:
+                return None
+            value = str(value)
+            if length and len(value) > length:
+                raise ValueError(f'{name}: longer than {length} characters')
+            return value
+    return parse
+
+
+class Importer:
+    """Validates rows for one table and inserts them in executemany batches"""
+
+    def __init__(self, model):
+        table = model.__table__
+        self.columns = [c for c in table.columns if not c.primary_key]
+        self.names = [c.key for c in self.columns]
+        self.parsers = [_parser(c) for c in self.columns]
+        self.defaults = [c.default.arg if c.default is not None and c.default.is_scalar else None
+                         for c in self.columns]
+        self.required = REQUIRED.get(table.name, ())
+        self.derive = DERIVED.get(table.name)
+        self.sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            table.name, ', '.join(self.names), ', '.join('?' * len(self.names)))
+
+    def validate(self, row):
+        for name in self.required:
+            if row.get(name) in (None, ''):
+                raise ValueError(f'{name}: required')
+        if self.derive is not None:
+            row = self.derive(dict(row))
+        values = []
+        for name, parse, default in zip(self.names, self.parsers, self.defaults):
+            value = parse(row.get(name))
+            values.append(default if value is None else value)
+        return tuple(values)
+
+    def run(self, engine, rows, batch_size=BATCH_SIZE):
+        report = ImportReport()
+        batch, lines = [], []
+        for line, row in rows:
+            if isinstance(row, Exception):
+                report.error(line, str(row))
+                continue
+            try:
+                batch.append(self.validate(row))
+                lines.append(line)
+            except ValueError as e:
+                report.error(line, str(e))
+                continue
+            if len(batch) >= batch_size:
+                self._flush(engine, batch, lines, report)
+                batch, lines = [], []
+        if batch:
+            self._flush(engine, batch, lines, report)
+        return report
+
+    def _flush(self, engine, batch, lines, report):
+        try:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(self.sql, batch)
+            report.inserted += len(batch)
+        except Exception as e:
+            # the whole chunk rolled back; report it against its line range
+            report.error(f'{lines[0]}-{lines[-1]}', f'batch rejected: {e}')
+            report.failed += len(batch) - 1
+
+
+def import_file(engine, model, stream, fmt, batch_size=BATCH_SIZE):
+    """Stream a CSV/NDJSON file into `model`'s table and return an ImportReport"""
+    return Importer(model).run(engine, read_rows(stream, fmt), batch_size)
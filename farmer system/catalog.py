@@ -0,0 +1,170 @@
+import base64
+from bisect import bisect_right
+
+from quantity import DEFAULT_UNIT, unit_of
+
+# Default and maximum number of products shown per page
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(pid):
+    """Turn the last pid of a page into an opaque next-page token"""
+    return base64.urlsafe_b64encode(str(pid).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Return the pid encoded in a next-page token, or None for the first page"""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def page_size(args, config):
+    """Read the page size from the request, falling back to the app config"""
+    default = config.get('PRODUCTS_PER_PAGE', DEFAULT_PAGE_SIZE)
+    limit = args.get('per_page', default, type=int)
+    return max(1, min(limit, config.get('PRODUCTS_MAX_PER_PAGE', MAX_PAGE_SIZE)))
+
+
+def product_filters(args):
+    """Parse the category / availability / price / quantity-range filters of a request.
+
+    Quantities are converted to the canonical unit they are stored in, so
+    ?min_qty=500&unit=g becomes 0.5 kg; a range without a unit is in kg.
+    """
+    available = args.get('available', '').lower()
+    min_qty = args.get('min_qty', type=float)
+    max_qty = args.get('max_qty', type=float)
+    unit, factor = unit_of(args.get('unit'))
+    if unit is None and (min_qty is not None or max_qty is not None):
+        unit, factor = DEFAULT_UNIT, 1
+    return {
+        'category': args.get('category') or None,
+        'available': {'1': True, 'true': True, '0': False, 'false': False}.get(available),
+        'min_price': args.get('min_price', type=int),
+        'max_price': args.get('max_price', type=int),
+        'unit': unit,
+        'min_qty': min_qty * factor if min_qty is not None else None,
+        'max_qty': max_qty * factor if max_qty is not None else None,
+    }
+
+
+def filter_query(query, model, filters):
+    """Apply product_filters() to a SQLAlchemy query on Addagroproducts"""
+    if filters['category']:
+        query = query.filter(model.category == filters['category'])
+    if filters['available'] is not None:
+        query = query.filter(model.available == filters['available'])
+    if filters['min_price'] is not None:
+        query = query.filter(model.price >= filters['min_price'])
+    if filters['max_price'] is not None:
+        query = query.filter(model.price <= filters['max_price'])
+    # (quantityUnit, quantityAmount) is indexed, so a quantity range is one index range scan
+    if filters['unit'] is not None:
+        query = query.filter(model.quantityUnit == filters['unit'])
+    if filters['min_qty'] is not None:
+        query = query.filter(model.quantityAmount >= filters['min_qty'])
+    if filters['max_qty'] is not None:
+        query = query.filter(model.quantityAmount <= filters['max_qty'])
+    return query
+
+
+# columns the catalog filters and keyset pages on, all of them in the products table from the start
+INDEXED_COLUMNS = {'pid', 'price', 'category', 'available'}
+
+
+def install(engine, table):
+    """Create the catalog's filter and pagination indexes on an existing products table"""
+    with engine.begin() as conn:
+        for index in table.indexes:
+            if {c.name for c in index.columns} <= INDEXED_COLUMNS:
+                index.create(conn, checkfirst=True)
+
+
+def product_matches(product, filters):
+    """Apply product_filters() to an in-memory product dict"""
+    if filters['category'] and product.get('category') != filters['category']:
+        return False
+    if filters['available'] is not None and bool(product.get('available')) != filters['available']:
+        return False
+    if filters['min_price'] is not None or filters['max_price'] is not None:
+        try:
+            price = int(product.get('price'))
+        except (TypeError, ValueError):
+            return False
+        if filters['min_price'] is not None and price < filters['min_price']:
+            return False
+        if filters['max_price'] is not None and price > filters['max_price']:
+            return False
+    if filters['unit'] is not None and product.get('quantityUnit') != filters['unit']:
+        return False
+    amount = product.get('quantityAmount')
+    if filters['min_qty'] is not None and (amount is None or amount < filters['min_qty']):
+        return False
+    if filters['max_qty'] is not None and (amount is None or amount > filters['max_qty']):
+        return False
+    return True
+
+
+def keyset_page(query, column, after, limit):
+    """Fetch one page of a SQLAlchemy query ordered by `column`.
+
+    Seeks past `after` with `column > after` instead of using OFFSET, so every
+    page is a single index range scan no matter how deep it is.
+    """
+    if after is not None:
+        query = query.filter(column > after)
+    rows = query.order_by(column).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], column.key))
+    return rows, next_cursor
+
+
+def keyset_slice(sorted_ids, after, limit, keep=None):
+    """Same as keyset_page for an in-memory sorted list of ids.
+
+    `keep` is an optional predicate on the id; ids are scanned from the
+    cursor only until a page worth of matches has been found.
+    """
+    start = bisect_right(sorted_ids, after) if after is not None else 0
+    if keep is None:
+        ids = sorted_ids[start:start + limit + 1]
+    else:
+        ids = []
+        for i in range(start, len(sorted_ids)):
+            pid = sorted_ids[i]
+            if keep(pid):
+                ids.append(pid)
+                if len(ids) > limit:
+                    break
+    next_cursor = None
+    if len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = encode_cursor(ids[-1])
+    return ids, next_cursor
+
+
+def product_json(p):
+    """Serialise a product row or dict for the JSON catalog"""
+    get = p.get if isinstance(p, dict) else lambda key: getattr(p, key, None)
+    return {
+        'pid': get('pid'),
+        'productname': get('productname'),
+        'productdesc': get('productdesc'),
+        'price': get('price'),
+        'basePrice': get('basePrice'),
+        'category': get('category'),
+        'quantity': get('quantity'),
+        'quantityAmount': get('quantityAmount'),
+        'quantityUnit': get('quantityUnit'),
+        'image': get('image'),
+        'username': get('username'),
+        'available': bool(get('available')),
+    }
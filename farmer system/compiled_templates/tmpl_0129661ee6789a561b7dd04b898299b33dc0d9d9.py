@@ -0,0 +1,183 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'myproducts.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'myproducts.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nMy Products - Farmer Dashboard\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_products = resolve('products')
+    try:
+        t_1 = environment.filters['int']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'int' found.")
+    try:
+        t_2 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_3 = environment.filters['list']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No filter named 'list' found.")
+    try:
+        t_4 = environment.filters['rejectattr']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No filter named 'rejectattr' found.")
+    try:
+        t_5 = environment.filters['selectattr']
+    except KeyError:
+        @internalcode
+        def t_5(*unused):
+            raise TemplateRuntimeError("No filter named 'selectattr' found.")
+    try:
+        t_6 = environment.filters['sum']
+    except KeyError:
+        @internalcode
+        def t_6(*unused):
+            raise TemplateRuntimeError("No filter named 'sum' found.")
+    pass
+    yield '\n<div class="container-fluid bg-light py-3">\n    <div class="container">\n        <h2 class="text-center mb-0"><i class="fas fa-store text-success"></i> My Products Dashboard</h2>\n        <p class="text-center text-muted">Manage your listed products</p>\n    </div>\n</div>\n\n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n    <button type="button" class="btn-close" data-bs-dismiss="alert"></button>\n</div>\n'
+        l_2_category = l_2_message = missing
+        yield '\n'
+    yield '\n'
+    l_1_messages = missing
+    yield '\n\n<div class="container mt-4">\n    <div class="d-flex justify-content-between align-items-center mb-4">\n        <h4>Your Listed Products ('
+    yield escape(t_2((undefined(name='products') if l_0_products is missing else l_0_products)))
+    yield ' items)</h4>\n        <a href="/addagroproduct" class="btn btn-success">\n            <i class="fas fa-plus"></i> Add New Product\n        </a>\n    </div>\n\n    '
+    if (undefined(name='products') if l_0_products is missing else l_0_products):
+        pass
+        yield '\n    <div class="row">\n        '
+        for l_1_p in (undefined(name='products') if l_0_products is missing else l_0_products):
+            _loop_vars = {}
+            pass
+            yield '\n        <div class="col-lg-4 col-md-6 mb-4">\n            <div class="card h-100 shadow-sm">\n                '
+            if environment.getattr(l_1_p, 'image'):
+                pass
+                yield '\n                <img src="'
+                yield escape(environment.getattr(l_1_p, 'image'))
+                yield '" class="card-img-top" style="height: 200px; object-fit: cover;" alt="'
+                yield escape(environment.getattr(l_1_p, 'productname'))
+                yield '">\n                '
+            else:
+                pass
+                yield '\n                <div class="card-img-top bg-light d-flex align-items-center justify-content-center" style="height: 200px;">\n                    <i class="fas fa-seedling fa-3x text-success"></i>\n                </div>\n                '
+            yield '\n                \n                <div class="card-body">\n                    <div class="d-flex justify-content-between align-items-start mb-2">\n                        <h6 class="card-title fw-bold">'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '</h6>\n                        '
+            if environment.getattr(l_1_p, 'available'):
+                pass
+                yield '\n                        <span class="badge bg-success">Available</span>\n                        '
+            else:
+                pass
+                yield '\n                        <span class="badge bg-secondary">Out of Stock</span>\n                        '
+            yield '\n                    </div>\n                    \n                    '
+            if environment.getattr(l_1_p, 'category'):
+                pass
+                yield '\n                    <small class="text-muted">'
+                yield escape(environment.getattr(l_1_p, 'category'))
+                yield '</small>\n                    '
+            yield '\n                    \n                    <p class="card-text text-muted small">'
+            yield escape((environment.getattr(l_1_p, 'productdesc') or '')[:60])
+            if (t_2((environment.getattr(l_1_p, 'productdesc') or '')) > 60):
+                pass
+                yield '...'
+            yield '</p>\n                    \n                    <div class="mb-3">\n                        <div class="d-flex justify-content-between">\n                            <span><strong>Price:</strong> ₹'
+            yield escape(environment.getattr(l_1_p, 'price'))
+            yield '</span>\n                            '
+            if environment.getattr(l_1_p, 'quantity'):
+                pass
+                yield '\n                            <span><strong>Qty:</strong> '
+                yield escape(environment.getattr(l_1_p, 'quantity'))
+                yield '</span>\n                            '
+            yield '\n                        </div>\n                        '
+            if (environment.getattr(l_1_p, 'basePrice') and (environment.getattr(l_1_p, 'basePrice') != environment.getattr(l_1_p, 'price'))):
+                pass
+                yield '\n                        <small class="text-muted">Base Price: ₹'
+                yield escape(environment.getattr(l_1_p, 'basePrice'))
+                yield '</small>\n                        '
+            yield '\n                    </div>\n                </div>\n                \n                <div class="card-footer bg-transparent">\n                    <div class="d-grid gap-2">\n                        <a href="/toggle_availability/'
+            yield escape(environment.getattr(l_1_p, 'pid'))
+            yield '" class="btn btn-sm '
+            if environment.getattr(l_1_p, 'available'):
+                pass
+                yield 'btn-warning'
+            else:
+                pass
+                yield 'btn-success'
+            yield '">\n                            '
+            if environment.getattr(l_1_p, 'available'):
+                pass
+                yield '\n                            <i class="fas fa-pause"></i> Mark Unavailable\n                            '
+            else:
+                pass
+                yield '\n                            <i class="fas fa-play"></i> Mark Available\n                            '
+            yield '\n                        </a>\n                        <div class="btn-group" role="group">\n                            <button type="button" class="btn btn-outline-primary btn-sm" onclick="editProduct('
+            yield escape(environment.getattr(l_1_p, 'pid'))
+            yield ')">\n                                <i class="fas fa-edit"></i> Edit\n                            </button>\n                            <button type="button" class="btn btn-outline-danger btn-sm" onclick="deleteProduct('
+            yield escape(environment.getattr(l_1_p, 'pid'))
+            yield ')">\n                                <i class="fas fa-trash"></i> Delete\n                            </button>\n                        </div>\n                    </div>\n                </div>\n            </div>\n        </div>\n        '
+        l_1_p = missing
+        yield '\n    </div>\n    \n    <!-- Summary Stats -->\n    <div class="row mt-4">\n        <div class="col-md-3">\n            <div class="card text-center bg-success text-white">\n                <div class="card-body">\n                    <h4>'
+        yield escape(t_2(t_3(context.eval_ctx, t_5(context, (undefined(name='products') if l_0_products is missing else l_0_products), 'available'))))
+        yield '</h4>\n                    <p class="mb-0">Available Products</p>\n                </div>\n            </div>\n        </div>\n        <div class="col-md-3">\n            <div class="card text-center bg-secondary text-white">\n                <div class="card-body">\n                    <h4>'
+        yield escape(t_2(t_3(context.eval_ctx, t_4(context, (undefined(name='products') if l_0_products is missing else l_0_products), 'available'))))
+        yield '</h4>\n                    <p class="mb-0">Out of Stock</p>\n                </div>\n            </div>\n        </div>\n        <div class="col-md-3">\n            <div class="card text-center bg-info text-white">\n                <div class="card-body">\n                    <h4>'
+        yield escape(t_2((undefined(name='products') if l_0_products is missing else l_0_products)))
+        yield '</h4>\n                    <p class="mb-0">Total Products</p>\n                </div>\n            </div>\n        </div>\n        <div class="col-md-3">\n            <div class="card text-center bg-warning text-white">\n                <div class="card-body">\n                    <h4>₹'
+        yield escape(t_1(t_6(environment, (undefined(name='products') if l_0_products is missing else l_0_products), attribute='price')))
+        yield '</h4>\n                    <p class="mb-0">Total Value</p>\n                </div>\n            </div>\n        </div>\n    </div>\n    \n    '
+    else:
+        pass
+        yield '\n    <div class="text-center py-5">\n        <i class="fas fa-seedling fa-4x text-muted mb-3"></i>\n        <h4 class="text-muted">No products listed yet</h4>\n        <p class="text-muted">Start selling by adding your first product!</p>\n        <a href="/addagroproduct" class="btn btn-success btn-lg">\n            <i class="fas fa-plus"></i> Add Your First Product\n        </a>\n    </div>\n    '
+    yield "\n</div>\n\n<script>\nfunction editProduct(pid) {\n    // For now, redirect to add product page\n    // In a full implementation, you'd have an edit form\n    alert('Edit functionality coming soon! Product ID: ' + pid);\n}\n\nfunction deleteProduct(pid) {\n    if (confirm('Are you sure you want to delete this product?')) {\n        // In a full implementation, you'd make an AJAX call to delete\n        alert('Delete functionality coming soon! Product ID: ' + pid);\n    }\n}\n</script>\n"
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&6=27&15=77&16=80&17=84&18=86&27=93&33=95&35=98&38=102&39=105&48=113&49=115&56=122&57=125&60=128&64=133&65=135&66=138&69=141&70=144&77=147&78=156&85=163&88=165&104=169&112=171&120=173&128=175'
\ No newline at end of file
@@ -0,0 +1,98 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'triggers.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'triggers.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nTriggers\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_request = resolve('request')
+    l_0_query = resolve('query')
+    l_0_next_cursor = resolve('next_cursor')
+    l_0_dict = resolve('dict')
+    try:
+        t_1 = environment.filters['epoch']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'epoch' found.")
+    try:
+        t_2 = environment.filters['urlencode']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'urlencode' found.")
+    pass
+    yield '\n <h3 class="text-center"><span>Farmers Triggers Records</span> </h3>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<br>\n\n<div class="container mt-4">\n<form method="GET" action="'
+    yield escape(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'path'))
+    yield '" class="form-inline mb-3">\n  <label class="mr-2" for="from">From</label>\n  <input type="date" id="from" name="from" value="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'get'), 'from', '', _block_vars=_block_vars))
+    yield '" class="form-control mr-3">\n  <label class="mr-2" for="to">To</label>\n  <input type="date" id="to" name="to" value="'
+    yield escape(context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'get'), 'to', '', _block_vars=_block_vars))
+    yield '" class="form-control mr-3">\n  <button type="submit" class="btn btn-outline-success">Filter</button>\n</form>\n<table class="table">\n  <thead class="thead-light">\n    <tr>\n   \n      <th scope="col">RECORD ID</th>\n      <th scope="col">ACTION</th>\n      <th scope="col">TIMESTAMP</th>\n\n\n    </tr>\n  </thead>\n  <tbody>\n  '
+    for l_1_post in (undefined(name='query') if l_0_query is missing else l_0_query):
+        _loop_vars = {}
+        pass
+        yield '\n    <tr>\n      \n      <td>'
+        yield escape(environment.getattr(l_1_post, 'fid'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'action'))
+        yield '</td>\n      <td>'
+        yield escape(t_1(environment.getattr(l_1_post, 'timestamp')))
+        yield '</td>\n     \n  \n    </tr>\n'
+    l_1_post = missing
+    yield '\n  \n  </tbody>\n</table>\n'
+    if (undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor):
+        pass
+        yield '\n<div class="text-center mb-4">\n  <a href="?'
+        yield escape(t_2(context.call((undefined(name='dict') if l_0_dict is missing else l_0_dict), context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'items'), _block_vars=_block_vars), cursor=(undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor), _block_vars=_block_vars)))
+        yield '" class="btn btn-outline-success">\n    Older Events <i class="fas fa-arrow-right"></i>\n  </a>\n</div>\n'
+    yield '\n</div>\n\n\n\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&8=27&12=56&13=59&15=63&16=65&26=72&28=74&30=76&45=78&48=82&49=84&50=86&58=90&60=93'
\ No newline at end of file
@@ -0,0 +1,38 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = '404.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', '404.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield 'Page Not Found'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n<div class="container mt-5">\n    <div class="row justify-content-center">\n        <div class="col-md-6 text-center">\n            <h1 class="display-1">404</h1>\n            <h2>Page Not Found</h2>\n            <p class="lead">The page you\'re looking for doesn\'t exist.</p>\n            <a href="/" class="btn btn-success">Go Home</a>\n        </div>\n    </div>\n</div>\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&4=27'
\ No newline at end of file
@@ -0,0 +1,116 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'auth.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_static_url = resolve('static_url')
+    l_0_image_srcset = resolve('image_srcset')
+    l_0_url_for = resolve('url_for')
+    l_0_bg = missing
+    try:
+        t_1 = environment.filters['reverse']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'reverse' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n  <meta charset="utf-8">\n  <meta content="width=device-width, initial-scale=1.0" name="viewport">\n\n  <title>'
+    yield from context.blocks['title'][0](context)
+    yield '</title>\n  <meta content="" name="description">\n  <meta content="" name="keywords">\n\n'
+    yield from context.blocks['style'][0](context)
+    yield '\n  <link href="https://fonts.googleapis.com/css?family=Open+Sans:300,300i,400,400i,700,700i|Raleway:300,400,500,700,800" rel="stylesheet">\n\n  <!-- Vendor CSS Files -->\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/bootstrap/css/bootstrap.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/venobox/venobox.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/font-awesome/css/font-awesome.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/owl.carousel/assets/owl.carousel.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/aos/aos.css'))
+    yield '" rel="stylesheet">\n\n  <!-- Template Main CSS File -->\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/css/style.css'))
+    yield '" rel="stylesheet">\n'
+    l_0_bg = context.call((undefined(name='image_srcset') if l_0_image_srcset is missing else l_0_image_srcset), context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/bg.jpg'))
+    context.vars['bg'] = l_0_bg
+    context.exported_vars.add('bg')
+    yield '\n'
+    if (undefined(name='bg') if l_0_bg is missing else l_0_bg):
+        pass
+        yield '\n  <!-- smallest derivative that still covers the viewport; wider screens keep the original from style.css -->\n  <style>\n  '
+        for (l_1_w, l_1_h, l_1_webp, l_1_jpeg) in t_1(environment.getattr((undefined(name='bg') if l_0_bg is missing else l_0_bg), 'sizes')):
+            _loop_vars = {}
+            pass
+            yield '\n    @media (max-width: '
+            yield escape(l_1_w)
+            yield 'px) and (max-height: '
+            yield escape(l_1_h)
+            yield 'px) { #intro { background-image: url('
+            yield escape(l_1_jpeg)
+            yield '); background-image: image-set(url('
+            yield escape(l_1_webp)
+            yield ') type("image/webp"), url('
+            yield escape(l_1_jpeg)
+            yield ') type("image/jpeg")); } }\n  '
+        l_1_w = l_1_h = l_1_webp = l_1_jpeg = missing
+        yield '\n  </style>\n'
+    yield '\n\n \n</head>\n\n<body>\n\n  <!-- ======= Header ======= -->\n  <header id="header">\n    <div class="container">\n\n      <div id="logo" class="pull-left">\n\n        <a href="/" class="scrollto">Farm Management</a>\n      </div>\n\n      \n    </div>\n  </header><!-- End Header -->\n\n  <!-- ======= Intro Section ======= -->\n  <section id="intro">\n    <div class="intro-container" data-aos="zoom-in" data-aos-delay="100">\n    '
+    yield from context.blocks['content'][0](context)
+    yield '\n    </div>\n  </section><!-- End Intro Section -->\n\n<div class="main">\n\n  <!-- ======= Footer ======= -->\n  <footer id="footer">\n    <div class="footer-top">\n      <div class="container">\n       \n    </div>\n\n    <div class="container">\n   \n      <div class="credits">\n      <br>\n        Developed by <a href="/">Akshay Gangurde</a>\n      </div>\n    </div>\n  </footer><!-- End  Footer -->\n\n\n  <a href="#" class="back-to-top"><i class="fa fa-angle-up"></i></a>\n\n  <!-- Vendor JS Files -->\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/jquery/jquery.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/bootstrap/js/bootstrap.bundle.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/jquery.easing/jquery.easing.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/php-email-form/validate.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/venobox/venobox.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/owl.carousel/owl.carousel.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/superfish/superfish.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/hoverIntent/hoverIntent.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/aos/aos.js'))
+    yield '"></script>\n\n  <!-- Template Main JS File -->\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/js/main.js'))
+    yield '"></script>\n\n</body>\n\n</html>'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+
+def block_style(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n \n'
+
+blocks = {'title': block_title, 'style': block_style, 'content': block_content}
+debug_info = '8=22&13=24&18=26&19=28&20=30&21=32&22=34&25=36&26=38&27=42&30=45&31=49&57=62&85=64&86=66&87=68&88=70&89=72&90=74&91=76&92=78&93=80&96=82&8=85&13=95&57=105'
\ No newline at end of file
@@ -0,0 +1,58 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'signup.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('auth.html', 'signup.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nSignup\n\n'
+
+def block_content(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '\n <h1 class="mb-1"><span>Sign Up</span> </h1>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n\n\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<form class=" text-white py-3 px-3" action="/signup" method="post">\n <div class="form-group">\n    <label for="exampleInputPassword1">UserName</label>\n    <input type="text" class="form-control mb-2" name="username" id="username" required>\n  </div>\n  <div class="form-group">\n    <label for="exampleInputEmail1">Email address</label>\n    <input type="email" class="form-control mb-2" id="exampleInputEmail1" name="email" aria-describedby="emailHelp" required>\n    <small id="emailHelp" class="form-text text-muted">We\'ll never share your email with anyone else.</small>\n  </div>\n  <div class="form-group">\n    <label for="exampleInputPassword1">Password</label>\n    <input type="password" class="form-control mb-2" name="password" id="exampleInputPassword1" required>\n  </div>\n\n<br>\n  <button type="submit" class="form-control bg-success text-white">Sign In</button>\n   <p class="mb-2 pb-0">Already User?</p>\n    \n      <a href="/login" class="about-btn scrollto">Login</a>\n</form>\n     \n'
+
+blocks = {'title': block_title, 'content': block_content}
+debug_info = '1=12&2=17&6=27&10=40&11=43&13=47&14=49'
\ No newline at end of file
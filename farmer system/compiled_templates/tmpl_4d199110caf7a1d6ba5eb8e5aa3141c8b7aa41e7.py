@@ -0,0 +1,67 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'addagroproducts.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'addagroproducts.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nAdd AgroProducts\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_current_user = resolve('current_user')
+    pass
+    yield '\n <h3 class="text-center"><span>Add Agro Products</span> </h3>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<br>\n<div class="container">\n\n<div class="row">\n\n<div class="col-md-4"></div>\n<div class="col-md-4">\n\n<form action="/addagroproduct" method="post" enctype="multipart/form-data">\n<div class="form-group">\n<label for="username">Farmer Name</label>\n<input type="text" class="form-control" name="username" value="'
+    yield escape(environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'username'))
+    yield '" id="'
+    yield escape(environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'username'))
+    yield '" readonly>\n</div>\n<br>\n<div class="form-group">\n<label for="email">Farmer Email</label>\n<input type="email" class="form-control" name="email" value="'
+    yield escape(environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'email'))
+    yield '" id="'
+    yield escape(environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'email'))
+    yield '" readonly>\n</div>\n<br>\n<div class="form-group">\n<label for="productname">Product Name</label>\n<input type="text" class="form-control" name="productname" id="productname" placeholder="e.g., Fresh Tomatoes" required>\n</div>\n<br>\n<div class="form-group">\n<label for="category">Category</label>\n<select class="form-control" name="category" id="category" required>\n<option value="">Select Category</option>\n<option value="Vegetables">Vegetables</option>\n<option value="Fruits">Fruits</option>\n<option value="Grains">Grains</option>\n<option value="Dairy">Dairy</option>\n<option value="Spices">Spices</option>\n<option value="Organic">Organic</option>\n</select>\n</div>\n<br>\n<div class="form-group">\n<label for="productdesc">Product Description</label>\n<textarea class="form-control" name="productdesc" id="productdesc" placeholder="Describe your product quality, origin, etc." required></textarea>\n</div>\n<br>\n<div class="row">\n<div class="col-md-6">\n<div class="form-group">\n<label for="price">Selling Price (₹/kg)</label>\n<input type="number" class="form-control" name="price" id="price" placeholder="120" min="1" required>\n</div>\n</div>\n<div class="col-md-6">\n<div class="form-group">\n<label for="basePrice">Base Price (₹/kg)</label>\n<input type="number" class="form-control" name="basePrice" id="basePrice" placeholder="100" min="1">\n</div>\n</div>\n</div>\n<br>\n<div class="row">\n<div class="col-md-6">\n<div class="form-group">\n<label for="auctionStartTime">Auction Starts (optional)</label>\n<input type="datetime-local" class="form-control" name="auctionStartTime" id="auctionStartTime">\n</div>\n</div>\n<div class="col-md-6">\n<div class="form-group">\n<label for="auctionEndTime">Auction Ends (leave empty for no auction)</label>\n<input type="datetime-local" class="form-control" name="auctionEndTime" id="auctionEndTime">\n</div>\n</div>\n</div>\n<br>\n<div class="form-group">\n<label for="quantity">Available Quantity</label>\n<input type="text" class="form-control" name="quantity" id="quantity" placeholder="e.g., 50 kg, 100 pieces" required>\n</div>\n<br>\n<div class="form-group">\n<label for="image">Product Image URL</label>\n<input type="url" class="form-control" name="image" id="image" placeholder="https://example.com/image.jpg">\n</div>\n<div class="form-group">\n<label for="image_file">Or upload a photo</label>\n<input type="file" class="form-control" name="image_file" id="image_file" accept="image/jpeg,image/png,image/webp,image/gif">\n</div>\n<br>\n<div class="form-check">\n<input type="checkbox" class="form-check-input" name="available" id="available" checked>\n<label class="form-check-label" for="available">\nAvailable for Sale\n</label>\n</div>\n<br>\n<button type="submit" class="btn btn-success btn-block">List Product for Sale</button>\n</form>\n<br>\n<br>\n\n</div>\n\n<div class="col-md-4"></div>\n\n</div></div>\n\n\n\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&8=27&12=41&13=44&15=48&16=50&34=57&39=61'
\ No newline at end of file
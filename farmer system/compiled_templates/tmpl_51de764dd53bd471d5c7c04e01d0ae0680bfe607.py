@@ -0,0 +1,214 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'agroproducts.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'agroproducts.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nFresh Farm Products - Buy Direct from Farmers\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_product_count = resolve('product_count')
+    l_0_query = resolve('query')
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_filters = resolve('filters')
+    l_0_request = resolve('request')
+    l_0_q = resolve('q')
+    l_0_grid_html = resolve('grid_html')
+    l_0_next_cursor = resolve('next_cursor')
+    l_0_dict = resolve('dict')
+    l_0_current_user = resolve('current_user')
+    l_0_events_url = resolve('events_url')
+    l_0_active = l_0_feed_url = missing
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['urlencode']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'urlencode' found.")
+    try:
+        t_3 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_3(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    try:
+        t_4 = environment.tests['none']
+    except KeyError:
+        @internalcode
+        def t_4(*unused):
+            raise TemplateRuntimeError("No test named 'none' found.")
+    pass
+    yield '\n'
+    l_0_product_count = ((undefined(name='product_count') if l_0_product_count is missing else l_0_product_count) if t_3((undefined(name='product_count') if l_0_product_count is missing else l_0_product_count)) else t_1((undefined(name='query') if l_0_query is missing else l_0_query)))
+    _block_vars['product_count'] = l_0_product_count
+    yield '\n<div class="container-fluid bg-light py-3">\n    <div class="container">\n        <h2 class="text-center mb-0"><i class="fas fa-leaf text-success"></i> Fresh Farm Products</h2>\n        <p class="text-center text-muted">Buy fresh produce directly from local farmers</p>\n    </div>\n</div>\n\n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n    <button type="button" class="btn-close" data-bs-dismiss="alert"></button>\n</div>\n'
+        l_2_category = l_2_message = missing
+        yield '\n'
+    yield '\n'
+    l_1_messages = missing
+    yield '\n\n<div class="container mt-4">\n    <!-- Filter Section -->\n    <div class="row mb-4">\n        <div class="col-md-12">\n            <div class="d-flex justify-content-between align-items-center">\n                <h5>Available Products ('
+    yield escape((undefined(name='product_count') if l_0_product_count is missing else l_0_product_count))
+    yield ' items)</h5>\n                <div class="btn-group" role="group">\n                    '
+    l_0_active = (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'category') if (undefined(name='filters') if l_0_filters is missing else l_0_filters) else None)
+    _block_vars['active'] = l_0_active
+    yield '\n                    <a href="'
+    yield escape(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'path'))
+    if (undefined(name='q') if l_0_q is missing else l_0_q):
+        pass
+        yield '?q='
+        yield escape(t_2((undefined(name='q') if l_0_q is missing else l_0_q)))
+    yield '" class="btn btn-outline-secondary btn-sm'
+    if (not (undefined(name='active') if l_0_active is missing else l_0_active)):
+        pass
+        yield ' active'
+    yield '">All</a>\n                    '
+    for l_1_c in ['Vegetables', 'Fruits', 'Grains']:
+        _loop_vars = {}
+        pass
+        yield '\n                    <a href="?'
+        if (undefined(name='q') if l_0_q is missing else l_0_q):
+            pass
+            yield 'q='
+            yield escape(t_2((undefined(name='q') if l_0_q is missing else l_0_q)))
+            yield '&'
+        yield 'category='
+        yield escape(t_2(l_1_c))
+        yield '" class="btn btn-outline-secondary btn-sm'
+        if ((undefined(name='active') if l_0_active is missing else l_0_active) == l_1_c):
+            pass
+            yield ' active'
+        yield '">'
+        yield escape(l_1_c)
+        yield '</a>\n                    '
+    l_1_c = missing
+    yield '\n                </div>\n            </div>\n            <form method="get" action="/search" class="row g-2 mt-3">\n                <div class="col">\n                    <input type="search" class="form-control form-control-sm" name="q" placeholder="Search products, e.g. organic tomatoes" value="'
+    yield escape(((undefined(name='q') if l_0_q is missing else l_0_q) or ''))
+    yield '">\n                </div>\n                <div class="col-auto">\n                    <button type="submit" class="btn btn-success btn-sm"><i class="fas fa-search"></i> Search</button>\n                </div>\n            </form>\n            <form method="get" action="'
+    yield escape(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'path'))
+    yield '" class="row g-2 align-items-center mt-2">\n                '
+    if (undefined(name='q') if l_0_q is missing else l_0_q):
+        pass
+        yield '<input type="hidden" name="q" value="'
+        yield escape((undefined(name='q') if l_0_q is missing else l_0_q))
+        yield '">'
+    yield '\n                '
+    if (undefined(name='active') if l_0_active is missing else l_0_active):
+        pass
+        yield '<input type="hidden" name="category" value="'
+        yield escape((undefined(name='active') if l_0_active is missing else l_0_active))
+        yield '">'
+    yield '\n                <div class="col-auto">\n                    <input type="number" class="form-control form-control-sm" name="min_price" min="0" placeholder="Min ₹" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_price') if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and (not t_4(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_price')))) else ''))
+    yield '">\n                </div>\n                <div class="col-auto">\n                    <input type="number" class="form-control form-control-sm" name="max_price" min="0" placeholder="Max ₹" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_price') if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and (not t_4(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_price')))) else ''))
+    yield '">\n                </div>\n                <div class="col-auto">\n                    <input type="number" class="form-control form-control-sm" name="min_qty" min="0" step="any" placeholder="Min qty" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_qty') if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and (not t_4(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'min_qty')))) else ''))
+    yield '">\n                </div>\n                <div class="col-auto">\n                    <input type="number" class="form-control form-control-sm" name="max_qty" min="0" step="any" placeholder="Max qty" value="'
+    yield escape((environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_qty') if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and (not t_4(environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'max_qty')))) else ''))
+    yield '">\n                </div>\n                <div class="col-auto">\n                    <select class="form-select form-select-sm" name="unit">\n                        <option value="">Unit</option>\n                        '
+    for l_1_u in ['kg', 'l', 'piece', 'bag', 'crate', 'box', 'bunch']:
+        _loop_vars = {}
+        pass
+        yield '\n                        <option value="'
+        yield escape(l_1_u)
+        yield '"'
+        if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and (environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'unit') == l_1_u)):
+            pass
+            yield ' selected'
+        yield '>'
+        yield escape(l_1_u)
+        yield '</option>\n                        '
+    l_1_u = missing
+    yield '\n                    </select>\n                </div>\n                <div class="col-auto form-check ms-2">\n                    <input type="checkbox" class="form-check-input" name="available" value="1" id="available-only" '
+    if ((undefined(name='filters') if l_0_filters is missing else l_0_filters) and environment.getattr((undefined(name='filters') if l_0_filters is missing else l_0_filters), 'available')):
+        pass
+        yield 'checked'
+    yield '>\n                    <label class="form-check-label small" for="available-only">In stock only</label>\n                </div>\n                <div class="col-auto">\n                    <button type="submit" class="btn btn-success btn-sm">Filter</button>\n                </div>\n            </form>\n        </div>\n    </div>\n\n    <div id="new-products" class="alert alert-success d-none">\n        New listing: <strong id="new-products-name"></strong> &mdash; <a href="'
+    yield escape(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'full_path'))
+    yield '">refresh</a> to see it.\n    </div>\n\n    <!-- Products Grid -->\n    <div class="row">\n        '
+    if t_3((undefined(name='grid_html') if l_0_grid_html is missing else l_0_grid_html)):
+        pass
+        yield '\n        '
+        yield escape((undefined(name='grid_html') if l_0_grid_html is missing else l_0_grid_html))
+        yield '\n        '
+    else:
+        pass
+        yield '\n        '
+        template = environment.get_template('product_grid.html', 'agroproducts.html')
+        gen = template.root_render_func(template.new_context(context.get_all(), True, {'active': l_0_active, 'feed_url': l_0_feed_url, 'product_count': l_0_product_count}))
+        try:
+            for event in gen:
+                yield event
+        finally: gen.close()
+        yield '\n        '
+    yield '\n    </div>\n\n    '
+    if (undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor):
+        pass
+        yield '\n    <div class="text-center mb-4">\n        <a href="?'
+        yield escape(t_2(context.call((undefined(name='dict') if l_0_dict is missing else l_0_dict), context.call(environment.getattr(environment.getattr((undefined(name='request') if l_0_request is missing else l_0_request), 'args'), 'items'), _block_vars=_block_vars), cursor=(undefined(name='next_cursor') if l_0_next_cursor is missing else l_0_next_cursor), _block_vars=_block_vars)))
+        yield '" class="btn btn-outline-success">\n            Next Page <i class="fas fa-arrow-right"></i>\n        </a>\n    </div>\n    '
+    yield '\n\n    '
+    if (not (undefined(name='product_count') if l_0_product_count is missing else l_0_product_count)):
+        pass
+        yield '\n    <div class="text-center py-5">\n        <i class="fas fa-seedling fa-4x text-muted mb-3"></i>\n        <h4 class="text-muted">No products available yet</h4>\n        <p class="text-muted">Be the first farmer to list your products!</p>\n        '
+        if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+            pass
+            yield '\n        <a href="/addagroproduct" class="btn btn-success">Add Your Product</a>\n        '
+        yield '\n    </div>\n    '
+    yield '\n</div>\n\n'
+    l_0_feed_url = context.call((undefined(name='events_url') if l_0_events_url is missing else l_0_events_url), _block_vars=_block_vars)
+    _block_vars['feed_url'] = l_0_feed_url
+    yield '\n'
+    if (undefined(name='feed_url') if l_0_feed_url is missing else l_0_feed_url):
+        pass
+        yield '\n<script>\n// Availability, bid and new-listing updates pushed over Server-Sent Events\nif (window.EventSource) {\n    var feed = new EventSource("'
+        yield escape((undefined(name='feed_url') if l_0_feed_url is missing else l_0_feed_url))
+        yield '");\n    function card(pid) {\n        return document.querySelector(\'.product-card[data-pid="\' + pid + \'"]\');\n    }\n    feed.addEventListener(\'availability\', function (e) {\n        var p = JSON.parse(e.data), c = card(p.pid);\n        if (!c) return;\n        var badge = c.querySelector(\'.availability-badge\');\n        badge.textContent = p.available ? \'Available\' : \'Out of Stock\';\n        badge.className = \'badge availability-badge \' + (p.available ? \'bg-success\' : \'bg-secondary\');\n    });\n    feed.addEventListener(\'price\', function (e) {\n        var p = JSON.parse(e.data), c = card(p.pid);\n        var bid = c && c.querySelector(\'.highest-bid\');\n        if (bid) bid.textContent = \'Highest bid: ₹\' + p.price + \' (\' + p.bids + \' bids)\';\n    });\n    feed.addEventListener(\'product\', function (e) {\n        var p = JSON.parse(e.data);\n        document.getElementById(\'new-products\').classList.remove(\'d-none\');\n        document.getElementById(\'new-products-name\').textContent = p.productname;\n    });\n}\n</script>\n'
+    yield '\n\n<style>\n.card:hover {\n    transform: translateY(-2px);\n    transition: transform 0.2s ease-in-out;\n}\n.btn-group .btn.active {\n    background-color: #198754;\n    color: white;\n}\n</style>\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&6=27&7=72&16=78&17=81&18=85&19=87&31=94&33=96&34=99&35=109&36=113&42=129&48=131&49=133&50=139&52=145&55=147&58=149&61=151&66=153&67=157&72=167&83=171&88=173&89=176&91=181&95=189&97=192&103=195&108=198&115=203&116=206&120=209'
\ No newline at end of file
@@ -0,0 +1,85 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'farmerdetails.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'farmerdetails.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nFarmer Details\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_query = resolve('query')
+    pass
+    yield '\n <h3 class="text-center"><span>Farmer Details</span> </h3>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<br>\n\n<div class="container mt-3">\n<table class="table">\n  <thead class="thead-light">\n    <tr>\n      <th scope="col">RID</th>\n      <th scope="col">FARMER NAME</th>\n      <th scope="col">ADHAR NUMBER</th>\n      <th scope="col">AGE</th>\n      <th scope="col">GENDER</th>\n      <th scope="col">PHONE NUMBER</th>\n      <th scope="col">ADDRESS</th>\n      <th scope="col">FARMING</th>\n      <th scope="col">EDIT</th>\n      <th scope="col">DELETE</th>\n      <th scope="col">ADD AGRO PRODUCT</th>\n\n    </tr>\n  </thead>\n  <tbody>\n  '
+    for l_1_post in (undefined(name='query') if l_0_query is missing else l_0_query):
+        _loop_vars = {}
+        pass
+        yield '\n    <tr>\n      <th scope="row">'
+        yield escape(environment.getattr(l_1_post, 'rid'))
+        yield '</th>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'farmername'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'adharnumber'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'age'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'gender'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'phonenumber'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'address'))
+        yield '</td>\n      <td>'
+        yield escape(environment.getattr(l_1_post, 'farming'))
+        yield '</td>\n\n    <td><a href="/edit/'
+        yield escape(environment.getattr(l_1_post, 'rid'))
+        yield '"><button class="btn btn-success">Edit </button> </a> </td>\n    \n    <td><a href="/delete/'
+        yield escape(environment.getattr(l_1_post, 'rid'))
+        yield '"><button onclick="return confirm(\'Are you sure to Delete data\');" class="btn btn-success">Delete </button> </a> </td>\n    <td><a href="/addagroproduct"><button class="btn btn-success">ADD </button> </a> </td>\n    </tr>\n'
+    l_1_post = missing
+    yield '\n  \n  </tbody>\n</table>\n\n</div>\n\n\n\n\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&8=27&12=41&13=44&15=48&16=50&44=57&46=61&47=63&48=65&49=67&50=69&51=71&52=73&53=75&55=77&57=79'
\ No newline at end of file
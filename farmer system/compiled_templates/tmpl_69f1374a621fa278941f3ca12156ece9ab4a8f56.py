@@ -0,0 +1,69 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'farmer.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'farmer.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nRegister Farmers Details\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_farming = resolve('farming')
+    pass
+    yield '\n <h3 class="text-center"><span>Register Farmers Details</span> </h3>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<br>\n<div class="container">\n\n<div class="row">\n\n<div class="col-md-4"></div>\n<div class="col-md-4">\n\n<form action="/register" method="post">\n<div class="form-group">\n\n<label for="rollno">Farmer Name</label>\n<input type="text" class="form-control" name="farmername" id="farmername" required>\n</div>\n<br>\n<div class="form-group">\n\n<label for="adharnumber">Adhar Number</label>\n<input type="number" class="form-control" name="adharnumber" id="adharnumber" required>\n</div>\n<br>\n<div class="form-group">\n\n<label for="age">Age</label>\n<input type="number" class="form-control" name="age" id="age" required>\n</div>\n<br>\n<div class="form-group">                          \n<select  class="form-control" id="gender" name="gender"  required>\n        <option selected>Select Gender</option>\n    \n        <option value="male">Male</option>\n        <option value="female">Female</option>\n       \n      </select>\n </div>\n<br>\n\n\n<div class="form-group">\n<label for="num">Phone Number</label>\n<input type="number" class="form-control" name="phonenumber" id="phonenumber" required>\n</div>\n<br>\n\n<div class="form-group">\n<label for="address">Address</label>\n<textarea class="form-control" name="address" id="address" required></textarea>\n</div>\n<br>\n\n<div class="form-group">                          \n<select class="form-control" id="farmingtype" name="farmingtype"  required>\n        <option selected>Select Farming</option>\n        '
+    for l_1_d in (undefined(name='farming') if l_0_farming is missing else l_0_farming):
+        _loop_vars = {}
+        pass
+        yield '\n        <option value="'
+        yield escape(environment.getattr(l_1_d, 'farmingtype'))
+        yield '">'
+        yield escape(environment.getattr(l_1_d, 'farmingtype'))
+        yield '</option>\n        '
+    l_1_d = missing
+    yield '\n      </select>\n </div>\n<br>\n  \n  <button type="submit" class="btn btn-success  btn-block">Save Records</button>\n</form>\n<br>\n<br>\n\n</div>\n\n<div class="col-md-4"></div>\n\n</div></div>\n\n\n\n'
+
+blocks = {'title': block_title, 'body': block_body}
+debug_info = '1=12&2=17&8=27&12=41&13=44&15=48&16=50&77=57&78=61'
\ No newline at end of file
@@ -0,0 +1,134 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'product_grid.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_query = resolve('query')
+    try:
+        t_1 = environment.filters['length']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'length' found.")
+    try:
+        t_2 = environment.filters['replace']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No filter named 'replace' found.")
+    pass
+    for l_1_p in (undefined(name='query') if l_0_query is missing else l_0_query):
+        l_1_image_srcset = resolve('image_srcset')
+        l_1_card_sizes = resolve('card_sizes')
+        l_1_img = missing
+        _loop_vars = {}
+        pass
+        yield '\n<div class="col-lg-3 col-md-4 col-sm-6 mb-4 product-card" data-pid="'
+        yield escape(environment.getattr(l_1_p, 'pid'))
+        yield '">\n    <div class="card h-100 shadow-sm border-0" style="border-radius: 12px;">\n        '
+        l_1_img = (context.call((undefined(name='image_srcset') if l_1_image_srcset is missing else l_1_image_srcset), environment.getattr(l_1_p, 'image'), _loop_vars=_loop_vars) if environment.getattr(l_1_p, 'image') else None)
+        _loop_vars['img'] = l_1_img
+        yield '\n        '
+        if (undefined(name='img') if l_1_img is missing else l_1_img):
+            pass
+            yield '\n        <picture>\n            <source type="image/webp" srcset="'
+            yield escape(environment.getattr((undefined(name='img') if l_1_img is missing else l_1_img), 'webp'))
+            yield '" sizes="'
+            yield escape((undefined(name='card_sizes') if l_1_card_sizes is missing else l_1_card_sizes))
+            yield '">\n            <img src="'
+            yield escape(environment.getattr((undefined(name='img') if l_1_img is missing else l_1_img), 'src'))
+            yield '" srcset="'
+            yield escape(environment.getattr((undefined(name='img') if l_1_img is missing else l_1_img), 'jpeg'))
+            yield '" sizes="'
+            yield escape((undefined(name='card_sizes') if l_1_card_sizes is missing else l_1_card_sizes))
+            yield '" loading="lazy" class="card-img-top" style="height: 200px; object-fit: cover; border-radius: 12px 12px 0 0;" alt="'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '">\n        </picture>\n        '
+        elif environment.getattr(l_1_p, 'image'):
+            pass
+            yield '\n        <img src="'
+            yield escape(environment.getattr(l_1_p, 'image'))
+            yield '" loading="lazy" class="card-img-top" style="height: 200px; object-fit: cover; border-radius: 12px 12px 0 0;" alt="'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '">\n        '
+        else:
+            pass
+            yield '\n        <div class="card-img-top bg-light d-flex align-items-center justify-content-center" style="height: 200px; border-radius: 12px 12px 0 0;">\n            <i class="fas fa-seedling fa-3x text-success"></i>\n        </div>\n        '
+        yield '\n        \n        <div class="card-body d-flex flex-column">\n            <div class="d-flex justify-content-between align-items-start mb-2">\n                <h6 class="card-title mb-0 fw-bold">'
+        yield escape(environment.getattr(l_1_p, 'productname'))
+        yield '</h6>\n                '
+        if environment.getattr(l_1_p, 'available'):
+            pass
+            yield '\n                <span class="badge bg-success availability-badge">Available</span>\n                '
+        else:
+            pass
+            yield '\n                <span class="badge bg-secondary availability-badge">Out of Stock</span>\n                '
+        yield '\n            </div>\n            \n            '
+        if environment.getattr(l_1_p, 'category'):
+            pass
+            yield '\n            <small class="text-muted mb-2">'
+            yield escape(environment.getattr(l_1_p, 'category'))
+            yield '</small>\n            '
+        yield '\n            \n            <p class="card-text text-muted small mb-3">'
+        yield escape((environment.getattr(l_1_p, 'productdesc') or '')[:80])
+        if (t_1((environment.getattr(l_1_p, 'productdesc') or '')) > 80):
+            pass
+            yield '...'
+        yield '</p>\n            \n            <div class="mt-auto">\n                <div class="d-flex justify-content-between align-items-center mb-2">\n                    <div>\n                        <span class="h5 text-success fw-bold">₹'
+        yield escape(environment.getattr(l_1_p, 'price'))
+        yield '</span>\n                        '
+        if (environment.getattr(l_1_p, 'basePrice') and (environment.getattr(l_1_p, 'basePrice') != environment.getattr(l_1_p, 'price'))):
+            pass
+            yield '\n                        <small class="text-muted text-decoration-line-through ms-1">₹'
+            yield escape(environment.getattr(l_1_p, 'basePrice'))
+            yield '</small>\n                        '
+        yield '\n                    </div>\n                    '
+        if environment.getattr(l_1_p, 'quantity'):
+            pass
+            yield '\n                    <small class="text-muted">'
+            yield escape(environment.getattr(l_1_p, 'quantity'))
+            yield '</small>\n                    '
+        yield '\n                </div>\n                \n                <div class="d-flex justify-content-between align-items-center mb-3">\n                    <small class="text-muted">\n                        <i class="fas fa-user"></i> '
+        yield escape(environment.getattr(l_1_p, 'username'))
+        yield '\n                    </small>\n                </div>\n                \n                '
+        if (environment.getattr(l_1_p, 'available') and environment.getattr(l_1_p, 'auctionEndTime')):
+            pass
+            yield '\n                <form method="POST" action="/bid/'
+            yield escape(environment.getattr(l_1_p, 'pid'))
+            yield '" class="input-group input-group-sm mb-2">\n                    <input type="number" class="form-control" name="amount" min="'
+            yield escape((environment.getattr(l_1_p, 'basePrice') or 1))
+            yield '" placeholder="Bid ₹ (ends '
+            yield escape(t_2(context.eval_ctx, environment.getattr(l_1_p, 'auctionEndTime'), 'T', ' '))
+            yield ')" required>\n                    <button type="submit" class="btn btn-warning"><i class="fas fa-gavel"></i> Bid</button>\n                </form>\n                <small class="text-muted d-block mb-2 highest-bid"></small>\n                '
+        yield '\n\n                <div class="d-grid gap-2">\n                    '
+        if environment.getattr(l_1_p, 'available'):
+            pass
+            yield '\n                    <a href="https://mail.google.com/mail/?view=cm&fs=1&tf=1&to='
+            yield escape(environment.getattr(l_1_p, 'email'))
+            yield '&su=Order%20for%20'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '&body=Hi%20'
+            yield escape(environment.getattr(l_1_p, 'username'))
+            yield ',%0A%0AI%20would%20like%20to%20order%20'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '%20at%20₹'
+            yield escape(environment.getattr(l_1_p, 'price'))
+            yield '.%0A%0APlease%20let%20me%20know%20the%20availability%20and%20delivery%20details.%0A%0AThank%20you!" \n       target="_blank" class="btn btn-success btn-sm">\n                        <i class="fas fa-shopping-cart"></i> Order Now\n                    </a>\n                    <a href="https://wa.me/?text=Hi%20'
+            yield escape(environment.getattr(l_1_p, 'username'))
+            yield ',%20I%20am%20interested%20in%20'
+            yield escape(environment.getattr(l_1_p, 'productname'))
+            yield '%20at%20₹'
+            yield escape(environment.getattr(l_1_p, 'price'))
+            yield '" \n       target="_blank" class="btn btn-outline-success btn-sm">\n                        <i class="fab fa-whatsapp"></i> WhatsApp\n                    </a>\n                    '
+        else:
+            pass
+            yield '\n                    <button class="btn btn-secondary btn-sm" disabled>Out of Stock</button>\n                    '
+        yield '\n                </div>\n            </div>\n        </div>\n    </div>\n</div>\n'
+    l_1_p = l_1_image_srcset = l_1_img = l_1_card_sizes = missing
+
+blocks = {}
+debug_info = '1=24&2=31&4=33&5=36&7=39&8=43&10=51&11=54&20=62&21=64&28=71&29=74&32=77&37=82&38=84&39=87&42=90&43=93&49=96&53=98&54=101&55=103&62=108&63=111&67=121'
\ No newline at end of file
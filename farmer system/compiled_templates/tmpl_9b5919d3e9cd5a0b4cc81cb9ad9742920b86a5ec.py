@@ -0,0 +1,48 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index_new.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'index_new.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nFarm Management System - Connect Farmers with Buyers\n'
+
+def block_home(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nmenu-active\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n\n<!-- ======= Search Section ======= -->\n<section id="search" class="py-5 bg-light">\n  <div class="container">\n    <div class="row justify-content-center">\n      <div class="col-lg-8">\n        <div class="search-box text-center">\n          <h3 class="mb-4">Find Fresh Farm Products</h3>\n          <form action="/agroproducts" method="GET" class="d-flex">\n            <input type="text" class="form-control form-control-lg me-2" name="search" placeholder="Search for vegetables, fruits, grains..." style="border-radius: 25px;">\n            <button class="btn btn-success btn-lg px-4" type="submit" style="border-radius: 25px;">\n              <i class="fa fa-search"></i> Search\n            </button>\n          </form>\n          <div class="popular-searches mt-3">\n            <small class="text-muted">Popular: </small>\n            <a href="/agroproducts?category=Vegetables" class="badge bg-success text-decoration-none me-2">Vegetables</a>\n            <a href="/agroproducts?category=Fruits" class="badge bg-warning text-decoration-none me-2">Fruits</a>\n            <a href="/agroproducts?category=Grains" class="badge bg-info text-decoration-none">Grains</a>\n          </div>\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= About Section ======= -->\n<section id="about" class="py-5">\n  <div class="container">\n    <div class="row align-items-center">\n      <div class="col-lg-6">\n        <div class="about-content">\n          <h2 class="mb-4">About Our Farm Management System</h2>\n          <p class="lead">Connecting farmers directly with buyers for fresh, quality agricultural products.</p>\n          <p>Our platform empowers farmers to showcase their produce, manage their inventory, and reach customers directly. We eliminate middlemen, ensuring fair prices for farmers and fresh products for consumers.</p>\n          \n          <div class="row mt-4">\n            <div class="col-md-6">\n              <div class="feature-item d-flex align-items-center mb-3">\n                <div class="feature-icon bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                  <i class="fa fa-users"></i>\n                </div>\n                <div>\n                  <h6 class="mb-1">Direct Connection</h6>\n                  <small class="text-muted">Farmers meet buyers directly</small>\n                </div>\n              </div>\n            </div>\n            <div class="col-md-6">\n              <div class="feature-item d-flex align-items-center mb-3">\n                <div class="feature-icon bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                  <i class="fa fa-leaf"></i>\n                </div>\n                <div>\n                  <h6 class="mb-1">Fresh Products</h6>\n                  <small class="text-muted">Farm-fresh quality guaranteed</small>\n                </div>\n              </div>\n            </div>\n          </div>\n        </div>\n      </div>\n      <div class="col-lg-6">\n        <div class="about-image text-center">\n          <img src="https://images.unsplash.com/photo-1500937386664-56d1dfef3854?w=500&h=400&fit=crop" \n               alt="Farm Management" class="img-fluid rounded shadow" style="max-height: 400px; object-fit: cover;">\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n'
+
+blocks = {'title': block_title, 'home': block_home, 'body': block_body}
+debug_info = '1=12&2=17&5=27&9=37'
\ No newline at end of file
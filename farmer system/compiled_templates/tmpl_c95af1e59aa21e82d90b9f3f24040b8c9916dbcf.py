@@ -0,0 +1,62 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'edit.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    l_0_posts = resolve('posts')
+    l_0_farming = resolve('farming')
+    pass
+    yield '<!doctype html>\n<html lang="en">\n  <head>\n    <!-- Required meta tags -->\n    <meta charset="utf-8">\n    <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no">\n\n    <!-- Bootstrap CSS -->\n    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@4.5.3/dist/css/bootstrap.min.css" integrity="sha384-TX8t27EcRE3e/ihU7zmQxVncDAy5uIKz4rEkgIXeMed4M0jlfIDPvg6uqKI2xXr2" crossorigin="anonymous">\n\n    <title>Edit</title>\n  </head>\n<body class="bg-success">\n\n\n <h3 class="text-center"><span>Edit Farmer Details</span> </h3>\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n<br>\n<div class="container">\n\n<div class="row">\n\n<div class="col-md-4"></div>\n<div class="col-md-4">\n\n<form action="/edit/'
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'rid'))
+    yield '" method="post">\n<div class="form-group">\n\n<label for="rollno">Farmer Name</label>\n<input type="text" class="form-control" name="farmername" id="farmername" value='
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'farmername'))
+    yield ' required>\n</div>\n<br>\n<div class="form-group">\n\n<label for="adharnumber">Adhar Number</label>\n<input type="number" class="form-control" name="adharnumber" id="adharnumber" value='
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'adharnumber'))
+    yield ' required>\n</div>\n<br>\n<div class="form-group">\n\n<label for="age">Age</label>\n<input type="number" class="form-control" name="age" id="age" value='
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'age'))
+    yield ' required>\n</div>\n<br>\n<div class="form-group">                          \n<select  class="form-control" id="gender" name="gender"  required>\n        <option selected>'
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'gender'))
+    yield ' </option>\n    \n        <option value="male">Male</option>\n        <option value="female">Female</option>\n       \n      </select>\n </div>\n<br>\n\n\n<div class="form-group">\n<label for="num">Phone Number</label>\n<input type="number" class="form-control" name="phonenumber" id="phonenumber" value='
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'phonenumber'))
+    yield ' required>\n</div>\n<br>\n\n<div class="form-group">\n<label for="address">Address</label>\n<input class="form-control" name="address" id="address" value='
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'address'))
+    yield ' required/>\n</div>\n<br>\n\n<div class="form-group">                          \n<select class="form-control" id="farmingtype" name="farmingtype"   required>\n        <option selected>'
+    yield escape(environment.getattr((undefined(name='posts') if l_0_posts is missing else l_0_posts), 'farming'))
+    yield '</option>\n        '
+    for l_1_d in (undefined(name='farming') if l_0_farming is missing else l_0_farming):
+        _loop_vars = {}
+        pass
+        yield '\n        <option value="'
+        yield escape(environment.getattr(l_1_d, 'farmingtype'))
+        yield '">'
+        yield escape(environment.getattr(l_1_d, 'farmingtype'))
+        yield '</option>\n        '
+    l_1_d = missing
+    yield '\n      </select>\n </div>\n<br>\n  \n  <button type="submit" class="btn btn-light btn-sm btn-block">Submit Record</button>\n</form>\n<br>\n<br>\n\n</div>\n\n<div class="col-md-4"></div>\n\n</div>\n</div>\n</div>\n\n\n    <!-- Optional JavaScript; choose one of the two! -->\n\n    <!-- Option 1: jQuery and Bootstrap Bundle (includes Popper) -->\n    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js" integrity="sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj" crossorigin="anonymous"></script>\n    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.5.3/dist/js/bootstrap.bundle.min.js" integrity="sha384-ho+j7jyWK8fNQe+A12Hb8AhRq26LrZ/JpcUGGOn+Y7RsweNrtN/tE3MoK7ZeZDyx" crossorigin="anonymous"></script>\n\n    <!-- Option 2: jQuery, Popper.js, and Bootstrap JS\n    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js" integrity="sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj" crossorigin="anonymous"></script>\n    <script src="https://cdn.jsdelivr.net/npm/popper.js@1.16.1/dist/umd/popper.min.js" integrity="sha384-9/reFTGAW83EW2RDu2S0VKaIzap3H66lZH81PoYlFhbGU+6BZp6G7niu735Sk7lN" crossorigin="anonymous"></script>\n    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.5.3/dist/js/bootstrap.min.js" integrity="sha384-w1Q4orYjBQndcko6MimVbzY0tgp4pWB4lZ7lr30WKz0vr/aWKhXdBNmNb5D92v7s" crossorigin="anonymous"></script>\n    -->\n  </body>\n</html>'
+
+blocks = {}
+debug_info = '19=18&20=21&22=25&23=27&38=34&42=36&48=38&54=40&59=42&71=44&77=46&83=48&84=50&85=54'
\ No newline at end of file
@@ -0,0 +1,70 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'index.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    parent_template = None
+    pass
+    parent_template = environment.get_template('base.html', 'index.html')
+    for name, parent_block in parent_template.blocks.items():
+        context.blocks.setdefault(name, []).append(parent_block)
+    yield from parent_template.root_render_func(context)
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nFarm Management System - Connect Farmers with Buyers\n'
+
+def block_home(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\nmenu-active\n'
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_current_user = resolve('current_user')
+    pass
+    yield '\n\n<!-- ======= Search Section ======= -->\n<section id="search" class="py-5 bg-light">\n  <div class="container">\n    <div class="row justify-content-center">\n      <div class="col-lg-8">\n        <div class="search-box text-center">\n          <h3 class="mb-4">Find Fresh Farm Products</h3>\n          <form action="/agroproducts" method="GET" class="d-flex">\n            <input type="text" class="form-control form-control-lg me-2" name="search" placeholder="Search for vegetables, fruits, grains..." style="border-radius: 25px;">\n            <button class="btn btn-success btn-lg px-4" type="submit" style="border-radius: 25px;">\n              <i class="fa fa-search"></i> Search\n            </button>\n          </form>\n          <div class="popular-searches mt-3">\n            <small class="text-muted">Popular: </small>\n            <a href="/agroproducts?category=Vegetables" class="badge bg-success text-decoration-none me-2">Vegetables</a>\n            <a href="/agroproducts?category=Fruits" class="badge bg-warning text-decoration-none me-2">Fruits</a>\n            <a href="/agroproducts?category=Grains" class="badge bg-info text-decoration-none">Grains</a>\n          </div>\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= About Section ======= -->\n<section id="about" class="py-5">\n  <div class="container">\n    <div class="row align-items-center">\n      <div class="col-lg-6">\n        <div class="about-content">\n          <h2 class="mb-4">About Our Farm Management System</h2>\n          <p class="lead">Connecting farmers directly with buyers for fresh, quality agricultural products.</p>\n          <p>Our platform empowers farmers to showcase their produce, manage their inventory, and reach customers directly. We eliminate middlemen, ensuring fair prices for farmers and fresh products for consumers.</p>\n          \n          <div class="row mt-4">\n            <div class="col-md-6">\n              <div class="feature-item d-flex align-items-center mb-3">\n                <div class="feature-icon bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                  <i class="fa fa-users"></i>\n                </div>\n                <div>\n                  <h6 class="mb-1">Direct Connection</h6>\n                  <small class="text-muted">Farmers meet buyers directly</small>\n                </div>\n              </div>\n            </div>\n            <div class="col-md-6">\n              <div class="feature-item d-flex align-items-center mb-3">\n                <div class="feature-icon bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                  <i class="fa fa-leaf"></i>\n                </div>\n                <div>\n                  <h6 class="mb-1">Fresh Products</h6>\n                  <small class="text-muted">Farm-fresh quality guaranteed</small>\n                </div>\n              </div>\n            </div>\n          </div>\n        </div>\n      </div>\n      <div class="col-lg-6">\n        <div class="about-image text-center">\n          <img src="https://images.unsplash.com/photo-1500937386664-56d1dfef3854?w=500&h=400&fit=crop" \n               alt="Farm Management" class="img-fluid rounded shadow" style="max-height: 400px; object-fit: cover;">\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= Features Section ======= -->\n<section id="features" class="py-5 bg-light">\n  <div class="container">\n    <div class="text-center mb-5">\n      <h2>Platform Features</h2>\n      <p class="text-muted">Everything you need to manage and grow your agricultural business</p>\n    </div>\n    \n    <div class="row">\n      <div class="col-lg-4 col-md-6 mb-4">\n        <div class="feature-card card h-100 border-0 shadow-sm text-center p-4">\n          <div class="feature-icon mb-3">\n            <i class="fa fa-user-plus fa-3x text-success"></i>\n          </div>\n          <h5 class="card-title">Farmer Registration</h5>\n          <p class="card-text text-muted">Easy registration process for farmers to join our platform and start selling their products.</p>\n          <a href="/register" class="btn btn-outline-success">Register Now</a>\n        </div>\n      </div>\n      \n      <div class="col-lg-4 col-md-6 mb-4">\n        <div class="feature-card card h-100 border-0 shadow-sm text-center p-4">\n          <div class="feature-icon mb-3">\n            <i class="fa fa-shopping-cart fa-3x text-success"></i>\n          </div>\n          <h5 class="card-title">Product Selling</h5>\n          <p class="card-text text-muted">List your agricultural products with photos, descriptions, and competitive pricing.</p>\n          '
+    if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+        pass
+        yield '\n          <a href="/addagroproduct" class="btn btn-outline-success">Sell Products</a>\n          '
+    else:
+        pass
+        yield '\n          <a href="/signup" class="btn btn-outline-success">Get Started</a>\n          '
+    yield '\n        </div>\n      </div>\n      \n      <div class="col-lg-4 col-md-6 mb-4">\n        <div class="feature-card card h-100 border-0 shadow-sm text-center p-4">\n          <div class="feature-icon mb-3">\n            <i class="fa fa-clipboard fa-3x text-success"></i>\n          </div>\n          <h5 class="card-title">Record Management</h5>\n          <p class="card-text text-muted">Track your sales, manage inventory, and maintain detailed records of all transactions.</p>\n          '
+    if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+        pass
+        yield '\n          <a href="/myproducts" class="btn btn-outline-success">View Records</a>\n          '
+    else:
+        pass
+        yield '\n          <a href="/signup" class="btn btn-outline-success">Learn More</a>\n          '
+    yield '\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= Product Showcase Section ======= -->\n<section id="showcase" class="py-5">\n  <div class="container">\n    <div class="text-center mb-5">\n      <h2>Featured Products</h2>\n      <p class="text-muted">Fresh produce from our registered farmers</p>\n    </div>\n    \n    <div class="row">\n      <div class="col-lg-3 col-md-6 mb-4">\n        <div class="product-card card border-0 shadow-sm">\n          <img src="https://images.unsplash.com/photo-1592924357228-91a4daadcfea?w=300&h=200&fit=crop" \n               class="card-img-top" alt="Fresh Tomatoes" style="height: 200px; object-fit: cover;">\n          <div class="card-body text-center">\n            <h6 class="card-title">Fresh Tomatoes</h6>\n            <p class="text-success fw-bold">₹40/kg</p>\n            <small class="text-muted">Organic & Fresh</small>\n          </div>\n        </div>\n      </div>\n      \n      <div class="col-lg-3 col-md-6 mb-4">\n        <div class="product-card card border-0 shadow-sm">\n          <img src="https://images.unsplash.com/photo-1619566636858-adf3ef46400b?w=300&h=200&fit=crop" \n               class="card-img-top" alt="Fresh Carrots" style="height: 200px; object-fit: cover;">\n          <div class="card-body text-center">\n            <h6 class="card-title">Fresh Carrots</h6>\n            <p class="text-success fw-bold">₹60/kg</p>\n            <small class="text-muted">Farm Fresh</small>\n          </div>\n        </div>\n      </div>\n      \n      <div class="col-lg-3 col-md-6 mb-4">\n        <div class="product-card card border-0 shadow-sm">\n          <img src="https://images.unsplash.com/photo-1571771894821-ce9b6c11b08e?w=300&h=200&fit=crop" \n               class="card-img-top" alt="Fresh Apples" style="height: 200px; object-fit: cover;">\n          <div class="card-body text-center">\n            <h6 class="card-title">Fresh Apples</h6>\n            <p class="text-success fw-bold">₹120/kg</p>\n            <small class="text-muted">Premium Quality</small>\n          </div>\n        </div>\n      </div>\n      \n      <div class="col-lg-3 col-md-6 mb-4">\n        <div class="product-card card border-0 shadow-sm">\n          <img src="https://images.unsplash.com/photo-1586201375761-83865001e31c?w=300&h=200&fit=crop" \n               class="card-img-top" alt="Rice Grains" style="height: 200px; object-fit: cover;">\n          <div class="card-body text-center">\n            <h6 class="card-title">Basmati Rice</h6>\n            <p class="text-success fw-bold">₹80/kg</p>\n            <small class="text-muted">Premium Grade</small>\n          </div>\n        </div>\n      </div>\n    </div>\n    \n    <div class="text-center mt-4">\n      <a href="/agroproducts" class="btn btn-success btn-lg">View All Products</a>\n    </div>\n  </div>\n</section>\n\n<!-- ======= Testimonials Section ======= -->\n<section id="testimonials" class="py-5 bg-light">\n  <div class="container">\n    <div class="text-center mb-5">\n      <h2>What Our Users Say</h2>\n      <p class="text-muted">Hear from farmers and buyers who trust our platform</p>\n    </div>\n    \n    <div class="row">\n      <div class="col-lg-4 mb-4">\n        <div class="testimonial-card card border-0 shadow-sm p-4 h-100">\n          <div class="testimonial-content">\n            <div class="stars mb-3">\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n            </div>\n            <p class="mb-3">"This platform has revolutionized how I sell my vegetables. Direct connection with buyers means better prices and no middleman hassles."</p>\n            <div class="testimonial-author d-flex align-items-center">\n              <div class="author-avatar bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                <i class="fa fa-user"></i>\n              </div>\n              <div>\n                <h6 class="mb-0">Rajesh Kumar</h6>\n                <small class="text-muted">Vegetable Farmer, Punjab</small>\n              </div>\n            </div>\n          </div>\n        </div>\n      </div>\n      \n      <div class="col-lg-4 mb-4">\n        <div class="testimonial-card card border-0 shadow-sm p-4 h-100">\n          <div class="testimonial-content">\n            <div class="stars mb-3">\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n            </div>\n            <p class="mb-3">"Amazing quality fruits at reasonable prices. I can directly contact farmers and get the freshest produce for my family."</p>\n            <div class="testimonial-author d-flex align-items-center">\n              <div class="author-avatar bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                <i class="fa fa-user"></i>\n              </div>\n              <div>\n                <h6 class="mb-0">Priya Sharma</h6>\n                <small class="text-muted">Regular Customer, Delhi</small>\n              </div>\n            </div>\n          </div>\n        </div>\n      </div>\n      \n      <div class="col-lg-4 mb-4">\n        <div class="testimonial-card card border-0 shadow-sm p-4 h-100">\n          <div class="testimonial-content">\n            <div class="stars mb-3">\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n              <i class="fa fa-star text-warning"></i>\n            </div>\n            <p class="mb-3">"The record management system helps me track all my sales and inventory efficiently. Great platform for farmers!"</p>\n            <div class="testimonial-author d-flex align-items-center">\n              <div class="author-avatar bg-success text-white rounded-circle me-3 d-flex align-items-center justify-content-center" style="width: 50px; height: 50px;">\n                <i class="fa fa-user"></i>\n              </div>\n              <div>\n                <h6 class="mb-0">Amit Patel</h6>\n                <small class="text-muted">Grain Farmer, Gujarat</small>\n              </div>\n            </div>\n          </div>\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= Call to Action Section ======= -->\n<section id="cta" class="py-5 bg-success text-white">\n  <div class="container">\n    <div class="row justify-content-center text-center">\n      <div class="col-lg-8">\n        <h3 class="mb-2">Ready to Start Selling Your Products?</h3>\n        <p class="mb-4">Join thousands of farmers already using our platform to reach customers directly.</p>\n        <div class="cta-buttons">\n          '
+    if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+        pass
+        yield '\n          <a href="/addagroproduct" class="btn btn-light btn-lg me-3">Start Selling</a>\n          <a href="/myproducts" class="btn btn-outline-light btn-lg">My Dashboard</a>\n          '
+    else:
+        pass
+        yield '\n          <a href="/signup" class="btn btn-dark btn-lg me-3">Join Now</a>\n          <a href="/agroproducts" class="btn btn-outline-light btn-lg">Browse Products</a>\n          '
+    yield '\n        </div>\n      </div>\n    </div>\n  </div>\n</section>\n\n<!-- ======= Footer ======= -->\n<footer id="footer" class="py-5">\n  <div class="container">\n    <div class="row">\n      <div class="col-lg-4 mb-4">\n        <h5 class="mb-3 text-white">Farm Management System</h5>\n        <p class="text-muted">Connecting farmers with buyers for fresh, quality agricultural products. Building a sustainable future for agriculture.</p>\n        <div class="social-links">\n          <a href="#" class="text-white me-3"><i class="fa fa-facebook"></i></a>\n          <a href="#" class="text-white me-3"><i class="fa fa-twitter"></i></a>\n          <a href="https://www.instagram.com/akshu_gangurde_3005?igsh=dzg1aGRmeGJpd2Fl" class="text-white me-3"><i class="fa fa-instagram"></i></a>\n          <a href="https://www.linkedin.com/in/akshay-gangurde-8b2714283/" class="text-white"><i class="fa fa-linkedin"></i></a>\n        </div>\n      </div>\n      \n      <div class="col-lg-2 col-md-6 mb-4">\n        <h6 class="mb-3 text-white">Quick Links</h6>\n        <ul class="list-unstyled">\n          <li><a href="/" class="text-muted text-decoration-none">Home</a></li>\n          <li><a href="/agroproducts" class="text-muted text-decoration-none">Products</a></li>\n          <li><a href="/register" class="text-muted text-decoration-none">Register</a></li>\n          <li><a href="/farmerdetails" class="text-muted text-decoration-none">Farmers</a></li>\n        </ul>\n      </div>\n      \n      <div class="col-lg-2 col-md-6 mb-4">\n        <h6 class="mb-3 text-white">For Farmers</h6>\n        <ul class="list-unstyled">\n          <li><a href="/addagroproduct" class="text-muted text-decoration-none">Sell Products</a></li>\n          <li><a href="/myproducts" class="text-muted text-decoration-none">My Products</a></li>\n          <li><a href="/addfarming" class="text-muted text-decoration-none">Add Farming</a></li>\n          <li><a href="/triggers" class="text-muted text-decoration-none">Records</a></li>\n        </ul>\n      </div>\n      \n      <div class="col-lg-4 mb-4">\n        <h6 class="mb-3 text-white">Contact Info</h6>\n        <div class="contact-info text-muted">\n          <p class="mb-2"><i class="fa fa-map-marker me-2"></i>123 Farm Street, Agricultural District</p>\n          <p class="mb-2"><i class="fa fa-phone me-2"></i>+91 98765 43210</p>\n          <p class="mb-2"><i class="fa fa-envelope me-2"></i>info@farmmanagement.com</p>\n        </div>\n      </div>\n    </div>\n    \n    <hr class="my-4 text-light">\n    \n    <div class="row align-items-center">\n      <div class="col-md-6">\n        <p class="mb-0 text-light">&copy; 2025 Farm Management System. All rights reserved.</p>\n      </div>\n      <div class="col-md-6 text-md-end">\n        <p class="mb-0 text-muted">Built with ❤️ for farmers</p>\n      </div>\n    </div>\n  </div>\n</footer>\n\n<style>\n/* 🌿 Modern Green Gradient Theme */\n#footer {\n  background: linear-gradient(135deg, #2e8b57, #006400);\n  color: #f8f9fa;\n}\n\n.text-muted {\n  color: #d1e7dd !important;\n}\n\n.social-links a:hover {\n  color: #a8df65 !important;\n}\n\n/* Hover & card effects remain unchanged */\n.feature-card:hover {\n  transform: translateY(-5px);\n  transition: transform 0.3s ease;\n}\n\n.product-card:hover {\n  transform: translateY(-3px);\n  transition: transform 0.3s ease;\n}\n\n.testimonial-card {\n  transition: transform 0.3s ease;\n}\n\n.testimonial-card:hover {\n  transform: translateY(-2px);\n}\n\n.search-box input:focus {\n  box-shadow: 0 0 0 0.2rem rgba(25, 135, 84, 0.25);\n  border-color: #198754;\n}\n</style>\n\n'
+
+blocks = {'title': block_title, 'home': block_home, 'body': block_body}
+debug_info = '1=12&2=17&5=27&9=37&109=47&124=54&291=61'
\ No newline at end of file
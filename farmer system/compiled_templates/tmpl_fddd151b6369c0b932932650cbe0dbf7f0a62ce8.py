@@ -0,0 +1,162 @@
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'base.html'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_static_url = resolve('static_url')
+    l_0_image_srcset = resolve('image_srcset')
+    l_0_url_for = resolve('url_for')
+    l_0_current_user = resolve('current_user')
+    l_0_bg = missing
+    try:
+        t_1 = environment.filters['reverse']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No filter named 'reverse' found.")
+    pass
+    yield '<!DOCTYPE html>\n<html lang="en">\n\n<head>\n  <meta charset="utf-8">\n  <meta content="width=device-width, initial-scale=1.0" name="viewport">\n\n  <title>'
+    yield from context.blocks['title'][0](context)
+    yield '</title>\n  <meta content="" name="description">\n  <meta content="" name="keywords">\n\n'
+    yield from context.blocks['style'][0](context)
+    yield '\n  <link href="https://fonts.googleapis.com/css?family=Open+Sans:300,300i,400,400i,700,700i|Raleway:300,400,500,700,800" rel="stylesheet">\n\n  <!-- Vendor CSS Files -->\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/bootstrap/css/bootstrap.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/venobox/venobox.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/font-awesome/css/font-awesome.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/owl.carousel/assets/owl.carousel.min.css'))
+    yield '" rel="stylesheet">\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/aos/aos.css'))
+    yield '" rel="stylesheet">\n\n  <!-- Template Main CSS File -->\n  <link href="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/css/style.css'))
+    yield '" rel="stylesheet">\n'
+    l_0_bg = context.call((undefined(name='image_srcset') if l_0_image_srcset is missing else l_0_image_srcset), context.call((undefined(name='url_for') if l_0_url_for is missing else l_0_url_for), 'static', filename='images/bg.jpg'))
+    context.vars['bg'] = l_0_bg
+    context.exported_vars.add('bg')
+    yield '\n'
+    if (undefined(name='bg') if l_0_bg is missing else l_0_bg):
+        pass
+        yield '\n  <!-- smallest derivative that still covers the viewport; wider screens keep the original from style.css -->\n  <style>\n  '
+        for (l_1_w, l_1_h, l_1_webp, l_1_jpeg) in t_1(environment.getattr((undefined(name='bg') if l_0_bg is missing else l_0_bg), 'sizes')):
+            _loop_vars = {}
+            pass
+            yield '\n    @media (max-width: '
+            yield escape(l_1_w)
+            yield 'px) and (max-height: '
+            yield escape(l_1_h)
+            yield 'px) { #intro { background-image: url('
+            yield escape(l_1_jpeg)
+            yield '); background-image: image-set(url('
+            yield escape(l_1_webp)
+            yield ') type("image/webp"), url('
+            yield escape(l_1_jpeg)
+            yield ') type("image/jpeg")); } }\n  '
+        l_1_w = l_1_h = l_1_webp = l_1_jpeg = missing
+        yield '\n  </style>\n'
+    yield '\n\n \n</head>\n\n<body>\n\n  <!-- ======= Header ======= -->\n  <header id="header">\n    <div class="container">\n\n      <div id="logo" class="pull-left">\n\n        <a href="/" class="scrollto">F.M.S</a>\n      </div>\n\n      <nav id="nav-menu-container">\n        <ul class="nav-menu">\n          <li class="'
+    yield from context.blocks['home'][0](context)
+    yield '"><a href="/">Home</a></li>\n         \n <li><a href="/register">Farmer Register</a></li>\n <li><a href="/addfarming">Add Farming</a></li>\n <li><a href="/farmerdetails">Farmer Details</a></li>\n <li><a href="/agroproducts">Agro Products</a></li>\n '
+    if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+        pass
+        yield '\n <li><a href="/addagroproduct">Sell Product</a></li>\n <li><a href="/myproducts">My Products</a></li>\n '
+    yield '\n <li><a href="/triggers">Records</a></li>\n \n       \n    \n \n   \n\n    '
+    if environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'is_authenticated'):
+        pass
+        yield '\n          <li class="buy-tickets"><a href="">Welcome '
+        yield escape(environment.getattr((undefined(name='current_user') if l_0_current_user is missing else l_0_current_user), 'username'))
+        yield '</a></li>\n            <li class="buy-tickets"><a href="/logout">Logout</a></li>\n          '
+    else:
+        pass
+        yield '\n          <li class="buy-tickets"><a href="/signup">Signin</a></li>\n        \n          '
+    yield '\n        </ul>\n      </nav><!-- #nav-menu-container -->\n    </div>\n  </header><!-- End Header -->\n\n  <!-- ======= Intro Section ======= -->\n <section id="intro">\n    <div class="intro-container" data-aos="zoom-in" data-aos-delay="100">\n      <h1 class="mb-4 pb-0">SELL AGRO PRODUCTS AND BUY  </span> </h1>\n      <p class="mb-4 pb-0">Farmer Management System</p>\n    \n      <a href="/agroproducts" class="about-btn scrollto">AGRO PRODUCTS</a>\n    </div>\n  </section><!-- End Intro Section -->\n  <main id="main">\n\n\n  '
+    yield from context.blocks['body'][0](context)
+    yield '\n\n\n  <a href="#" class="back-to-top"><i class="fa fa-angle-up"></i></a>\n\n  <!-- Vendor JS Files -->\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/jquery/jquery.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/bootstrap/js/bootstrap.bundle.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/jquery.easing/jquery.easing.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/php-email-form/validate.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/venobox/venobox.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/owl.carousel/owl.carousel.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/superfish/superfish.min.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/hoverIntent/hoverIntent.js'))
+    yield '"></script>\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/vendor/aos/aos.js'))
+    yield '"></script>\n  \n\n  <!-- Template Main JS File -->\n  <script src="'
+    yield escape(context.call((undefined(name='static_url') if l_0_static_url is missing else l_0_static_url), 'assets/js/main.js'))
+    yield '"></script>\n\n</body>\n\n</html>'
+
+def block_title(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n  '
+
+def block_style(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n'
+
+def block_home(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    pass
+    yield '\n          '
+
+def block_body(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    _block_vars = {}
+    l_0_get_flashed_messages = resolve('get_flashed_messages')
+    pass
+    yield '\n  \n'
+    l_1_messages = context.call((undefined(name='get_flashed_messages') if l_0_get_flashed_messages is missing else l_0_get_flashed_messages), with_categories=True, _block_vars=_block_vars)
+    pass
+    yield '\n'
+    if l_1_messages:
+        pass
+        yield '\n'
+        for (l_2_category, l_2_message) in l_1_messages:
+            _loop_vars = {}
+            pass
+            yield '\n\n<div class="alert alert-'
+            yield escape(l_2_category)
+            yield ' alert-dismissible fade show" role="alert">\n    '
+            yield escape(l_2_message)
+            yield '\n\n\n</div>\n\n\n  '
+        l_2_category = l_2_message = missing
+        yield '\n  '
+    yield '\n  '
+    l_1_messages = missing
+    yield '\n  '
+
+blocks = {'title': block_title, 'style': block_style, 'home': block_home, 'body': block_body}
+debug_info = '8=23&13=25&18=27&19=29&20=31&21=33&22=35&25=37&26=39&27=43&30=46&31=50&52=63&59=65&70=69&71=72&94=78&116=80&117=82&118=84&119=86&120=88&121=90&122=92&123=94&124=96&128=98&8=101&13=111&52=121&94=131&97=144&98=147&100=151&101=153'
\ No newline at end of file
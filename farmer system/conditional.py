@@ -0,0 +1,165 @@
+import hashlib
+import os
+import sys
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, g, has_request_context, make_response, request, session
+
+from fragment_cache import VersionCounter
+
+# In-process sequence numbers are per process. Mixing a random boot id into
+# them keeps two workers (or a restarted one) that happen to reach the same
+# sequence numbers from vouching for each other's pages.
+BOOT_ID = os.urandom(8).hex()
+
+VERSION_TABLE = 'table_version'
+# epoch seconds with a fraction, in SQLite before 3.42 (no unixepoch('subsec'))
+SQL_NOW = "((julianday('now') - 2440587.5) * 86400.0)"
+
+
+class TableVersions(dict):
+    """Change sequence number per table kept in this process: table name -> VersionCounter.
+
+    Only right when the data itself lives in the process (api/complete.py);
+    apps on a database use StoredVersions, so that every worker sees
+    every write.
+    """
+
+    def __init__(self, *tables):
+        super().__init__((table, VersionCounter()) for table in tables)
+
+    def state(self, *tables):
+        """((boot id, version of each table), time of the last change)"""
+        counters = [self[table] for table in tables]
+        return (BOOT_ID,) + tuple(c.value for c in counters), max(c.modified for c in counters)
+
+
+class StoredVersions:
+    """Change sequence number per table kept in the database, next to the data.
+
+    Triggers bump a table_version row in the same transaction as every
+    insert, update and delete, whichever worker, thread or CLI command
+    made it, so every process derives the same validators from what is
+    committed. `tables` maps the names the app uses to table names.
+    Reading them is one query on a three-row table, done once per request.
+
+    A database private to the process (index.py's in-memory copy) passes
+    scope=BOOT_ID, since equal sequence numbers there say nothing about
+    another instance's rows.
+    """
+
+    def __init__(self, engine, scope=None, **tables):
+        self.engine = engine
+        self.scope = () if scope is None else (scope,)
+        self.tables = tables
+
+    def ddl(self):
+        """The table_version table, its rows and the triggers on every tracked table"""
+        statements = [f'CREATE TABLE IF NOT EXISTS {VERSION_TABLE} '
+                      '(name VARCHAR(50) PRIMARY KEY, seq INTEGER NOT NULL, modified FLOAT NOT NULL)']
+        bump = f'UPDATE {VERSION_TABLE} SET seq = seq + 1, modified = {SQL_NOW}'
+        for name, table in sorted(self.tables.items()):
+            statements.append(f"INSERT OR IGNORE INTO {VERSION_TABLE} (name, seq, modified) VALUES ('{name}', 0, {SQL_NOW})")
+            for op in ('INSERT', 'UPDATE', 'DELETE'):
+                statements.append(f'CREATE TRIGGER IF NOT EXISTS {VERSION_TABLE}_{name}_{op.lower()} '
+                                  f'AFTER {op} ON "{table}" BEGIN {bump} WHERE name = \'{name}\'; END')
+        return statements
+
+    def install(self):
+        with self.engine.begin() as conn:
+            for statement in self.ddl():
+                conn.exec_driver_sql(statement)
+
+    def _read(self):
+        if has_request_context() and '_table_versions' in g:
+            return g._table_versions
+        with self.engine.connect() as conn:
+            stored = {name: (seq, modified) for name, seq, modified
+                      in conn.exec_driver_sql(f'SELECT name, seq, modified FROM {VERSION_TABLE}')}
+        if has_request_context():
+            g._table_versions = stored
+        return stored
+
+    def state(self, *tables):
+        """((scope, version of each table), time of the last change), as committed in the database"""
+        stored = self._read()
+        rows = [stored.get(table, (0, 0.0)) for table in tables]
+        return self.scope + tuple(seq for seq, _ in rows), max(modified for _, modified in rows)
+
+
+def build_version(app):
+    """(digest, mtime) of the files that render the app's pages: its templates and its own module.
+
+    A deploy that changes any of them changes every ETag and moves
+    Last-Modified forward, so no page rendered by the old build is
+    confirmed as fresh. Hashed once per process, on the first
+    conditional request.
+    """
+    cached = app.extensions.get('build_version')
+    if cached is None:
+        paths = [sys.modules[app.import_name].__file__]
+        if app.template_folder:
+            for root, _, files in os.walk(os.path.join(app.root_path, app.template_folder)):
+                paths.extend(os.path.join(root, name) for name in files)
+        digest = hashlib.sha1()
+        for path in sorted(paths):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        cached = app.extensions['build_version'] = (digest.hexdigest()[:12], max(map(os.path.getmtime, paths)))
+    return cached
+
+
+def page_etag(values, per_user=True):
+    """Strong ETag for the current page at the given table versions.
+
+    A page that shows who is logged in carries the user id in it.
+    """
+    user = (session.get('_user_id') or session.get('user_id')) if per_user else None
+    state = [request.full_path, user] + list(values)
+    return hashlib.sha1(repr(state).encode()).hexdigest()[:20]
+
+
+def conditional_get(versions, *tables, counters=(), per_user=True):
+    """Answer If-None-Match / If-Modified-Since with 304 from the table versions alone.
+
+    `versions` is a TableVersions or a StoredVersions. `counters` are
+    VersionCounters of anything else the page shows (rendered images),
+    and the build version of the templates is part of every validator.
+
+    The check runs before the view, so a 304 never queries the rows or
+    renders a template; login checks go above it. Pages carrying flashed
+    messages are always sent. A per-user page (every page with the
+    navigation bar) is validated by its ETag only: Last-Modified cannot
+    tell that another user has logged in since.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+                return view(*args, **kwargs)
+            values, modified = versions.state(*tables)
+            build, built = build_version(current_app)
+            values += tuple(c.value for c in counters) + (build,)
+            modified = max([modified, built] + [c.modified for c in counters])
+            etag = page_etag(values, per_user)
+            modified = datetime.fromtimestamp(int(modified), timezone.utc)
+            if request.if_none_match:
+                fresh = request.if_none_match.contains(etag)
+            else:
+                fresh = (not per_user and request.if_modified_since is not None
+                         and modified <= request.if_modified_since)
+            if fresh:
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                # only full pages get validators; a redirect to /login must not
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            if not per_user:
+                response.last_modified = modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
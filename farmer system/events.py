@@ -0,0 +1,343 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from itertools import count
+
+from flask import Response, request
+
+log = logging.getLogger(__name__)
+
+# Idle streams get a comment line this often so proxies keep them open
+HEARTBEAT = 15
+# Events a client may fall behind by before it is dropped, and how many
+# recent events are kept to replay to a client reconnecting with Last-Event-ID
+QUEUE_SIZE = 256
+HISTORY_SIZE = 256
+# Address of the optional asyncio /events server, for a proxy in front of
+# the app to forward /events to, and how many streams the app's own
+# /events route may hold open (each one pins a worker thread)
+EVENTS_HOST = '127.0.0.1'
+EVENTS_PORT = 5001
+WSGI_STREAMS = 4
+# SharedBroadcaster: how often each process reads new events from the
+# table, and how many rows it keeps for reconnecting clients
+EVENT_TABLE = 'product_events'
+RELAY_INTERVAL = 0.5
+EVENT_ROWS = 10000
+
+
+class Subscription:
+    """One client's bounded queue of events.
+
+    The broadcaster appends to it and calls `wake`; when the queue is full
+    the client is too slow, so it is closed instead of buffering without
+    limit.
+    """
+
+    def __init__(self, maxsize, wake):
+        self.events = deque()
+        self.maxsize = maxsize
+        self.wake = wake
+        self.closed = False
+
+    def offer(self, event):
+        if len(self.events) >= self.maxsize:
+            self.closed = True
+        else:
+            self.events.append(event)
+        self.wake()
+        return not self.closed
+
+    def drain(self):
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+
+class Broadcaster:
+    """Fans product events out to every subscribed client in this process"""
+
+    def __init__(self, queue_size=QUEUE_SIZE, history_size=HISTORY_SIZE):
+        self.queue_size = queue_size
+        self.published = 0
+        self.dropped = 0
+        self._ids = count(1)
+        self._history = deque(maxlen=history_size)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def publish(self, kind, **data):
+        self.deliver(None, kind, json.dumps(data, separators=(',', ':')))
+
+    def deliver(self, event_id, kind, data):
+        """Fan out one event, `data` already JSON; numbered here when event_id is None"""
+        with self._lock:
+            event = (next(self._ids) if event_id is None else event_id, kind, data)
+            self._history.append(event)
+            self.published += 1
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            if not sub.offer(event):
+                with self._lock:
+                    self._subscribers.discard(sub)
+                    self.dropped += 1
+
+    def start(self):
+        pass
+
+    def subscribe(self, wake, last_id=None):
+        sub = Subscription(self.queue_size, wake)
+        with self._lock:
+            if last_id is not None:
+                sub.events.extend(e for e in self._history if e[0] > last_id)
+            self._subscribers.add(sub)
+        if sub.events:
+            wake()
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def stats(self):
+        return {'subscribers': len(self._subscribers), 'published': self.published, 'dropped': self.dropped}
+
+
+class SharedBroadcaster(Broadcaster):
+    """Broadcaster whose events pass through a table of a database shared by several processes.
+
+    publish() appends a row; a relay thread in each process reads the new
+    rows every `interval` seconds (at once for its own) and fans them out
+    to that process's subscribers, numbered by row id. So a subscriber
+    hears the events of every worker, and can resume with Last-Event-ID
+    on any of them. The relay starts with the first request.
+    """
+
+    def __init__(self, engine, interval=RELAY_INTERVAL, keep=EVENT_ROWS, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self.interval = interval
+        self.keep = keep
+        self._poll = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def install(self):
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(f'CREATE TABLE IF NOT EXISTS {EVENT_TABLE} (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                 'kind VARCHAR(20) NOT NULL, data TEXT NOT NULL)')
+
+    def publish(self, kind, **data):
+        with self.engine.begin() as conn:
+            event_id = conn.exec_driver_sql(f'INSERT INTO {EVENT_TABLE} (kind, data) VALUES (?, ?)',
+                                            (kind, json.dumps(data, separators=(',', ':')))).lastrowid
+            if event_id % 1000 == 0:
+                conn.exec_driver_sql(f'DELETE FROM {EVENT_TABLE} WHERE id <= ?', (event_id - self.keep,))
+        self._poll.set()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                with self.engine.connect() as conn:
+                    last = conn.exec_driver_sql(f'SELECT max(id) FROM {EVENT_TABLE}').scalar() or 0
+                self._thread = threading.Thread(target=self._run, args=(last,), name='event-relay', daemon=True)
+                self._thread.start()
+
+    def _run(self, last):
+        while True:
+            self._poll.wait(self.interval)
+            self._poll.clear()
+            try:
+                last = self.relay(last)
+            except Exception:
+                log.exception('could not read events after %d', last)
+
+    def relay(self, last):
+        """Fan out the events stored after `last`; returns the id of the last one"""
+        with self.engine.connect() as conn:
+            rows = conn.exec_driver_sql(f'SELECT id, kind, data FROM {EVENT_TABLE} WHERE id > ? ORDER BY id',
+                                        (last,)).all()
+        for event_id, kind, data in rows:
+            self.deliver(event_id, kind, data)
+        return rows[-1][0] if rows else last
+
+
+def sse_format(event):
+    event_id, kind, data = event
+    return f'id: {event_id}\nevent: {kind}\ndata: {data}\n\n'
+
+
+def last_event_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def stream(broadcaster, last_id=None):
+    """SSE body for a WSGI response.
+
+    Each open stream holds its worker for as long as the client stays
+    connected, so EventServer only falls back to it for a few clients.
+    """
+    ready = threading.Event()
+    sub = broadcaster.subscribe(ready.set, last_id)
+    try:
+        yield 'retry: 3000\n\n'
+        while not sub.closed:
+            if not ready.wait(HEARTBEAT):
+                yield ': keep-alive\n\n'
+                continue
+            ready.clear()
+            yield ''.join(sse_format(event) for event in sub.drain())
+    finally:
+        broadcaster.unsubscribe(sub)
+
+
+SSE_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+
+
+async def _client(broadcaster, reader, writer):
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+    sub = None
+    try:
+        request = await reader.readuntil(b'\r\n\r\n')
+        line, *headers = request.decode('latin-1').split('\r\n')
+        if not line.startswith('GET /events'):
+            writer.write(b'HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            return
+        fields = dict(h.split(':', 1) for h in headers if ':' in h)
+        last_id = last_event_id(fields.get('Last-Event-ID', '').strip() or None)
+        sub = broadcaster.subscribe(lambda: loop.call_soon_threadsafe(ready.set), last_id)
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n'
+                     b'Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\nretry: 3000\n\n')
+        while not sub.closed:
+            try:
+                await asyncio.wait_for(ready.wait(), HEARTBEAT)
+            except asyncio.TimeoutError:
+                writer.write(b': keep-alive\n\n')
+            else:
+                ready.clear()
+                writer.write(''.join(sse_format(event) for event in sub.drain()).encode())
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    finally:
+        if sub is not None:
+            broadcaster.unsubscribe(sub)
+        writer.close()
+
+
+def serve_async(broadcaster, host=EVENTS_HOST, port=EVENTS_PORT):
+    """Serve GET /events from one asyncio thread.
+
+    Every connection is a coroutine waiting on an asyncio.Event, so idle
+    clients cost a socket and a few objects rather than a thread each.
+    The port is bound with SO_REUSEPORT, so every worker process of a
+    WSGI server can take subscribers on it. Returns the thread
+    running the event loop; raises OSError when the port cannot be bound.
+    """
+    ready = threading.Event()
+    errors = []
+
+    def run():
+        async def main():
+            try:
+                server = await asyncio.start_server(lambda r, w: _client(broadcaster, r, w), host, port,
+                                                    reuse_port=True)
+            except OSError as e:
+                errors.append(e)
+                return
+            finally:
+                ready.set()
+            async with server:
+                await server.serve_forever()
+        asyncio.run(main())
+
+    thread = threading.Thread(target=run, name='sse-server', daemon=True)
+    thread.start()
+    ready.wait(5)
+    if errors:
+        raise errors[0]
+    return thread
+
+
+class EventServer:
+    """Where an app's /events subscribers are served.
+
+    Pages always connect to /events on their own origin (or EVENTS_URL).
+    By default the app's /events route serves it; that holds a worker
+    thread per stream, so it takes at most `max_streams` and answers 503
+    beyond that. With EVENTS_PORT set, serve_async() also listens on
+    EVENTS_HOST (127.0.0.1) from the first request on, so that the
+    reloader's parent and CLI commands never bind it, and a proxy in front
+    of the app forwards /events there; idle clients then cost no thread.
+    """
+
+    def __init__(self, broadcaster, port, host=EVENTS_HOST, max_streams=WSGI_STREAMS):
+        self.broadcaster = broadcaster
+        self.port = port
+        self.host = host
+        self.max_streams = max_streams
+        self.streams = 0
+        self.error = None
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self.broadcaster.start()
+        if self.port is None or self.thread is not None or self.error is not None:
+            return
+        with self._lock:
+            if self.thread is None and self.error is None:
+                try:
+                    self.thread = serve_async(self.broadcaster, self.host, self.port)
+                except OSError as e:
+                    self.error = str(e)
+
+    def wsgi_response(self, last_id):
+        with self._lock:
+            if self.streams >= self.max_streams:
+                return Response('too many event streams\n', 503, {'Retry-After': '30'})
+            self.streams += 1
+        response = Response(stream(self.broadcaster, last_id), mimetype='text/event-stream', headers=SSE_HEADERS)
+        response.call_on_close(self._closed)
+        return response
+
+    def _closed(self):
+        with self._lock:
+            self.streams -= 1
+
+    def stats(self):
+        return dict(self.broadcaster.stats(), port=self.port if self.thread else None,
+                    error=self.error, wsgi_streams=self.streams)
+
+
+def init_app(app, broadcaster):
+    """Serve `broadcaster` to the app's pages; returns the EventServer.
+
+    EVENTS_PORT (and EVENTS_HOST) turn on the asyncio server; it is off by
+    default, and on Vercel, where a function cannot listen on a port of
+    its own. EVENTS_URL overrides the URL pages connect to.
+    """
+    port = str(app.config.get('EVENTS_PORT') or os.environ.get('EVENTS_PORT') or 'off')
+    if os.environ.get('VERCEL'):
+        port = 'off'
+    server = EventServer(broadcaster, None if port == 'off' else int(port),
+                         app.config.get('EVENTS_HOST') or os.environ.get('EVENTS_HOST') or EVENTS_HOST,
+                         int(app.config.get('EVENTS_WSGI_STREAMS', WSGI_STREAMS)))
+
+    def events():
+        return server.wsgi_response(last_event_id(request.headers.get('Last-Event-ID')))
+
+    app.before_request(server.start)
+    app.add_template_global(lambda: app.config.get('EVENTS_URL') or '/events', 'events_url')
+    app.add_url_rule('/events', 'events', events)
+    return server
@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class VersionCounter:
+    """Monotonic counter bumped by every write to a table, with the time of the last bump"""
+
+    def __init__(self):
+        self.value = 0
+        self.modified = time.time()
+        self._lock = threading.Lock()
+
+    def bump(self):
+        with self._lock:
+            self.value += 1
+            self.modified = time.time()
+            return self.value
+
+
+class FragmentCache:
+    """LRU cache of rendered HTML fragments, bounded by total size.
+
+    Entries are keyed on a version as well as the caller's key, so a new
+    version makes every older fragment unreachable; they then age out of
+    the LRU as new ones are stored. The version has to change with every
+    write any process makes to what the fragment shows, so apps on a
+    database take it from there (conditional.StoredVersions), not from a
+    VersionCounter.
+    """
+
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        with self._lock:
+            entry = self._entries.get((version, key))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((version, key))
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, version, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop((version, key), None)
+            if old is not None:
+                self.size -= old[1]
+            self._entries[(version, key)] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def request_key(request):
+    """Cache key for a page: its path and query string, order-insensitive"""
+    return request.path, tuple(sorted(request.args.items(multi=True)))
@@ -0,0 +1,318 @@
+"""Responsive image derivatives for local images.
+
+Images under static/ (the site's own, and product photos uploaded through
+/addagroproduct into static/uploads/) are resized to a few widths as WebP
+and JPEG. Derivatives live in static/derived/<content hash>/, so a file is
+processed once no matter how many products use it, and a changed file
+gets a new directory. Hashing and resizing run off the request thread;
+a page asking for an image whose derivatives are not known yet gets None
+back, renders the original, and picks up the srcset once they are.
+
+`python images.py` renders derivatives for everything already in static/.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import send_from_directory
+
+from assets import IMMUTABLE
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional: without Pillow pages keep the original images
+    Image = None
+
+log = logging.getLogger(__name__)
+
+UPLOAD_DIR = 'uploads'
+CACHE_DIR = 'derived'
+SOURCE_DIRS = ('images', UPLOAD_DIR)
+WIDTHS = (320, 640, 960, 1280, 1920)
+# (format, Pillow save options) of every derivative
+FORMATS = (('webp', {'quality': 80, 'method': 4}),
+           ('jpeg', {'quality': 82, 'optimize': True, 'progressive': True}))
+EXTENSIONS = {'webp': 'webp', 'jpeg': 'jpg'}
+UPLOAD_TYPES = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+# product cards are a quarter of the row on desktop and the full width on phones
+CARD_SIZES = '(min-width: 992px) 25vw, (min-width: 768px) 33vw, (min-width: 576px) 50vw, 100vw'
+INDEX = 'index.json'
+# seconds one image may take in its worker process
+RENDER_TIMEOUT = 120
+# image urls whose derivatives are remembered, least recently used dropped first
+MAX_IMAGES = 1024
+
+
+def content_key(data):
+    return hashlib.sha256(data).hexdigest()[:20]
+
+
+def upload_key(path):
+    """The content key save_upload() put in an uploaded image's name, or None for other images"""
+    folder, _, name = path.partition('/')
+    key = os.path.splitext(name)[0]
+    if folder == UPLOAD_DIR and len(key) == 20 and all(c in '0123456789abcdef' for c in key):
+        return key
+    return None
+
+
+def render(source, out_dir, widths=WIDTHS):
+    """Resize `source` into out_dir; runs in a worker process.
+
+    Widths at or above the original are skipped (the original width is
+    used instead), so nothing is ever upscaled. index.json is written
+    last and marks the set as complete.
+    """
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        width, height = image.size
+        targets = sorted({w for w in widths if w < width} | {min(width, widths[-1])})
+        os.makedirs(out_dir, exist_ok=True)
+        variants = []
+        for w in targets:
+            h = max(1, round(height * w / width))
+            resized = image if w == width else image.resize((w, h), Image.LANCZOS)
+            for fmt, options in FORMATS:
+                name = f'{w}.{EXTENSIONS[fmt]}'
+                tmp = os.path.join(out_dir, name + '.tmp')
+                resized.save(tmp, fmt.upper(), **options)
+                os.replace(tmp, os.path.join(out_dir, name))
+            variants.append((w, h))
+    tmp = os.path.join(out_dir, INDEX + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'sizes': variants}, f)
+    os.replace(tmp, os.path.join(out_dir, INDEX))
+    return variants
+
+
+def render_in_worker(source, out_dir):
+    """render() in a fresh `python images.py --render` process; returns its variants.
+
+    Not a ProcessPoolExecutor: its spawned workers re-import the script
+    that started the app (main.py, index.py, ...) and so run all of its
+    setup again. This process imports only this module.
+    """
+    done = subprocess.run([sys.executable, os.path.abspath(__file__), '--render', source, out_dir],
+                          capture_output=True, text=True, timeout=RENDER_TIMEOUT)
+    if done.returncode != 0:
+        lines = done.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f'worker exited with {done.returncode}')
+    return [tuple(size) for size in json.loads(done.stdout)]
+
+
+class ImagePipeline:
+    """Derivative lookup for templates plus the threads that prepare them.
+
+    srcset() never touches the disk: it answers from a bounded table of
+    known images, and otherwise queues the image once and returns None.
+    A pool thread then finds the content key (from an upload's name, or
+    by hashing the file), loads the derivative index, and renders a
+    missing set in a worker process. Paths are assumed not to change
+    content while a process runs: uploads are named by their content,
+    and the site's own images change with a deploy. `on_ready` is called
+    once an image's derivatives are known, e.g. to drop cached pages that
+    were rendered without them.
+    """
+
+    def __init__(self, static_dir, static_url_path='/static', workers=None, on_ready=None, max_images=MAX_IMAGES):
+        self.static_dir = static_dir
+        self.cache_dir = os.path.join(static_dir, CACHE_DIR)
+        self.prefix = static_url_path.rstrip('/') + '/'
+        self.workers = workers
+        self.on_ready = on_ready
+        self.max_images = max_images
+        self.rendered = 0
+        self.failed = 0
+        self._sets = OrderedDict()  # source path -> srcset dict, or None when it has none
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._pool = None  # threads that hash images and each wait on one worker process
+        self._disabled = False
+
+    def _source(self, url):
+        """Static-relative path of a local image url, or None for remote and unknown images"""
+        if not url or not url.startswith(self.prefix) or Image is None:
+            return None
+        path = url[len(self.prefix):]
+        if path.split('/', 1)[0] not in SOURCE_DIRS or '..' in path.split('/'):
+            return None
+        return path
+
+    def srcset(self, url):
+        """{'webp', 'jpeg': srcset strings, 'src': fallback url, 'sizes': [(w, h, webp, jpeg)]} or None"""
+        path = self._source(url)
+        if path is None:
+            return None
+        with self._lock:
+            if path in self._sets:
+                self._sets.move_to_end(path)
+                return self._sets[path]
+        self.submit(path)
+        return None
+
+    def _remember(self, path, result):
+        with self._lock:
+            self._sets[path] = result
+            self._sets.move_to_end(path)
+            while len(self._sets) > self.max_images:
+                self._sets.popitem(last=False)
+
+    def _load(self, key):
+        try:
+            with open(os.path.join(self.cache_dir, key, INDEX)) as f:
+                sizes = json.load(f)['sizes']
+        except (OSError, ValueError, KeyError):
+            return None
+        base = f'{self.prefix}{CACHE_DIR}/{key}/'
+        rows = [(w, h, f'{base}{w}.webp', f'{base}{w}.jpg') for w, h in sizes]
+        fallback = next((jpeg for w, h, webp, jpeg in rows if w >= 640), rows[-1][3])
+        return {'webp': ', '.join(f'{webp} {w}w' for w, h, webp, jpeg in rows),
+                'jpeg': ', '.join(f'{jpeg} {w}w' for w, h, webp, jpeg in rows),
+                'src': fallback, 'sizes': rows}
+
+    def submit(self, path, key=None):
+        """Queue a static-relative image path to be prepared; returns the Future (of the srcset) or None"""
+        with self._lock:
+            if path in self._pending:
+                return None
+            self._pending.add(path)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers or os.cpu_count() or 1, thread_name_prefix='image-render')
+            future = self._pool.submit(self._prepare, path, key)
+        future.add_done_callback(lambda f: self._done(path, f))
+        return future
+
+    def _prepare(self, path, key):
+        """Runs on a pool thread: the srcset of `path`, rendering its derivatives first if needed"""
+        source = os.path.join(self.static_dir, path)
+        key = key or upload_key(path)
+        if key is None:
+            try:
+                with open(source, 'rb') as f:
+                    key = content_key(f.read())
+            except OSError:
+                return None
+        result = self._load(key)
+        if result is None and not self._disabled and os.path.exists(source):
+            render_in_worker(source, os.path.join(self.cache_dir, key))
+            self.rendered += 1
+            result = self._load(key)
+        return result
+
+    def _done(self, path, future):
+        error = future.exception()
+        with self._lock:
+            self._pending.discard(path)
+            if isinstance(error, OSError):
+                # no process support (some serverless sandboxes): keep serving the originals,
+                # and the derivatives rendered at build time
+                log.error('image workers unavailable: %s', error)
+                self._disabled = True
+                return
+        if error is not None:
+            log.warning('could not render %s: %s', path, error)
+            self.failed += 1
+            # not retried while it is remembered
+            self._remember(path, None)
+            return
+        result = future.result()
+        self._remember(path, result)
+        if result is not None and self.on_ready is not None:
+            self.on_ready()
+
+    def save_upload(self, file):
+        """Store an uploaded image under static/uploads/ by content hash; returns its url or None.
+
+        None also when static/ cannot be written (read-only serverless
+        bundles), so the form's image URL is used instead.
+        """
+        if file is None or not file.filename:
+            return None
+        ext = os.path.splitext(file.filename)[1].lower()
+        data = file.read(MAX_UPLOAD_BYTES + 1)
+        if ext not in UPLOAD_TYPES or not data or len(data) > MAX_UPLOAD_BYTES:
+            return None
+        key = content_key(data)
+        path = f'{UPLOAD_DIR}/{key}{ext}'
+        target = os.path.join(self.static_dir, UPLOAD_DIR, key + ext)
+        if not os.path.exists(target):
+            try:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target + '.tmp', 'wb') as f:
+                    f.write(data)
+                os.replace(target + '.tmp', target)
+            except OSError as e:
+                log.warning('could not store an uploaded image: %s', e)
+                return None
+        if Image is not None:
+            self.submit(path, key)
+        return self.prefix + path
+
+    def stats(self):
+        return {'images': len(self._sets), 'pending': len(self._pending),
+                'rendered': self.rendered, 'failed': self.failed}
+
+    def close(self):
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+def init_app(app, on_ready=None, workers=None):
+    """Create the pipeline, expose image_srcset() to templates and serve derivatives as immutable"""
+    pipeline = ImagePipeline(app.static_folder, app.static_url_path, workers, on_ready)
+
+    def derived(filename):
+        response = send_from_directory(pipeline.cache_dir, filename)
+        response.headers['Cache-Control'] = IMMUTABLE
+        return response
+
+    app.add_template_global(pipeline.srcset, 'image_srcset')
+    app.add_template_global(CARD_SIZES, 'card_sizes')
+    app.add_url_rule(f'{app.static_url_path}/{CACHE_DIR}/<path:filename>', 'image_derivative', derived)
+    return pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render responsive derivatives for the images in static/')
+    parser.add_argument('static_dir', nargs='?', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static'))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--render', nargs=2, metavar=('SOURCE', 'OUT_DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if Image is None:
+        raise SystemExit('Pillow is not installed')
+    if args.render:
+        # one image for ImagePipeline, which reads the sizes from stdout
+        print(json.dumps(render(*args.render)))
+        return
+    pipeline = ImagePipeline(args.static_dir, workers=args.workers)
+    futures = []
+    for folder in SOURCE_DIRS:
+        root = os.path.join(args.static_dir, folder)
+        for name in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+            if os.path.splitext(name)[1].lower() in UPLOAD_TYPES:
+                futures.append((f'{folder}/{name}', pipeline.submit(f'{folder}/{name}')))
+    for path, future in futures:
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f'{path}: failed ({e})')
+            continue
+        sizes = ', '.join(f'{w}x{h}' for w, h, webp, jpeg in result['sizes']) if result else 'not rendered'
+        print(f'{path}: {sizes}')
+    print(f'{pipeline.rendered} images rendered, the rest were up to date')
+    pipeline.close()
+
+
+if __name__ == '__main__':
+    main()
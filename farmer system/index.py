@@ -1,26 +1,80 @@
-from flask import Flask, render_template, request, session, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, session, redirect, url_for, flash, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin, login_user, logout_user, LoginManager, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from passwords import DEFAULT_METHOD, PasswordHasher
+from catalog import decode_cursor, filter_query, keyset_page, page_size, product_filters, product_json
+from search import FTS_DDL, install as install_search, search_page
+from sqlite_profile import apply_profile, engine_options, shared_memory_uri
+from bulk_import import BATCH_SIZE, detect_format, import_file
+from export import export_response, wants_gzip
+from user_cache import IdentityCache, invalidate_on_change, load_cached
+from fragment_cache import FragmentCache, VersionCounter, request_key
+from conditional import BOOT_ID, StoredVersions, conditional_get
+from audit import AuditLog, format_epoch, log_page, parse_log_cursor, parse_time, table_writer, watch
+from auction import AuctionEngine, AuctionScheduler, bid_status, close_auctions, init_app as init_auction_scheduler, load_book, pending_auctions
+from analytics import cached_stats_json, load_columns
+from quantity import derive_on_write
+from events import Broadcaster, init_app as init_events
+from assets import init_app as init_assets
+from images import init_app as init_images
+from jinja_cache import init_app as init_jinja_cache
+from snapshot import boot as boot_database, save as save_snapshot, schema_version
+from markupsafe import Markup
+import click
 import os
+import time
 
 # Create Flask app
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'harshithbhaskar-production-key-2024')
 
-# Database configuration - Use in-memory SQLite for serverless
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+# Database configuration - Use in-memory SQLite for serverless; one database shared by a
+# pool of connections, so request and background threads each get their own connection
+app.config['SQLALCHEMY_DATABASE_URI'] = shared_memory_uri('farm-index')
+# Prebuilt database copied into memory at boot instead of running DDL and seed inserts;
+# rebuilt and rewritten when missing or made for other models. Empty disables it.
+app.config['DB_SNAPSHOT'] = os.environ.get('DB_SNAPSHOT', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'index_snapshot.db'))
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['PRODUCTS_PER_PAGE'] = 24
+# Password KDF and its cost (see passwords.py), and how many hashes may run at once
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD)
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+hasher = PasswordHasher(app.config['PASSWORD_HASH_METHOD'], app.config['PASSWORD_HASH_WORKERS'])
+app.add_template_filter(format_epoch, 'epoch')
+# static_url() links fingerprinted, pre-compressed assets once `python assets.py` has built them
+assets_manifest = init_assets(app)
+# Templates precompiled by jinja_cache.py (modules shipped with the code, bytecode per machine); 'off' disables either
+app.config['JINJA_MODULES_DIR'] = os.environ.get('JINJA_MODULES_DIR')
+app.config['JINJA_CACHE_DIR'] = os.environ.get('JINJA_CACHE_DIR')
+template_cache = init_jinja_cache(app)
+# WAL, busy_timeout, mmap and pool sizing, see sqlite_profile.py
+app.config['SQLITE_PROFILE'] = os.environ.get('SQLITE_PROFILE', 'production')
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config['SQLITE_PROFILE'])
 
 db = SQLAlchemy(app)
+with app.app_context():
+    apply_profile(db.engine, app.config['SQLITE_PROFILE'])
+
+# Rendered product cards, reused until catalog_version() moves on
+grid_cache = FragmentCache(max_bytes=int(os.environ.get('GRID_CACHE_BYTES', 8 * 1024 * 1024)))
+# Product added / availability / bid price events pushed to /events subscribers of this process,
+# which holds its own copy of the data too (see events.py)
+broadcaster = Broadcaster()
+event_server = init_events(app, broadcaster)
+# Resized WebP/JPEG copies of local images, rendered by worker processes; cards pick them up on the next render
+image_version = VersionCounter()
+images = init_images(app, on_ready=image_version.bump)
 
 # Login manager setup
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 
+# Logged in users are kept in memory so each page view skips the user SELECT
+user_cache = IdentityCache(maxsize=int(os.environ.get('USER_CACHE_SIZE', 1024)), ttl=int(os.environ.get('USER_CACHE_TTL', 300)))
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return load_cached(db.session, User, int(user_id), user_cache)
 
 # Database Models
 class Test(db.Model):
@@ -37,20 +91,47 @@ class Addagroproducts(db.Model):
     pid = db.Column(db.Integer, primary_key=True)
     productname = db.Column(db.String(100))
     productdesc = db.Column(db.String(300))
-    price = db.Column(db.Integer)
-    category = db.Column(db.String(50))
+    price = db.Column(db.Integer, index=True)
+    category = db.Column(db.String(50), index=True)
     quantity = db.Column(db.String(50))
+    quantityAmount = db.Column(db.Float)  # parsed from quantity, in quantityUnit
+    quantityUnit = db.Column(db.String(10))  # kg, l, piece, bag, ... see quantity.py
     basePrice = db.Column(db.Integer)
     auctionStartTime = db.Column(db.String(100))
     auctionEndTime = db.Column(db.String(100))
+    auctionClosed = db.Column(db.Boolean, default=False, server_default='0')
+    auctionWinner = db.Column(db.String(50))  # highest bidder and bid, set when the auction closes
+    auctionPrice = db.Column(db.Integer)
     image = db.Column(db.String(200))
     available = db.Column(db.Boolean, default=True)
 
+    # keyset pagination of the catalog seeks on (available, pid);
+    # the auction scheduler rebuilds its heap from open auctions by end time;
+    # quantity filters are a range on (quantityUnit, quantityAmount)
+    __table_args__ = (db.Index('ix_addagroproducts_available_pid', 'available', 'pid'),
+                      db.Index('ix_addagroproducts_auction_end', 'auctionClosed', 'auctionEndTime'),
+                      db.Index('ix_addagroproducts_quantity', 'quantityUnit', 'quantityAmount'))
+
+derive_on_write(Addagroproducts)
+
 class Trig(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     fid = db.Column(db.String(100))
     action = db.Column(db.String(100))
-    timestamp = db.Column(db.String(100))
+    timestamp = db.Column(db.Integer)  # epoch seconds
+
+    # /triggers pages newest first by (timestamp, id) within a time range
+    __table_args__ = (db.Index('ix_trig_timestamp_id', 'timestamp', 'id'),)
+
+class Bid(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    pid = db.Column(db.Integer)
+    bidder = db.Column(db.String(50))
+    amount = db.Column(db.Integer)
+    created_at = db.Column(db.Integer)  # epoch seconds
+
+    # order books load the highest bid of a product from (pid, amount)
+    __table_args__ = (db.Index('ix_bid_pid_amount', 'pid', 'amount'),)
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -58,6 +139,8 @@ class User(UserMixin, db.Model):
     email = db.Column(db.String(50), unique=True)
     password = db.Column(db.String(1000))
 
+invalidate_on_change(User, user_cache)
+
 class Register(db.Model):
     rid = db.Column(db.Integer, primary_key=True)
     farmername = db.Column(db.String(50))
@@ -68,9 +151,46 @@ class Register(db.Model):
     address = db.Column(db.String(50))
     farming = db.Column(db.String(50))
 
-# Initialize database
+# Change sequence per table, kept in the database by triggers; list pages answer conditional GETs from it.
+# The database is this instance's own copy, so the boot id goes into every validator too.
 with app.app_context():
+    table_versions = StoredVersions(db.engine, BOOT_ID, products=Addagroproducts.__tablename__,
+                                    farmers=Register.__tablename__, trig=Trig.__tablename__)
+
+def catalog_version():
+    """Cache version of everything rendered from the products table"""
+    return table_versions.state('products')[0] + (image_version.value,)
+
+# Audit trail behind /triggers: ORM writes queue an event, a background thread inserts them in batches
+with app.app_context():
+    audit_log = AuditLog(table_writer(db.engine, Trig.__table__))
+watch(Register, audit_log, 'FARMER')
+watch(Addagroproducts, audit_log, 'PRODUCT')
+
+# Live auction order books, one per product; a bid is in the bid table before the bidder hears it was accepted
+with app.app_context():
+    auctions = AuctionEngine(lambda pid: load_book(db.session, Addagroproducts, Bid, pid), table_writer(db.engine, Bid.__table__))
+
+def close_expired(pids):
+    with app.app_context():
+        closed = close_auctions(db.session, Addagroproducts, Bid, auctions, pids, time.time())
+    for pid in closed:
+        broadcaster.publish('availability', pid=pid, available=False)
+    return closed
+
+def open_auctions():
+    with app.app_context():
+        return pending_auctions(db.session, Addagroproducts)
+
+# Closes auctions as they end; started by the first request. The database is this process's own, so no lock
+auction_scheduler = AuctionScheduler(close_expired, open_auctions)
+init_auction_scheduler(app, auction_scheduler)
+
+def init_database():
+    """Create the tables and the search index, and add the sample data"""
     db.create_all()
+    install_search(db.engine)
+    table_versions.install()
     
     # Add some sample data for demonstration
     if not Farming.query.first():
@@ -84,6 +204,12 @@ with app.app_context():
             db.session.add(farming)
         db.session.commit()
 
+# Initialize database: restored page by page from the snapshot with the SQLite backup API
+# into the shared in-memory database, which every pooled connection then sees
+with app.app_context():
+    snapshot_version = schema_version(db.metadata, db.engine, FTS_DDL + table_versions.ddl())
+    boot_report = boot_database(db.engine, app.config['DB_SNAPSHOT'], snapshot_version, init_database)
+
 # Routes
 @app.route('/')
 def index(): 
@@ -91,14 +217,43 @@ def index():
 
 @app.route('/farmerdetails')
 @login_required
+@conditional_get(table_versions, 'farmers', counters=(image_version,))
 def farmerdetails():
     query = Register.query.all()
     return render_template('farmerdetails.html', query=query)
 
 @app.route('/agroproducts')
+@conditional_get(table_versions, 'products', counters=(image_version,))
 def agroproducts():
-    query = Addagroproducts.query.all()
-    return render_template('agroproducts.html', query=query)
+    filters = product_filters(request.args)
+    as_json = request.args.get('format') == 'json'
+    key = request_key(request)
+    version = catalog_version()
+    cached = None if as_json else grid_cache.get(key, version)
+    if cached:
+        grid_html, product_count, next_cursor = cached
+        return render_template('agroproducts.html', grid_html=grid_html, product_count=product_count, next_cursor=next_cursor, filters=filters)
+    limit = page_size(request.args, app.config)
+    after = decode_cursor(request.args.get('cursor'))
+    products = filter_query(Addagroproducts.query, Addagroproducts, filters)
+    query, next_cursor = keyset_page(products, Addagroproducts.pid, after, limit)
+    if as_json:
+        return jsonify(products=[product_json(p) for p in query], next_cursor=next_cursor)
+    grid_html = Markup(render_template('product_grid.html', query=query))
+    grid_cache.put(key, version, (grid_html, len(query), next_cursor), len(grid_html))
+    return render_template('agroproducts.html', grid_html=grid_html, product_count=len(query), next_cursor=next_cursor, filters=filters)
+
+@app.route('/search')
+def search():
+    q = request.args.get('q', '')
+    limit = page_size(request.args, app.config)
+    offset = decode_cursor(request.args.get('cursor')) or 0
+    filters = product_filters(request.args)
+    products = filter_query(Addagroproducts.query, Addagroproducts, filters)
+    query, next_cursor = search_page(products, Addagroproducts, q, offset, limit)
+    if request.args.get('format') == 'json':
+        return jsonify(products=[product_json(p) for p in query], next_cursor=next_cursor)
+    return render_template('agroproducts.html', query=query, next_cursor=next_cursor, filters=filters, q=q)
 
 @app.route('/addagroproduct', methods=['POST', 'GET'])
 @login_required
@@ -112,7 +267,9 @@ def addagroproduct():
         category = request.form.get('category')
         quantity = request.form.get('quantity')
         basePrice = request.form.get('basePrice')
-        image = request.form.get('image')
+        auctionStartTime = request.form.get('auctionStartTime') or None
+        auctionEndTime = request.form.get('auctionEndTime') or None
+        image = images.save_upload(request.files.get('image_file')) or request.form.get('image')
         available = request.form.get('available') == 'on'
         
         products = Addagroproducts(
@@ -124,11 +281,15 @@ def addagroproduct():
             category=category,
             quantity=quantity,
             basePrice=basePrice,
+            auctionStartTime=auctionStartTime,
+            auctionEndTime=auctionEndTime,
             image=image,
             available=available
         )
         db.session.add(products)
         db.session.commit()
+        auction_scheduler.schedule(products.pid, parse_time(auctionEndTime))
+        broadcaster.publish('product', pid=products.pid, productname=products.productname, price=products.price, available=products.available)
         flash("Product Listed Successfully! Ready for customers to buy.", "success")
         return redirect('/agroproducts')
    
@@ -136,9 +297,12 @@ def addagroproduct():
 
 @app.route('/triggers')
 @login_required
+@conditional_get(table_versions, 'trig', counters=(image_version,))
 def triggers():
-    query = Trig.query.all()
-    return render_template('triggers.html', query=query)
+    start = parse_time(request.args.get('from'))
+    end = parse_time(request.args.get('to'), end=True)
+    query, next_cursor = log_page(Trig.query, Trig, start, end, parse_log_cursor(request.args.get('cursor')))
+    return render_template('triggers.html', query=query, next_cursor=next_cursor)
 
 @app.route('/addfarming', methods=['POST', 'GET'])
 @login_required
@@ -202,7 +366,7 @@ def signup():
         if user:
             flash("Email Already Exists", "warning")
             return render_template('signup.html')
-        newuser = User(username=username, email=email, password=password)
+        newuser = User(username=username, email=email, password=hasher.hash(password))
         db.session.add(newuser)
         db.session.commit()
         flash("Signup Successful! Please Login", "success")
@@ -215,7 +379,12 @@ def login():
         email = request.form.get('email')
         password = request.form.get('password')
         user = User.query.filter_by(email=email).first()
-        if user and user.password == password:
+        ok, new_hash = hasher.verify(user.password if user else None, password)
+        if ok:
+            if new_hash:
+                # Plaintext or an older cost: store the password under the current method
+                user.password = new_hash
+                db.session.commit()
             login_user(user)
             flash("Login Successful", "success")
             return redirect(url_for('index'))
@@ -252,6 +421,7 @@ def register():
 
 @app.route('/myproducts')
 @login_required
+@conditional_get(table_versions, 'products', counters=(image_version,))
 def myproducts():
     """Show products listed by current user"""
     user_products = Addagroproducts.query.filter_by(email=current_user.email).all()
@@ -265,12 +435,114 @@ def toggle_availability(pid):
     if product:
         product.available = not product.available
         db.session.commit()
+        auctions.refresh(pid, product)
+        broadcaster.publish('availability', pid=pid, available=product.available)
         status = "available" if product.available else "unavailable"
         flash(f"Product marked as {status}", "success")
     else:
         flash("Product not found or you don't have permission", "error")
     return redirect('/myproducts')
 
+@app.route('/bid/<int:pid>', methods=['POST'])
+@login_required
+def bid(pid):
+    """Place a bid on an auctioned product"""
+    amount = request.form.get('amount', type=int)
+    if request.is_json:
+        amount = (request.get_json(silent=True) or {}).get('amount')
+    result = auctions.bid(pid, current_user.email, amount if isinstance(amount, int) else None)
+    if result.accepted:
+        broadcaster.publish('price', pid=pid, price=result.highest, bids=result.bids)
+    if request.is_json or request.args.get('format') == 'json':
+        return jsonify(result._asdict()), bid_status(result)
+    if result.accepted:
+        flash(f"Bid of ₹{result.highest} placed", "success")
+    else:
+        flash(f"Bid not accepted: {result.reason}", "warning")
+    return redirect(request.referrer or '/agroproducts')
+
+@app.route('/bids/<int:pid>')
+def bids(pid):
+    """Current state of a product's auction"""
+    book = auctions.book(pid)
+    if book is None:
+        return jsonify(error="product not found"), 404
+    return jsonify(book.to_dict())
+
+@app.route('/analytics/prices')
+@conditional_get(table_versions, 'products', per_user=False)
+def price_analytics():
+    """Per-category price, discount and availability statistics, recomputed when the catalog changes"""
+    def load():
+        with db.engine.connect() as conn:
+            return load_columns(conn, Addagroproducts.__table__)
+    return Response(cached_stats_json(grid_cache, catalog_version(), load), mimetype='application/json')
+
+# Tables that /import, /export and `flask import` work on
+BULK_TABLES = {'farmers': Register, 'products': Addagroproducts}
+
+@app.route('/import/<string:table>', methods=['POST'])
+@login_required
+def bulk_import(table):
+    """Bulk insert farmers or products from an uploaded CSV/NDJSON file"""
+    model = BULK_TABLES.get(table)
+    upload = request.files.get('file')
+    if model is None or upload is None:
+        return jsonify(error="POST a 'file' to /import/farmers or /import/products"), 400
+    try:
+        report = import_file(db.engine, model, upload.stream, detect_format(upload.filename, request.form.get('format')))
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+    return jsonify(report.to_dict())
+
+@app.route('/export/<string:table>')
+@login_required
+def export(table):
+    """Stream a table as CSV or NDJSON, optionally gzipped and only rows after ?since=<id>"""
+    model = BULK_TABLES.get(table)
+    fmt = request.args.get('format', 'csv')
+    if model is None or fmt not in ('csv', 'ndjson'):
+        return jsonify(error="Use /export/farmers or /export/products with format=csv or ndjson"), 400
+    return export_response(db.session, model, fmt, request.args.get('since', type=int), wants_gzip(request))
+
+def import_path(table, path, fmt=None, batch_size=BATCH_SIZE):
+    with open(path, 'rb') as f:
+        report = import_file(db.engine, BULK_TABLES[table], f, detect_format(path, fmt), batch_size)
+    click.echo(f"{path}: inserted {report.inserted} rows into {table}, {report.failed} failed")
+    for error in report.errors:
+        click.echo(f"  line {error['line']}: {error['error']}")
+
+@app.cli.command('import')
+@click.argument('table', type=click.Choice(list(BULK_TABLES)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', help='csv or ndjson (default: from the file extension)')
+@click.option('--batch-size', default=BATCH_SIZE, show_default=True)
+def import_command(table, path, fmt, batch_size):
+    """Bulk import farmers or products from a CSV/NDJSON file.
+
+    The database lives in memory, so the rows are gone when the command
+    exits; use `flask build-snapshot --import TABLE PATH` to keep them.
+    """
+    import_path(table, path, fmt, batch_size)
+
+@app.cli.command('build-snapshot')
+@click.argument('path', required=False, type=click.Path(dir_okay=False))
+@click.option('--import', 'imports', multiple=True,
+              type=(click.Choice(list(BULK_TABLES)), click.Path(exists=True, dir_okay=False)),
+              metavar='TABLE PATH', help='CSV/NDJSON file to import first; may be repeated')
+def build_snapshot_command(path, imports):
+    """Save the database, after importing any --import files into it, as the boot snapshot"""
+    for table, source in imports:
+        import_path(table, source)
+    path = path or app.config['DB_SNAPSHOT']
+    save_snapshot(db.engine, path, snapshot_version)
+    click.echo(f"saved snapshot {path} ({os.path.getsize(path)} bytes)")
+
+@app.route('/stats')
+@login_required
+def stats():
+    return jsonify(user_cache=user_cache.stats(), grid_cache=grid_cache.stats(), audit_log=audit_log.stats(), auctions=auctions.stats(), auction_scheduler=auction_scheduler.stats(), events=event_server.stats(), boot=boot_report, images=images.stats(), template_cache=template_cache.stats() if template_cache else None)
+
 @app.route('/test')
 def test():
     try:
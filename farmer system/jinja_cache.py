@@ -0,0 +1,225 @@
+"""Templates compiled ahead of time, for workers and cold starts.
+
+Jinja normally parses and compiles each template the first time a new
+process renders it. `python jinja_cache.py` does that work up front, in
+two forms:
+
+- compiled_templates/ holds every template as the Python module Jinja
+  generates for it, plus a manifest with the checksum of each source.
+  It does not depend on the interpreter or the checkout path, so it is
+  committed and ships with the Vercel bundle. A cold start there only
+  has Python compile the modules, instead of Jinja parsing and
+  generating them. A module is used only while its template's checksum
+  still matches, so an edited template is compiled from source until
+  the command runs again.
+- .jinja-cache/ holds Jinja bytecode for this interpreter. Servers with
+  a build or deploy step load it instead of compiling. Templates
+  compiled at runtime are written back to it, or to a directory under
+  /tmp where the bundle is read-only.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import tempfile
+
+import jinja2
+from flask import Flask
+from jinja2 import BaseLoader, FileSystemBytecodeCache, ModuleLoader
+
+from audit import format_epoch
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES = os.path.join(ROOT, 'templates')
+CACHE_DIR = os.path.join(ROOT, '.jinja-cache')
+COMPILED_DIR = os.path.join(ROOT, 'compiled_templates')
+MANIFEST = 'manifest.json'
+# writable on serverless platforms, but empty on every cold start
+FALLBACK_DIR = os.path.join(tempfile.gettempdir(), 'farm-jinja-cache')
+
+
+class BytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that counts hits and tolerates a read-only directory.
+
+    Serverless filesystems are read-only outside /tmp: the precompiled
+    files are still read, and templates compiled at runtime just are not
+    written back.
+    """
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def dump_bytecode(self, bucket):
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+    def stats(self):
+        return {'directory': self.directory, 'hits': self.hits, 'misses': self.misses}
+
+
+def checksum(source):
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+class CompiledLoader(BaseLoader):
+    """Loads templates from the modules precompile() wrote, falling back to `loader`.
+
+    The source is still read through `loader` to compare its checksum
+    with the manifest's, which costs a file read, not a compile.
+    """
+
+    def __init__(self, loader, directory, manifest):
+        self.loader = loader
+        self.directory = directory
+        self.templates = manifest['templates']
+        self.loaded = 0
+        self.stale = 0
+
+    def get_source(self, environment, template):
+        return self.loader.get_source(environment, template)
+
+    def list_templates(self):
+        return self.loader.list_templates()
+
+    def load(self, environment, name, globals=None):
+        source, filename, uptodate = self.loader.get_source(environment, name)
+        entry = self.templates.get(name)
+        if entry is None or entry['sha1'] != checksum(source):
+            self.stale += entry is not None
+            # compiled from source as usual, through the bytecode cache
+            return super().load(environment, name, globals)
+        with open(os.path.join(self.directory, entry['module']), encoding='utf-8') as f:
+            code = compile(f.read(), filename or name, 'exec')
+        namespace = {'__file__': filename}
+        exec(code, namespace)
+        template = environment.template_class.from_module_dict(environment, namespace, environment.make_globals(globals))
+        template._uptodate = uptodate
+        self.loaded += 1
+        return template
+
+    def stats(self):
+        return {'directory': self.directory, 'loaded': self.loaded, 'stale': self.stale}
+
+
+def read_manifest(directory):
+    """The manifest in `directory`, or None when missing or written by another Jinja version"""
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('jinja') == jinja2.__version__ else None
+
+
+def configured_dir(config, key, default):
+    """`key` from the app config, falling back to `default`; None when set to 'off'"""
+    directory = config.get(key) or default
+    return None if directory == 'off' else directory
+
+
+def usable_dir(directory):
+    """`directory` if it holds precompiled templates or can be written; else the /tmp fallback (or None)"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        pass
+    if os.path.isdir(directory) and (os.listdir(directory) or os.access(directory, os.W_OK)):
+        return directory
+    try:
+        os.makedirs(FALLBACK_DIR, exist_ok=True)
+    except OSError:
+        return None
+    return FALLBACK_DIR
+
+
+class TemplateCache:
+    """What init_app attached to an app; either part is None when it is off or unusable"""
+
+    def __init__(self, bytecode, modules):
+        self.bytecode = bytecode
+        self.modules = modules
+
+    def stats(self):
+        return {'bytecode': self.bytecode and self.bytecode.stats(), 'modules': self.modules and self.modules.stats()}
+
+
+def init_app(app):
+    """Attach the compiled modules (JINJA_MODULES_DIR) and the bytecode cache (JINJA_CACHE_DIR)
+    to the app's Jinja environment; returns the TemplateCache, or None when both are off"""
+    modules = None
+    directory = configured_dir(app.config, 'JINJA_MODULES_DIR', COMPILED_DIR)
+    manifest = directory and read_manifest(directory)
+    if manifest:
+        modules = app.jinja_env.loader = CompiledLoader(app.jinja_env.loader, directory, manifest)
+    bytecode = None
+    directory = configured_dir(app.config, 'JINJA_CACHE_DIR', CACHE_DIR)
+    directory = directory and usable_dir(directory)
+    if directory:
+        bytecode = app.jinja_env.bytecode_cache = BytecodeCache(directory)
+    if modules is None and bytecode is None:
+        return None
+    return TemplateCache(bytecode, modules)
+
+
+def template_app(templates):
+    """A plain Flask app on `templates`, so code is compiled with the options
+    (autoescaping) the apps render with; filters are checked at compile
+    time, so the apps' filters are registered too"""
+    app = Flask(__name__, template_folder=templates)
+    app.add_template_filter(format_epoch, 'epoch')
+    return app
+
+
+def precompile(directory=CACHE_DIR, templates=TEMPLATES):
+    """Compile every template into the bytecode cache in `directory`; returns the template names"""
+    app = template_app(templates)
+    app.config.update(JINJA_CACHE_DIR=directory, JINJA_MODULES_DIR='off')
+    init_app(app)
+    names = app.jinja_env.list_templates()
+    for name in names:
+        app.jinja_env.get_template(name)
+    return names
+
+
+def compile_modules(directory=COMPILED_DIR, templates=TEMPLATES):
+    """Write every template as a Python module into `directory`, with the manifest; returns the template names"""
+    env = template_app(templates).jinja_env
+    os.makedirs(directory, exist_ok=True)
+    for old in glob.glob(os.path.join(directory, 'tmpl_*.py')):
+        os.remove(old)
+    env.compile_templates(directory, zip=None, ignore_errors=False)
+    names = env.list_templates()
+    manifest = {'jinja': jinja2.__version__, 'templates': {
+        name: {'module': ModuleLoader.get_module_filename(name),
+               'sha1': checksum(env.loader.get_source(env, name)[0])} for name in names}}
+    with open(os.path.join(directory, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile the Jinja templates into Python modules and the bytecode cache')
+    parser.add_argument('--to-dir', default=CACHE_DIR, help='bytecode cache directory')
+    parser.add_argument('--modules-dir', default=COMPILED_DIR)
+    args = parser.parse_args()
+    names = compile_modules(args.modules_dir)
+    print(f'compiled {len(names)} templates into {args.modules_dir}')
+    precompile(args.to_dir)
+    print(f'compiled {len(names)} templates into {args.to_dir}')
+
+
+if __name__ == '__main__':
+    main()
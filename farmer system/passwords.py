@@ -0,0 +1,67 @@
+import hmac
+import os
+import threading
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# werkzeug method string: the KDF and its cost. Raise the numbers to make
+# each hash slower; stored hashes with other parameters are upgraded at login.
+#   scrypt:<n>:<r>:<p>        (werkzeug's default, n=32768 uses 32 MiB per hash)
+#   pbkdf2:sha256:<iterations>
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+
+def is_hash(stored):
+    """True for a werkzeug 'method$salt$hash' string, False for a legacy plaintext password"""
+    parts = stored.split('$')
+    return len(parts) == 3 and parts[0].startswith(('scrypt:', 'pbkdf2:'))
+
+
+class PasswordHasher:
+    """Caps how many password KDFs run at once.
+
+    This is a concurrency limit, not a way around waiting. The KDF runs
+    on the calling request thread, since a WSGI request cannot answer
+    before its hash is done. hashlib's scrypt and pbkdf2 release the GIL,
+    so up to `workers` hashes run in parallel while other requests are
+    served. Further logins and signups wait for a slot, which bounds the
+    CPU, and the memory (32 MiB per scrypt n=32768 hash), that a burst of
+    them can take.
+    """
+
+    def __init__(self, method=DEFAULT_METHOD, workers=None):
+        self.method = method
+        self.workers = workers or os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._dummy = None
+
+    def _run(self, fn, *args):
+        with self._slots:
+            return fn(*args)
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def needs_rehash(self, stored):
+        return not is_hash(stored) or stored.split('$', 1)[0] != self.method
+
+    def verify(self, stored, password):
+        """Check a password against a stored hash.
+
+        Returns (ok, new_hash); new_hash is set when the password was right
+        but stored as plaintext or with other KDF parameters, and should
+        replace the stored value.
+        """
+        if stored is None:
+            # unknown account: spend the same time as a real check
+            if self._dummy is None:
+                self._dummy = self.hash(os.urandom(16).hex())
+            self._run(check_password_hash, self._dummy, password or '')
+            return False, None
+        if is_hash(stored):
+            ok = self._run(check_password_hash, stored, password or '')
+        else:
+            ok = hmac.compare_digest(stored.encode(), (password or '').encode())
+        if ok and self.needs_rehash(stored):
+            return True, self.hash(password)
+        return ok, None
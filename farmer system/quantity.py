@@ -0,0 +1,143 @@
+import re
+
+from sqlalchemy import bindparam, event, inspect, select, update
+
+# Spellings farmers use for a unit -> (canonical unit, multiplier to it).
+# Weights are stored in kg, volumes in litres and counts in pieces, so
+# "500 g" and "0.5 kg" land on the same point of the quantity index.
+UNITS = {
+    'kg': ('kg', 1), 'kgs': ('kg', 1), 'kilo': ('kg', 1), 'kilos': ('kg', 1),
+    'kilogram': ('kg', 1), 'kilograms': ('kg', 1),
+    'g': ('kg', 0.001), 'gm': ('kg', 0.001), 'gms': ('kg', 0.001), 'gram': ('kg', 0.001),
+    'grams': ('kg', 0.001),
+    'q': ('kg', 100), 'qtl': ('kg', 100), 'quintal': ('kg', 100), 'quintals': ('kg', 100),
+    't': ('kg', 1000), 'mt': ('kg', 1000), 'ton': ('kg', 1000), 'tons': ('kg', 1000),
+    'tonne': ('kg', 1000), 'tonnes': ('kg', 1000),
+    'lb': ('kg', 0.45359237), 'lbs': ('kg', 0.45359237),
+    'l': ('l', 1), 'ltr': ('l', 1), 'ltrs': ('l', 1), 'litre': ('l', 1), 'litres': ('l', 1),
+    'liter': ('l', 1), 'liters': ('l', 1),
+    'ml': ('l', 0.001),
+    'piece': ('piece', 1), 'pieces': ('piece', 1), 'pc': ('piece', 1), 'pcs': ('piece', 1),
+    'no': ('piece', 1), 'nos': ('piece', 1), 'unit': ('piece', 1), 'units': ('piece', 1),
+    'item': ('piece', 1), 'items': ('piece', 1),
+    'dozen': ('piece', 12), 'dozens': ('piece', 12), 'doz': ('piece', 12),
+    'bag': ('bag', 1), 'bags': ('bag', 1), 'sack': ('bag', 1), 'sacks': ('bag', 1),
+    'crate': ('crate', 1), 'crates': ('crate', 1),
+    'box': ('box', 1), 'boxes': ('box', 1),
+    'bunch': ('bunch', 1), 'bunches': ('bunch', 1),
+}
+# Unit assumed by a quantity range filter that does not name one
+DEFAULT_UNIT = 'kg'
+BACKFILL_BATCH_SIZE = 10000
+
+# "1,200", "2.5", "40" or ".5" (a leading dot only where it cannot be part of a word, as in "Rs.5")
+NUMBER = r'(?:\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+\.\d+|\d+|(?<![\w.])\.\d+)'
+# the first number in the text, then optionally "x <number>" (packs: "2 x 50kg bags") or
+# "- <number>" / "to <number>" (a range: "10-20 kg"), then optionally a unit word
+QUANTITY_RE = re.compile(rf'(?P<amount>{NUMBER})'
+                         rf'(?:\s*[x×*]\s*(?P<each>{NUMBER})|\s*(?:-|–|to)\s*(?P<upper>{NUMBER}))?'
+                         r'\s*(?P<unit>[a-z]+)?', re.IGNORECASE)
+
+
+def to_number(text):
+    return float(text.replace(',', ''))
+
+
+def unit_of(name):
+    """(canonical unit, multiplier) for a unit spelling, or (None, None) if unknown"""
+    return UNITS.get((name or '').strip().lower(), (None, None))
+
+
+def parse_quantity(text):
+    """Normalize free-text quantity into (amount, unit).
+
+    "500 g" -> (0.5, 'kg'), "2 dozen" -> (24.0, 'piece'), ".5 kg" -> (0.5, 'kg').
+    A range keeps its lower end in the unit written after it ("10-20 kg" ->
+    (10.0, 'kg')), and packs are multiplied out ("2 x 50kg bags" -> (100.0, 'kg')).
+    A number without a known unit keeps its amount with unit None; text
+    without a number gives (None, None).
+    """
+    match = QUANTITY_RE.search(text or '')
+    if match is None:
+        return None, None
+    amount = to_number(match['amount'])
+    if match['each'] is not None:
+        amount *= to_number(match['each'])
+    unit, factor = unit_of(match['unit'])
+    if unit is None:
+        return amount, None
+    return round(amount * factor, 6), unit
+
+
+def derive_on_write(model):
+    """Keep quantityAmount/quantityUnit in step with quantity on every ORM insert and edit"""
+    def derive(mapper, connection, target):
+        target.quantityAmount, target.quantityUnit = parse_quantity(target.quantity)
+
+    def rederive(mapper, connection, target):
+        if inspect(target).attrs.quantity.history.has_changes():
+            derive(mapper, connection, target)
+    event.listen(model, 'before_insert', derive)
+    event.listen(model, 'before_update', rederive)
+
+
+def derive_row(row):
+    """Fill the parsed quantity columns of an import row that does not carry them"""
+    if row.get('quantityAmount') in (None, '') and row.get('quantityUnit') in (None, ''):
+        row['quantityAmount'], row['quantityUnit'] = parse_quantity(row.get('quantity'))
+    return row
+
+
+def backfill(engine, table, batch_size=BACKFILL_BATCH_SIZE):
+    """Parse the quantity of every stored product into the typed columns.
+
+    Walks the table in primary-key order, batch_size rows per transaction,
+    and writes the parsed values back with one executemany per batch.
+    Returns (rows scanned, rows parsed).
+    """
+    pk = list(table.primary_key.columns)[0]
+    stmt = (update(table).where(pk == bindparam('_pk'))
+            .values(quantityAmount=bindparam('_amount'), quantityUnit=bindparam('_unit')))
+    scanned = parsed = 0
+    after = None
+    while True:
+        query = select(pk, table.c.quantity).where(table.c.quantity.isnot(None)).order_by(pk).limit(batch_size)
+        if after is not None:
+            query = query.where(pk > after)
+        with engine.begin() as conn:
+            rows = conn.execute(query).all()
+            if not rows:
+                return scanned, parsed
+            params = []
+            for key, text in rows:
+                amount, unit = parse_quantity(text)
+                if amount is not None:
+                    params.append({'_pk': key, '_amount': amount, '_unit': unit})
+            if params:
+                conn.execute(stmt, params)
+        scanned += len(rows)
+        parsed += len(params)
+        after = rows[-1][0]
+
+
+def install(engine, table):
+    """Add the quantityAmount/quantityUnit columns and their index to an existing products table.
+
+    Rows written before the columns existed are backfilled once, when the
+    columns are added; later writes are parsed by derive_on_write() and the
+    bulk importer.
+    """
+    columns = {c['name'] for c in inspect(engine).get_columns(table.name)}
+    added = [c for c in (table.c.quantityAmount, table.c.quantityUnit) if c.name not in columns]
+    with engine.begin() as conn:
+        for column in added:
+            conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" '
+                                 f'{column.type.compile(engine.dialect)}')
+        # only our own index: SQLite would build one over a column added later as a string literal
+        for index in table.indexes:
+            if any(c.name in ('quantityAmount', 'quantityUnit') for c in index.columns):
+                index.create(conn, checkfirst=True)
+    if added:
+        return backfill(engine, table)
+    return 0, 0
+
@@ -0,0 +1,72 @@
+from itertools import count
+
+
+class IdAllocator:
+    """Hands out increasing ids in O(1); ids are never reused"""
+
+    def __init__(self, start=1):
+        self._ids = count(start)
+        self.last = start - 1
+
+    def next_id(self):
+        self.last = next(self._ids)
+        return self.last
+
+    def advance_to(self, last):
+        """Make sure the next id is past `last` (used when loading stored rows)"""
+        if last > self.last:
+            self._ids = count(last + 1)
+            self.last = last
+
+
+class Record:
+    """Fixed-field record stored in __slots__ instead of a per-row dict.
+
+    Templates read fields as attributes (p.productname), and get() keeps the
+    record usable where code expects a dict.
+    """
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def update(self, fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+class User(Record):
+    __slots__ = ('id', 'username', 'email', 'password')
+
+
+class Product(Record):
+    __slots__ = ('pid', 'username', 'email', 'productname', 'productdesc', 'price',
+                 'category', 'quantity', 'quantityAmount', 'quantityUnit', 'basePrice', 'auctionStartTime', 'auctionEndTime',
+                 'auctionClosed', 'auctionWinner', 'auctionPrice', 'image', 'available', 'created_at')
+
+
+class Farmer(Record):
+    __slots__ = ('rid', 'farmername', 'adharnumber', 'age', 'gender', 'phonenumber',
+                 'address', 'farming')
+
+
+class Trig(Record):
+    __slots__ = ('id', 'fid', 'action', 'timestamp')
+
+
+def to_int(value):
+    """Parse a numeric form field, returning None when it is blank or invalid"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,80 @@
+import re
+
+from sqlalchemy import column, table, text
+
+from catalog import encode_cursor
+
+# FTS5 index over the product name and description. It is an external
+# content table, so the text is stored once in addagroproducts and the
+# triggers below only maintain the inverted index.
+FTS_TABLE = 'addagroproducts_fts'
+
+FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        productname, productdesc,
+        content='addagroproducts', content_rowid='pid',
+        tokenize='porter unicode61')""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON addagroproducts BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, productname, productdesc)
+        VALUES (new.pid, new.productname, new.productdesc);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON addagroproducts BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, productname, productdesc)
+        VALUES ('delete', old.pid, old.productname, old.productdesc);
+    END""",
+    # Only text edits touch the index; toggle_availability leaves it alone
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF productname, productdesc ON addagroproducts BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, productname, productdesc)
+        VALUES ('delete', old.pid, old.productname, old.productdesc);
+        INSERT INTO {FTS_TABLE}(rowid, productname, productdesc)
+        VALUES (new.pid, new.productname, new.productdesc);
+    END""",
+]
+
+# bm25() column weights: a hit in the product name counts more than one in the description
+RANK = f'bm25({FTS_TABLE}, 10.0, 1.0)'
+
+fts = table(FTS_TABLE, column('rowid'))
+
+
+def install(engine):
+    """Create the FTS table and its sync triggers if they are missing"""
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"),
+            {'name': FTS_TABLE}).first()
+        for statement in FTS_DDL:
+            conn.execute(text(statement))
+        if not exists:
+            # index the rows written before search existed
+            conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+
+
+def match_expression(q):
+    """Turn free text into a safe FTS5 query: every word must match, the last as a prefix"""
+    words = re.findall(r'\w+', q or '')
+    if not words:
+        return None
+    terms = ['"%s"' % w for w in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def search_page(query, model, q, offset, limit):
+    """Run a BM25-ranked search over a product query, one page at a time.
+
+    Relevance order has no stable key to seek on, so pages are offsets; the
+    offset is still handed out as an opaque cursor like the catalog's.
+    """
+    expression = match_expression(q)
+    if expression is None:
+        return [], None
+    rows = (query.join(fts, fts.c.rowid == model.pid)
+            .filter(text(f'{FTS_TABLE} MATCH :match')).params(match=expression)
+            .order_by(text(RANK), model.pid)
+            .offset(offset).limit(limit + 1).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(offset + limit)
+    return rows, next_cursor
@@ -0,0 +1,96 @@
+"""Boot an in-memory SQLite database from a prebuilt snapshot file.
+
+Creating every table, index and FTS trigger and inserting the seed rows
+costs each cold start several milliseconds per statement. Instead the
+first boot saves the finished database to a file, and later boots copy
+that file into memory page by page with the SQLite backup API, which is
+a single memcpy-like pass no matter how many objects the schema has.
+The snapshot carries a fingerprint of the schema in PRAGMA user_version;
+when the models change it is rebuilt rather than restored.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+log = logging.getLogger(__name__)
+
+
+def schema_version(metadata, engine, extra=()):
+    """Stable 31-bit fingerprint of the schema the models (plus `extra` DDL) would create.
+
+    Stored as the snapshot's PRAGMA user_version, so a snapshot built for
+    older models is never restored into newer ones.
+    """
+    statements = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=engine.dialect)))
+        statements.extend(str(CreateIndex(index).compile(dialect=engine.dialect))
+                          for index in sorted(table.indexes, key=lambda i: i.name))
+    statements.extend(extra)
+    digest = hashlib.sha256('\n'.join(statements).encode()).digest()
+    return int.from_bytes(digest[:4], 'big') & 0x7fffffff
+
+
+def save(engine, path, version):
+    """Copy the live database into a snapshot file with the SQLite backup API"""
+    tmp = path + '.tmp'
+    target = sqlite3.connect(tmp)
+    conn = engine.raw_connection()
+    try:
+        conn.driver_connection.backup(target)
+        target.execute(f'PRAGMA user_version={int(version)}')
+        target.commit()
+    finally:
+        conn.close()
+        target.close()
+    os.replace(tmp, path)
+
+
+def restore(engine, path, version):
+    """Load a snapshot into the live database page by page; False if it is missing or stale"""
+    try:
+        source = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    except sqlite3.Error:
+        return False
+    try:
+        found, = source.execute('PRAGMA user_version').fetchone()
+        if found != version:
+            log.warning('snapshot %s is for another schema (%s, want %s); rebuilding', path, found, version)
+            return False
+        conn = engine.raw_connection()
+        try:
+            source.backup(conn.driver_connection)
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+    finally:
+        source.close()
+
+
+def boot(engine, path, version, init):
+    """Restore the database from `path`, or build it with `init()` and save the snapshot.
+
+    Returns a report: how the database was built, how long it took, and
+    the snapshot size. A snapshot that cannot be written (read-only
+    filesystem) only costs the next boot the slow path again.
+    """
+    start = time.perf_counter()
+    source = 'snapshot'
+    if not (path and os.path.exists(path) and restore(engine, path, version)):
+        source = 'ddl'
+        init()
+        if path:
+            try:
+                save(engine, path, version)
+            except (OSError, sqlite3.Error):
+                log.info('could not write snapshot %s', path)
+    report = {'source': source, 'ms': round((time.perf_counter() - start) * 1e3, 2),
+              'snapshot': path, 'bytes': os.path.getsize(path) if path and os.path.exists(path) else None}
+    log.info('database booted from %(source)s in %(ms)s ms', report)
+    return report
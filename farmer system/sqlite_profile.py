@@ -0,0 +1,100 @@
+import sqlite3
+
+from sqlalchemy import event
+
+# Connection settings for the SQLAlchemy apps, picked with SQLITE_PROFILE.
+# "default" is SQLite's own behaviour: rollback journal, a full fsync on
+# every commit and "database is locked" as soon as two writers overlap.
+PROFILES = {
+    'default': {
+        'pragmas': {},
+        'pool': {},
+    },
+    'production': {
+        'pragmas': {
+            # readers no longer block the writer or each other
+            'journal_mode': 'WAL',
+            # fsync at checkpoints instead of every commit; still safe in WAL
+            'synchronous': 'NORMAL',
+            # wait up to 5s for a lock instead of failing right away
+            'busy_timeout': 5000,
+            # read the database through a 256 MiB memory map
+            'mmap_size': 256 * 1024 * 1024,
+            # 64 MiB page cache per connection (negative means KiB)
+            'cache_size': -64 * 1024,
+            'temp_store': 'MEMORY',
+        },
+        'pool': {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+            'pool_pre_ping': False,
+        },
+    },
+}
+
+
+# keeper connection per shared in-memory database: the database lives as long as one connection does
+_keepers = {}
+
+
+def shared_memory_uri(name):
+    """URI of an in-memory database shared by every pooled connection of the process.
+
+    sqlite:///:memory: is a private database per connection, so it only
+    works on a single connection (StaticPool) that every thread then uses
+    at once. The memdb VFS gives each pooled connection its own handle on
+    one database, with the same locking and busy timeout as a file.
+    """
+    return f'sqlite:///file:/{name}?vfs=memdb&uri=true'
+
+
+def is_shared_memory(uri):
+    return 'vfs=memdb' in uri
+
+
+def is_memory(uri):
+    return uri in ('sqlite://', 'sqlite:///:memory:') or 'mode=memory' in uri or is_shared_memory(uri)
+
+
+def engine_options(uri, profile='production'):
+    """SQLALCHEMY_ENGINE_OPTIONS for a profile.
+
+    Pool sizing applies to file and shared in-memory databases; a private
+    in-memory database has one StaticPool connection and rejects
+    QueuePool arguments.
+    """
+    if not uri.startswith('sqlite') or (is_memory(uri) and not is_shared_memory(uri)):
+        return {}
+    return dict(PROFILES[profile]['pool'])
+
+
+def keep_alive(engine):
+    """Hold a connection to a shared in-memory database for the life of the process.
+
+    Without it the database is dropped whenever the pool happens to have
+    closed all of its connections, e.g. after invalidating one on an error.
+    """
+    name = engine.url.database
+    if name not in _keepers:
+        _keepers[name] = sqlite3.connect(f'{name}?vfs=memdb', uri=True, check_same_thread=False)
+
+
+def apply_profile(engine, profile='production'):
+    """Run the profile's PRAGMAs on every new connection of `engine`"""
+    pragmas = dict(PROFILES[profile]['pragmas'])
+    if engine.dialect.name == 'sqlite' and is_shared_memory(str(engine.url)):
+        keep_alive(engine)
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+    if is_memory(str(engine.url)):
+        # there is no file to journal or map (and memdb has no WAL)
+        for name in ('journal_mode', 'mmap_size'):
+            pragmas.pop(name, None)
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
@@ -0,0 +1,160 @@
+import json
+import os
+import sqlite3
+import threading
+
+# Storage backends for the in-memory api/complete.py store. The dicts in
+# that module stay the hot copy that requests read; every write is passed
+# through to a backend so a new instance can warm-load instead of starting
+# empty. Pick one with FARM_STORAGE:
+#
+#   memory                  keep nothing (the old behaviour)
+#   sqlite:///tmp/farm.db   one row per record in a local SQLite file
+#   log:///tmp/farm.log     append-only NDJSON log, replayed at startup
+
+
+class MemoryBackend:
+    """Backend that persists nothing"""
+
+    def load_all(self):
+        return []
+
+    def save(self, kind, key, fields):
+        pass
+
+    def delete(self, kind, key):
+        pass
+
+    def maybe_compact(self, ratio):
+        return False
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """Write-through to a local SQLite file, one JSON row per record"""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS records (
+            kind TEXT NOT NULL, id INTEGER NOT NULL, data TEXT NOT NULL,
+            PRIMARY KEY (kind, id)) WITHOUT ROWID""")
+
+    def load_all(self):
+        # one sequential scan of the clustered primary key, decoded in bulk
+        cursor = self.conn.execute('SELECT kind, data FROM records ORDER BY kind, id')
+        cursor.arraysize = 10000
+        loads = json.loads
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for kind, data in rows:
+                yield kind, loads(data)
+
+    def save(self, kind, key, fields):
+        data = json.dumps(fields, separators=(',', ':'))
+        with self.lock:
+            self.conn.execute('INSERT OR REPLACE INTO records (kind, id, data) VALUES (?, ?, ?)',
+                              (kind, key, data))
+
+    def delete(self, kind, key):
+        with self.lock:
+            self.conn.execute('DELETE FROM records WHERE kind = ? AND id = ?', (kind, key))
+
+    def maybe_compact(self, ratio):
+        # rows are replaced in place, there is nothing to reclaim
+        return False
+
+    def close(self):
+        self.conn.close()
+
+
+class LogBackend:
+    """Append-only NDJSON log; the last entry for a record wins on replay"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, 'a', encoding='utf-8')
+        # lines in the file, counted by each replay and kept current by writes
+        self.entries = 0
+        self.live = 0
+
+    def _live(self):
+        live = {}
+        entries = 0
+        with open(self.path, encoding='utf-8') as log:
+            for line in log:
+                entries += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a torn final line from a crash mid-write
+                    continue
+                key = (entry['k'], entry['id'])
+                if entry.get('d') is None:
+                    live.pop(key, None)
+                else:
+                    live[key] = entry['d']
+        self.entries = entries
+        return live
+
+    def load_all(self):
+        # ordered like the SQLite backend so pids come back sorted
+        live = self._live()
+        self.live = len(live)
+        return [(kind, fields) for (kind, _), fields in sorted(live.items())]
+
+    def _append(self, entry):
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            self.entries += 1
+
+    def save(self, kind, key, fields):
+        self._append({'k': kind, 'id': key, 'd': fields})
+
+    def delete(self, kind, key):
+        self._append({'k': kind, 'id': key, 'd': None})
+
+    def compact(self):
+        """Rewrite the log with only the live records"""
+        with self.lock:
+            self.file.flush()
+            live = self._live()
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as out:
+                for (kind, key), fields in live.items():
+                    out.write(json.dumps({'k': kind, 'id': key, 'd': fields}, separators=(',', ':')) + '\n')
+            self.file.close()
+            os.replace(tmp, self.path)
+            self.file = open(self.path, 'a', encoding='utf-8')
+            self.entries = self.live = len(live)
+
+    def maybe_compact(self, ratio):
+        """Compact after load_all when more than ratio of the lines are overwritten or deleted"""
+        if not self.entries or 1 - self.live / self.entries <= ratio:
+            return False
+        self.compact()
+        return True
+
+    def close(self):
+        self.file.close()
+
+
+def open_backend(url):
+    """Build a backend from a FARM_STORAGE url"""
+    if not url or url == 'memory':
+        return MemoryBackend()
+    scheme, _, path = url.partition('://')
+    if scheme == 'sqlite':
+        return SQLiteBackend(path)
+    if scheme == 'log':
+        return LogBackend(path)
+    raise ValueError(f'Unknown FARM_STORAGE backend: {url}')
@@ -0,0 +1,53 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# the apps and their helper modules live in the project root
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+API = os.path.join(ROOT, 'api')
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def main(tmp_path_factory):
+    """main.py on a throwaway database file (main.path)"""
+    path = tmp_path_factory.mktemp('main') / 'farmers.db'
+    os.environ['DATABASE_URL'] = f'sqlite:///{path}'
+    os.environ['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+    import main
+    main.path = path
+    return main
+
+
+@pytest.fixture(scope='session')
+def index():
+    """index.py on a fresh in-memory database rather than its snapshot"""
+    os.environ['DB_SNAPSHOT'] = ''
+    os.environ['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1000'
+    import index
+    return index
+
+
+@pytest.fixture(scope='session')
+def complete():
+    """api/complete.py, keeping nothing in storage"""
+    os.environ['FARM_STORAGE'] = 'memory'
+    sys.path.insert(0, API)
+    try:
+        import complete
+    finally:
+        sys.path.remove(API)
+    return complete
+
+
+@pytest.fixture(scope='session')
+def legacy():
+    """api/app.py, loaded under its own name since the root app.py shares it"""
+    spec = importlib.util.spec_from_file_location('legacy_app', os.path.join(API, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    # Flask finds the app's template folder through sys.modules
+    sys.modules['legacy_app'] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,136 @@
+"""Closing auctions: who runs the scheduler and what a closed auction records"""
+import sqlite3
+import threading
+import time
+
+from auction import NOT_STORED, AuctionEngine, AuctionScheduler, OrderBook, bid_status, install
+
+
+def test_close_records_the_highest_stored_bid(main):
+    with main.app.app_context():
+        product = main.Addagroproducts(username='farmer', email='farmer@farm.test', productname='Saffron',
+                                       productdesc='Kashmir', price=500, basePrice=400, category='Spices',
+                                       quantity='1 kg', available=True, auctionEndTime='2020-01-01T10:00')
+        main.db.session.add(product)
+        main.db.session.commit()
+        pid = product.pid
+    # this process took one bid, another worker took a higher one and stored it
+    with main.app.app_context():
+        book = main.auctions.book(pid)
+        book.highest, book.bidder = 450, 'a@farm.test'
+    with main.app.app_context(), main.db.engine.begin() as conn:
+        conn.execute(main.Bid.__table__.insert(), [{'pid': pid, 'bidder': 'b@farm.test', 'amount': 480, 'created_at': 0}])
+
+    assert main.close_expired([pid]) == {pid: ('b@farm.test', 480)}
+    assert main.close_expired([pid]) == {}
+    with main.app.app_context():
+        product = main.db.session.get(main.Addagroproducts, pid)
+        assert (product.auctionWinner, product.auctionPrice, product.available, product.auctionClosed) == \
+            ('b@farm.test', 480, False, True)
+
+
+def test_first_request_starts_the_scheduler(main):
+    main.app.test_client().get('/')
+    assert main.auction_scheduler.running
+
+
+def test_one_scheduler_per_lock(tmp_path):
+    lock = str(tmp_path / 'auctions.lock')
+    first, second = (AuctionScheduler(lambda pids: pids, lambda: []) for _ in range(2))
+    try:
+        assert first.start(lock)
+        assert not second.start(lock)
+        assert not second.running
+    finally:
+        first.stop()
+
+
+def test_lock_holder_closes_auctions_scheduled_elsewhere(tmp_path):
+    lock = str(tmp_path / 'auctions.lock')
+    stored, closed = [], []
+    done = threading.Event()
+
+    def close(pids):
+        closed.extend(pids)
+        done.set()
+        return pids
+
+    holder = AuctionScheduler(close, lambda: list(stored), refresh=0.05)
+    other = AuctionScheduler(close, lambda: list(stored), refresh=0.05)
+    try:
+        assert holder.start(lock)
+        assert not other.start(lock)
+        # another worker stores an auction ending now and schedules it in its idle scheduler
+        stored.append((time.time(), 7))
+        other.schedule(7, stored[0][0])
+        assert other.stats()['scheduled'] == 0
+        assert done.wait(5)
+        assert closed == [7]
+    finally:
+        holder.stop()
+
+
+def test_install_adds_the_auction_columns(main, tmp_path):
+    path = tmp_path / 'old.db'
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE addagroproducts (pid INTEGER PRIMARY KEY, "auctionEndTime" VARCHAR(100))')
+    conn.close()
+    from sqlalchemy import create_engine, inspect
+    engine = create_engine(f'sqlite:///{path}')
+    install(engine, main.Addagroproducts.__table__)
+    columns = {c['name'] for c in inspect(engine).get_columns('addagroproducts')}
+    assert {'auctionClosed', 'auctionWinner', 'auctionPrice'} <= columns
+    engine.dispose()
+
+
+def test_accepted_bid_is_stored_before_the_reply(main):
+    with main.app.app_context():
+        product = main.Addagroproducts(username='farmer', email='farmer@farm.test', productname='Cardamom', productdesc='Green',
+                                       price=300, basePrice=200, category='Spices', available=True,
+                                       auctionEndTime='2099-01-01T10:00')
+        main.db.session.add(product)
+        main.db.session.commit()
+        result = main.auctions.bid(product.pid, 'c@farm.test', 250)
+        assert bid_status(result) == 200
+        stored = main.db.session.query(main.Bid.bidder, main.Bid.amount).filter_by(pid=product.pid).all()
+    assert stored == [('c@farm.test', 250)]
+
+
+def test_bid_that_cannot_be_stored_is_refused():
+    def store(rows):
+        raise OSError('disk full')
+
+    loads = []
+
+    def load(pid):
+        loads.append(pid)
+        return OrderBook(pid, seller='s', base_price=10, ends=2e9)
+
+    engine = AuctionEngine(load, store, clock=lambda: 1e9)
+    result = engine.bid(1, 'b', 20)
+    assert (result.accepted, result.reason, bid_status(result)) == (False, NOT_STORED, 503)
+    # the book is read again from storage, which never had the bid
+    assert engine.book(1).highest is None
+    assert loads == [1, 1]
+    assert engine.stats()['failed'] == 1
+
+
+def test_index_refuses_a_bid_it_cannot_store(index, monkeypatch):
+    with index.app.app_context():
+        index.db.session.add(index.User(username='bidder', email='bidder@farm.test', password=index.hasher.hash('secret')))
+        product = index.Addagroproducts(username='farmer', email='farmer@farm.test', productname='Pepper',
+                                        productdesc='Black', price=300, basePrice=200, category='Spices',
+                                        available=True, auctionEndTime='2099-01-01T10:00')
+        index.db.session.add(product)
+        index.db.session.commit()
+        pid = product.pid
+
+    def store(rows):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(index.auctions, 'store', store)
+    http = index.app.test_client()
+    http.post('/login', data={'email': 'bidder@farm.test', 'password': 'secret'})
+    response = http.post(f'/bid/{pid}', json={'amount': 250})
+    assert response.status_code == 503
+    assert response.get_json()['reason'] == NOT_STORED
@@ -0,0 +1,34 @@
+"""Bulk import: per-row validation of NDJSON and CSV files"""
+import io
+
+from bulk_import import import_file
+
+
+def ndjson(*lines):
+    return io.BytesIO('\n'.join(lines).encode())
+
+
+def test_non_integral_numbers_are_row_errors(main):
+    stream = ndjson('{"productname": "Wheat", "price": 40}',
+                    '{"productname": "Rice", "price": 52.5}',
+                    '{"productname": "Maize", "price": 30.0}',
+                    '{"productname": "Barley", "price": true}',
+                    '{"productname": "Oats", "price": "12.5"}')
+    with main.app.app_context():
+        report = import_file(main.db.engine, main.Addagroproducts, stream, 'ndjson')
+        stored = dict(main.db.session.query(main.Addagroproducts.productname, main.Addagroproducts.price)
+                      .filter(main.Addagroproducts.productname.in_(['Wheat', 'Rice', 'Maize', 'Barley', 'Oats'])))
+    assert report.to_dict() == {'inserted': 2, 'failed': 3, 'errors': [
+        {'line': 2, 'error': 'price: not an integer'},
+        {'line': 4, 'error': 'price: not an integer'},
+        {'line': 5, 'error': 'price: not an integer'},
+    ]}
+    assert stored == {'Wheat': 40, 'Maize': 30}
+
+
+def test_csv_integers(main):
+    stream = io.BytesIO(b'productname,price,basePrice\nMillet,25,\nSorghum,2.5,20\n')
+    with main.app.app_context():
+        report = import_file(main.db.engine, main.Addagroproducts, stream, 'csv')
+    assert (report.inserted, report.failed) == (1, 1)
+    assert report.errors == [{'line': 3, 'error': 'price: not an integer'}]
@@ -0,0 +1,24 @@
+"""Catalog indexes on a products table created before they existed"""
+import sqlite3
+
+from sqlalchemy import create_engine, inspect
+
+from catalog import install
+
+
+def test_install_adds_the_filter_indexes(main, tmp_path):
+    path = tmp_path / 'old.db'
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE addagroproducts (pid INTEGER PRIMARY KEY, price INTEGER, '
+                     'category VARCHAR(50), available BOOLEAN)')
+    conn.close()
+    engine = create_engine(f'sqlite:///{path}')
+    install(engine, main.Addagroproducts.__table__)
+    install(engine, main.Addagroproducts.__table__)
+    indexes = {i['name'] for i in inspect(engine).get_indexes('addagroproducts')}
+    assert indexes == {'ix_addagroproducts_price', 'ix_addagroproducts_category', 'ix_addagroproducts_available_pid'}
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql('EXPLAIN QUERY PLAN SELECT pid FROM addagroproducts WHERE category = ?',
+                                    ('Fruits',)).all()
+    assert 'ix_addagroproducts_category' in plan[0][-1]
+    engine.dispose()
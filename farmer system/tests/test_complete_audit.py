@@ -0,0 +1,30 @@
+"""api/complete.py's in-memory audit trail"""
+import threading
+
+
+def test_out_of_order_batches_stay_sorted(complete):
+    complete.write_audit([{'fid': '1', 'action': 'PRODUCT INSERTED', 'timestamp': t} for t in (300, 100, 200)])
+    complete.write_audit([{'fid': '2', 'action': 'FARMER INSERTED', 'timestamp': 150}])
+    assert complete.trig_keys == sorted(complete.trig_keys)
+
+
+def test_writes_concurrent_with_archiving(complete, tmp_path):
+    stored = len(complete.trig_keys)
+
+    def write(n):
+        for i in range(200):
+            complete.write_audit([{'fid': str(n), 'action': 'FARMER UPDATED', 'timestamp': 1000 + (i * 7919 + n) % 500}])
+
+    writers = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for thread in writers:
+        thread.start()
+    moved = 0
+    while any(thread.is_alive() for thread in writers):
+        moved += sum(complete.archive_trig(1250, str(tmp_path)).values())
+    for thread in writers:
+        thread.join()
+    moved += sum(complete.archive_trig(1250, str(tmp_path)).values())
+    assert complete.trig_keys == sorted(complete.trig_keys)
+    assert set(complete.trig_db) == {trig_id for _, trig_id in complete.trig_keys}
+    assert all(timestamp >= 1250 for timestamp, _ in complete.trig_keys)
+    assert moved + len(complete.trig_keys) == stored + 4 * 200
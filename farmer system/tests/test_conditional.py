@@ -0,0 +1,108 @@
+"""Page validators: table versions kept in the database, and what else goes into them"""
+import time
+
+import pytest
+from flask import Flask
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+from werkzeug.http import http_date
+
+from conditional import StoredVersions, TableVersions, conditional_get
+from fragment_cache import VersionCounter
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f'sqlite:///{tmp_path / "farm.db"}'
+    metadata = MetaData()
+    products = Table('products', metadata, Column('pid', Integer, primary_key=True), Column('name', String(50)))
+    farmers = Table('farmers', metadata, Column('rid', Integer, primary_key=True), Column('name', String(50)))
+    writer, reader = create_engine(url), create_engine(url)
+    metadata.create_all(writer)
+    StoredVersions(writer, products='products', farmers='farmers').install()
+    yield writer, reader, products, farmers
+    writer.dispose()
+    reader.dispose()
+
+
+def test_every_write_moves_its_table_only(engines):
+    writer, reader, products, farmers = engines
+    versions = StoredVersions(reader, products='products', farmers='farmers')
+    (before,), _ = versions.state('products')
+    with writer.begin() as conn:
+        conn.execute(products.insert(), [{'name': 'Rice'}, {'name': 'Wheat'}])
+        conn.execute(products.update().where(products.c.name == 'Rice').values(name='Basmati'))
+        conn.execute(products.delete().where(products.c.name == 'Wheat'))
+    (after, farmers_seq), modified = versions.state('products', 'farmers')
+    assert after == before + 4
+    assert farmers_seq == 0
+    assert modified > 0
+
+
+def test_rolled_back_write_keeps_the_version(engines):
+    writer, reader, products, _ = engines
+    versions = StoredVersions(reader, products='products')
+    state = versions.state('products')
+    with writer.connect() as conn:
+        conn.execute(products.insert(), {'name': 'Maize'})
+        conn.rollback()
+    assert versions.state('products') == state
+
+
+def test_scope_is_part_of_the_state(engines):
+    _, reader, _, _ = engines
+    assert StoredVersions(reader, 'boot-a', products='products').state('products')[0] == ('boot-a', 0)
+
+
+def test_install_is_idempotent(engines):
+    writer, reader, products, _ = engines
+    with writer.begin() as conn:
+        conn.execute(products.insert(), {'name': 'Millet'})
+    StoredVersions(writer, products='products', farmers='farmers').install()
+    assert StoredVersions(reader, products='products').state('products')[0] == (1,)
+
+
+@pytest.fixture
+def page():
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    versions, images = TableVersions('products'), VersionCounter()
+
+    @app.route('/products')
+    @conditional_get(versions, 'products', counters=(images,))
+    def products():
+        return 'products'
+
+    @app.route('/stats')
+    @conditional_get(versions, 'products', per_user=False)
+    def stats():
+        return 'stats'
+
+    return app, images
+
+
+def test_rendered_images_and_a_new_build_change_the_etag(page):
+    app, images = page
+    http = app.test_client()
+    etag = http.get('/products').headers['ETag']
+    assert http.get('/products', headers={'If-None-Match': etag}).status_code == 304
+    images.bump()
+    response = http.get('/products', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    _, built = app.extensions['build_version']
+    app.extensions['build_version'] = ('redeployed', built)
+    assert http.get('/products', headers={'If-None-Match': etag}).status_code == 200
+
+
+def test_if_modified_since_only_on_shared_pages(page):
+    app, _ = page
+    http = app.test_client()
+    since = {'If-Modified-Since': http_date(time.time() + 60)}
+    assert 'Last-Modified' not in http.get('/products').headers
+    assert http.get('/products', headers=since).status_code == 200
+    assert http.get('/stats', headers=since).status_code == 304
+
+
+def test_anonymous_client_is_sent_to_login_not_a_304(complete):
+    response = complete.app.test_client().get('/myproducts', headers={'If-None-Match': '*'})
+    assert response.status_code == 302
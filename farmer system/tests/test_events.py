@@ -0,0 +1,86 @@
+"""Live product events: the broadcaster and where subscribers are served"""
+import socket
+import threading
+
+from flask import Flask, render_template_string
+from sqlalchemy import create_engine
+
+import events
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def make_app(**config):
+    app = Flask(__name__)
+    app.config.update(config)
+    broadcaster = events.Broadcaster(queue_size=2)
+    server = events.init_app(app, broadcaster)
+    app.add_url_rule('/', 'page', lambda: render_template_string('{{ events_url() }}'))
+    return app, broadcaster, server
+
+
+def test_slow_subscriber_is_dropped_and_counted():
+    broadcaster = events.Broadcaster(queue_size=2)
+    sub = broadcaster.subscribe(lambda: None)
+    for n in range(3):
+        broadcaster.publish('price', pid=1, amount=n)
+    assert sub.closed
+    assert broadcaster.stats() == {'subscribers': 0, 'published': 3, 'dropped': 1}
+
+
+def test_same_origin_route_is_the_default():
+    app, _, server = make_app()
+    assert app.test_client().get('/').text == '/events'
+    assert server.stats()['port'] is None
+
+
+def test_asyncio_server_is_opt_in_on_localhost():
+    port = free_port()
+    app, broadcaster, server = make_app(EVENTS_PORT=str(port))
+    # a proxy forwards the page's own /events to it
+    assert app.test_client().get('/').text == '/events'
+    with socket.create_connection(('127.0.0.1', port), timeout=5) as sock:
+        sock.sendall(b'GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        head = b''
+        while b'retry: 3000' not in head:
+            head += sock.recv(4096)
+        broadcaster.publish('availability', pid=7, available=False)
+        body = b''
+        while b'\n\n' not in body:
+            body += sock.recv(4096)
+    assert head.startswith(b'HTTP/1.1 200 OK')
+    assert body == b'id: 1\nevent: availability\ndata: {"pid":7,"available":false}\n\n'
+    assert server.stats()['port'] == port
+
+
+def test_shared_broadcaster_relays_every_process(tmp_path):
+    url = f'sqlite:///{tmp_path / "farm.db"}'
+    workers = [events.SharedBroadcaster(create_engine(url), interval=0.05) for _ in range(2)]
+    workers[0].install()
+    for worker in workers:
+        worker.start()
+    received = [threading.Event() for _ in workers]
+    subs = [worker.subscribe(ready.set) for worker, ready in zip(workers, received)]
+    workers[0].publish('price', pid=3, price=120, bids=1)
+    assert all(ready.wait(5) for ready in received)
+    # numbered by the stored row, so Last-Event-ID means the same event on every worker
+    assert [sub.drain() for sub in subs] == [[(1, 'price', '{"pid":3,"price":120,"bids":1}')]] * 2
+
+
+def test_wsgi_fallback_is_capped():
+    app, broadcaster, server = make_app(EVENTS_PORT='off', EVENTS_WSGI_STREAMS=1)
+    http = app.test_client()
+    assert http.get('/').text == '/events'
+    first = http.get('/events', buffered=False)
+    assert first.status_code == 200
+    second = http.get('/events', buffered=False)
+    assert second.status_code == 503
+    first.close()
+    third = http.get('/events', buffered=False)
+    assert third.status_code == 200
+    third.close()
+    assert server.stats()['wsgi_streams'] == 0
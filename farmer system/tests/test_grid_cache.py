@@ -0,0 +1,23 @@
+"""main.py's cached product grid against writes made outside the process"""
+import sqlite3
+
+
+def add_product(path, name):
+    """A write from another worker or a CLI command: same database file, different connection"""
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO addagroproducts (username, email, productname, productdesc, price, category, quantity, available) "
+                     "VALUES ('farmer', 'farmer@farm.test', ?, 'Fresh', 100, 'Grains', '5 kg', 1)", (name,))
+    conn.close()
+
+
+def test_grid_sees_writes_from_other_processes(main):
+    http = main.app.test_client()
+    add_product(main.path, 'Basmati Rice')
+    assert b'Basmati Rice' in http.get('/agroproducts').data
+    hits = main.grid_cache.hits
+    assert b'Basmati Rice' in http.get('/agroproducts').data
+    assert main.grid_cache.hits == hits + 1
+
+    add_product(main.path, 'Pearl Millet')
+    page = http.get('/agroproducts').data
+    assert b'Pearl Millet' in page and b'Basmati Rice' in page
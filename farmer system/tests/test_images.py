@@ -0,0 +1,83 @@
+"""Image derivatives rendered in worker processes, and uploads"""
+import io
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+import images
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+pytestmark = pytest.mark.skipif(images.Image is None, reason='Pillow is not installed')
+
+
+def png(width=700, height=350):
+    data = io.BytesIO()
+    images.Image.new('RGB', (width, height), 'green').save(data, 'PNG')
+    return data.getvalue()
+
+
+def test_worker_does_not_rerun_the_app_script(tmp_path):
+    (tmp_path / 'static' / 'uploads').mkdir(parents=True)
+    (tmp_path / 'static' / 'uploads' / 'field.png').write_bytes(png())
+    marker = tmp_path / 'imports'
+    script = tmp_path / 'app_script.py'
+    script.write_text(textwrap.dedent(f'''
+        # stands in for main.py / index.py: setup that must run once per app
+        with open({str(marker)!r}, 'a') as f:
+            f.write('imported\\n')
+        import images
+        if __name__ == '__main__':
+            pipeline = images.ImagePipeline({str(tmp_path / 'static')!r}, workers=1)
+            print([(w, h) for w, h, webp, jpeg in pipeline.submit('uploads/field.png').result()['sizes']])
+            pipeline.close()
+    '''))
+    done = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, timeout=120,
+                          env=dict(os.environ, PYTHONPATH=ROOT))
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.strip() == '[(320, 160), (640, 320), (700, 350)]'
+    assert marker.read_text() == 'imported\n'
+
+
+def test_pipeline_serves_the_srcset_once_rendered(tmp_path):
+    pipeline = images.ImagePipeline(str(tmp_path), workers=1)
+    url = pipeline.save_upload(FileStorage(io.BytesIO(png()), filename='crop.png'))
+    assert url.startswith('/static/uploads/') and url.endswith('.png')
+    assert pipeline.srcset(url) is None
+    pipeline.close()
+    assert pipeline.stats()['rendered'] == 1
+    assert '640w' in pipeline.srcset(url)['webp']
+
+
+def test_request_thread_never_hashes_and_the_table_is_bounded(tmp_path, monkeypatch):
+    (tmp_path / 'images').mkdir()
+    for name in ('a', 'b', 'c'):
+        (tmp_path / 'images' / f'{name}.png').write_bytes(png(width=100 + ord(name)))
+    hashed_on = []
+    content_key = images.content_key
+    monkeypatch.setattr(images, 'content_key', lambda data: hashed_on.append(threading.current_thread().name)
+                        or content_key(data))
+    ready = []
+    pipeline = images.ImagePipeline(str(tmp_path), workers=1, on_ready=lambda: ready.append(1), max_images=2)
+    urls = [f'/static/images/{name}.png' for name in ('a', 'b', 'c')]
+    assert [pipeline.srcset(url) for url in urls] == [None] * 3
+    pipeline.close()
+    assert len(hashed_on) == 3 and all(name.startswith('image-render') for name in hashed_on)
+    assert len(ready) == 3
+    assert pipeline.stats()['images'] == 2
+    # the two most recent are answered from memory, the first is prepared again
+    assert pipeline.srcset(urls[2]) is not None and pipeline.srcset(urls[1]) is not None
+    assert pipeline.srcset(urls[0]) is None
+    pipeline.close()
+    assert pipeline.srcset(urls[0]) is not None
+
+
+def test_upload_to_a_read_only_static_dir_is_skipped(tmp_path):
+    blocker = tmp_path / 'static'
+    blocker.write_text('a read-only bundle: nothing can be created under it')
+    pipeline = images.ImagePipeline(str(blocker))
+    assert pipeline.save_upload(FileStorage(io.BytesIO(png()), filename='crop.png')) is None
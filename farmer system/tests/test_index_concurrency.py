@@ -0,0 +1,57 @@
+"""index.py's in-memory database under concurrent requests and background writers"""
+import threading
+
+import pytest
+
+THREADS = 6
+WRITES = 15
+
+
+@pytest.fixture(scope='module', autouse=True)
+def users(index):
+    with index.app.app_context():
+        for n in range(THREADS):
+            index.db.session.add(index.User(username=f'user{n}', email=f'user{n}@farm.test',
+                                            password=index.hasher.hash('secret')))
+        index.db.session.commit()
+
+
+def test_concurrent_writes_share_one_database(index):
+    with index.app.app_context():
+        farmers = index.Register.query.count()
+        products = index.Addagroproducts.query.count()
+    failures = []
+
+    def client(n):
+        http = index.app.test_client()
+        http.post('/login', data={'email': f'user{n}@farm.test', 'password': 'secret'})
+        for i in range(WRITES):
+            responses = [
+                http.post('/register', data={'farmername': f'F{n}-{i}', 'age': '30', 'farmingtype': 'Organic Farming'}),
+                http.post('/addagroproduct', data={'productname': f'P{n}-{i}', 'email': f'user{n}@farm.test',
+                                                   'price': '100', 'quantity': '5 kg', 'available': 'on'}),
+                http.get('/farmerdetails'),
+                http.get('/agroproducts?format=json'),
+            ]
+            failures.extend(r.status_code for r in responses if r.status_code >= 500)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    index.audit_log.flush()
+
+    assert failures == []
+    with index.app.app_context():
+        assert index.Register.query.count() == farmers + THREADS * WRITES
+        assert index.Addagroproducts.query.count() == products + THREADS * WRITES
+        # the audit thread wrote into the same database the requests did
+        assert index.Trig.query.filter(index.Trig.action.like('% INSERTED')).count() >= 2 * THREADS * WRITES
+
+
+def test_database_survives_pool_reset(index):
+    """Dropping every pooled connection must not hand out a new, empty database"""
+    with index.app.app_context():
+        index.db.engine.dispose()
+        assert index.Farming.query.count() >= 4
@@ -0,0 +1,62 @@
+"""Where precompiled templates come from"""
+from flask import Flask, render_template
+
+import jinja_cache
+
+
+def app_with_cache_dir(directory, modules='off', templates=jinja_cache.TEMPLATES):
+    app = Flask(__name__, template_folder=templates)
+    app.add_template_filter(jinja_cache.format_epoch, 'epoch')
+    app.config.update(JINJA_CACHE_DIR=str(directory), JINJA_MODULES_DIR=str(modules))
+    return app
+
+
+def test_precompiled_directory_is_used(tmp_path):
+    names = jinja_cache.precompile(str(tmp_path))
+    app = app_with_cache_dir(tmp_path)
+    cache = jinja_cache.init_app(app).bytecode
+    assert cache.directory == str(tmp_path)
+    app.jinja_env.get_template(names[0])
+    assert cache.stats()['hits'] == 1
+
+
+def test_unwritable_directory_falls_back_to_tmp(tmp_path, monkeypatch):
+    monkeypatch.setattr(jinja_cache, 'FALLBACK_DIR', str(tmp_path / 'fallback'))
+    blocker = tmp_path / 'bundle'
+    blocker.write_text('a read-only bundle: nothing can be created under it')
+    cache = jinja_cache.init_app(app_with_cache_dir(blocker / '.jinja-cache')).bytecode
+    assert cache.directory == str(tmp_path / 'fallback')
+
+
+def test_shipped_modules_match_the_templates():
+    """Run `python jinja_cache.py` and commit compiled_templates/ after editing a template"""
+    manifest = jinja_cache.read_manifest(jinja_cache.COMPILED_DIR)
+    assert manifest is not None
+    app = app_with_cache_dir('off', jinja_cache.COMPILED_DIR)
+    modules = jinja_cache.init_app(app).modules
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+    assert modules.stats()['stale'] == 0
+    assert modules.stats()['loaded'] == len(app.jinja_env.list_templates()) == len(manifest['templates'])
+
+
+def test_module_renders_like_the_source_and_an_edit_falls_back(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    (templates / 'base.html').write_text('<p>{% block body %}{% endblock %}</p>')
+    (templates / 'page.html').write_text('{% extends "base.html" %}{% block body %}{{ name }}{% endblock %}')
+    jinja_cache.compile_modules(str(tmp_path / 'compiled'), str(templates))
+
+    def render(modules):
+        app = app_with_cache_dir('off', modules, str(templates))
+        cache = jinja_cache.init_app(app)
+        with app.test_request_context():
+            return render_template('page.html', name='<Rice>'), cache and cache.modules.stats()
+
+    expected, _ = render('off')
+    assert expected == '<p>&lt;Rice&gt;</p>'
+    assert render(tmp_path / 'compiled') == (expected, {'directory': str(tmp_path / 'compiled'), 'loaded': 2, 'stale': 0})
+    (templates / 'page.html').write_text('{% extends "base.html" %}{% block body %}edited {{ name }}{% endblock %}')
+    html, stats = render(tmp_path / 'compiled')
+    assert html == '<p>edited &lt;Rice&gt;</p>'
+    assert (stats['loaded'], stats['stale']) == (1, 1)
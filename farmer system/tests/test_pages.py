@@ -0,0 +1,12 @@
+"""Pages every entry point renders from the shared templates"""
+import pytest
+
+APPS = ['main', 'index', 'complete', 'legacy']
+
+
+@pytest.mark.parametrize('name', APPS)
+def test_agroproducts_renders(name, request):
+    app = request.getfixturevalue(name).app
+    response = app.test_client().get('/agroproducts')
+    assert response.status_code == 200
+    assert b'No products available yet' in response.data or b'product-card' in response.data
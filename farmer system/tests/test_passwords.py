@@ -0,0 +1,39 @@
+"""PasswordHasher: the concurrency cap and upgrades at login"""
+import threading
+import time
+
+from passwords import PasswordHasher
+
+FAST = 'pbkdf2:sha256:1000'
+
+
+def test_at_most_workers_hashes_at_once():
+    hasher = PasswordHasher(FAST, workers=2)
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def kdf():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+
+    threads = [threading.Thread(target=hasher._run, args=(kdf,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+
+
+def test_plaintext_and_old_hashes_are_upgraded():
+    hasher = PasswordHasher(FAST)
+    assert hasher.verify('secret', 'secret')[0]
+    assert hasher.verify('secret', 'secret')[1].startswith(FAST + '$')
+    old = PasswordHasher('pbkdf2:sha256:500').hash('secret')
+    ok, new_hash = hasher.verify(old, 'secret')
+    assert ok and new_hash.startswith(FAST + '$')
+    assert hasher.verify(new_hash, 'secret') == (True, None)
+    assert hasher.verify(new_hash, 'wrong') == (False, None)
+    assert hasher.verify(None, 'secret') == (False, None)
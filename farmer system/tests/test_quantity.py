@@ -0,0 +1,35 @@
+"""Free-text quantities parsed into (amount, unit)"""
+import pytest
+
+from quantity import parse_quantity
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('50 kg', (50.0, 'kg')),
+    ('2.5kg', (2.5, 'kg')),
+    ('500 g', (0.5, 'kg')),
+    ('1,200 pieces', (1200.0, 'piece')),
+    ('2 dozen', (24.0, 'piece')),
+    ('10 tons', (10000.0, 'kg')),
+    ('3 litres', (3.0, 'l')),
+    # a leading-dot decimal
+    ('.5 kg', (0.5, 'kg')),
+    ('about .25 l', (0.25, 'l')),
+    # a range: its lower end, in the unit written after it
+    ('10-20 kg', (10.0, 'kg')),
+    ('10 – 20 kg', (10.0, 'kg')),
+    ('10 to 20 quintals', (1000.0, 'kg')),
+    ('10kg-20kg', (10.0, 'kg')),
+    # packs: count times the size of one
+    ('2 x 50kg bags', (100.0, 'kg')),
+    ('4 × 250 g', (1.0, 'kg')),
+    ('6x1 l', (6.0, 'l')),
+    # no known unit, no number
+    ('50', (50.0, None)),
+    ('Rs.5 per kg', (5.0, None)),
+    ('fresh', (None, None)),
+    ('', (None, None)),
+    (None, (None, None)),
+])
+def test_parse_quantity(text, expected):
+    assert parse_quantity(text) == expected
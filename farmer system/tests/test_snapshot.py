@@ -0,0 +1,15 @@
+"""index.py's boot snapshot built with data imported in the same command"""
+import sqlite3
+
+
+def test_build_snapshot_keeps_imported_rows(index, tmp_path):
+    source = tmp_path / 'farmers.csv'
+    source.write_text('farmername,age,farming\nSnapshot Asha,41,Organic Farming\nSnapshot Ravi,37,Dairy Farming\n')
+    path = tmp_path / 'snapshot.db'
+    result = index.app.test_cli_runner().invoke(args=['build-snapshot', str(path), '--import', 'farmers', str(source)])
+    assert result.exit_code == 0, result.output
+    with sqlite3.connect(path) as conn:
+        names = [name for name, in conn.execute("SELECT farmername FROM register WHERE farmername LIKE 'Snapshot %' "
+                                                "ORDER BY farmername")]
+    conn.close()
+    assert names == ['Snapshot Asha', 'Snapshot Ravi']
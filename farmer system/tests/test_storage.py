@@ -0,0 +1,41 @@
+"""Startup compaction of the log storage backend"""
+from storage import LogBackend
+
+
+def reopen(path):
+    backend = LogBackend(str(path))
+    records = backend.load_all()
+    return backend, records
+
+
+def test_compacts_once_garbage_passes_the_ratio(tmp_path):
+    path = tmp_path / 'farm.log'
+    backend = LogBackend(str(path))
+    for price in range(10):
+        backend.save('products', 1, {'pid': 1, 'price': price})
+    backend.save('products', 2, {'pid': 2, 'price': 5})
+    backend.delete('products', 2)
+    backend.close()
+
+    backend, records = reopen(path)
+    assert backend.maybe_compact(0.5)
+    backend.close()
+    assert len(path.read_text().splitlines()) == 1
+    backend, compacted = reopen(path)
+    assert compacted == records == [('products', {'pid': 1, 'price': 9})]
+    assert not backend.maybe_compact(0.5)
+    backend.close()
+
+
+def test_keeps_a_mostly_live_log(tmp_path):
+    path = tmp_path / 'farm.log'
+    backend = LogBackend(str(path))
+    for pid in range(1, 5):
+        backend.save('products', pid, {'pid': pid})
+    backend.save('products', 1, {'pid': 1, 'price': 3})
+    backend.close()
+
+    backend, _ = reopen(path)
+    assert not backend.maybe_compact(0.5)
+    backend.close()
+    assert len(path.read_text().splitlines()) == 5
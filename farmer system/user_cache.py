@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+
+
+class IdentityCache:
+    """Bounded LRU cache with a TTL for objects looked up by primary key.
+
+    Used by the Flask-Login user_loader so an authenticated page view does
+    not cost a SELECT on the user table. maxsize=0 turns caching off.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def invalidate_on_change(model, cache):
+    """Drop a cached row whenever the ORM updates or deletes it"""
+    def drop(mapper, connection, target):
+        cache.invalidate(mapper.primary_key_from_instance(target)[0])
+    event.listen(model, 'after_update', drop)
+    event.listen(model, 'after_delete', drop)
+
+
+def load_cached(session, model, key, cache):
+    """session.get() through the cache.
+
+    Cached objects are expunged so later commits in any request cannot
+    expire them; they are read-only snapshots until invalidated.
+    """
+    obj = cache.get(key)
+    if obj is None:
+        obj = session.get(model, key)
+        if obj is not None and cache.maxsize > 0:
+            session.expunge(obj)
+            cache.put(key, obj)
+    return obj